@@ -0,0 +1,212 @@
+#######################################
+# IMPORTS
+#######################################
+
+import os
+
+import Celeratas.interpreter.constants as constants
+
+from .interpreter.Context import Context
+from .interpreter.Interpreter import Interpreter
+from .interpreter.SymbolTable import SymbolTable
+from .interpreter.values import Module
+from .lexer.Lexer import Lexer
+from .lexer.Scanner import Scanner
+from .lexer.TokenStream import TokenStream
+from .parser import cache
+from .parser.Folder import Folder
+from .parser.Parser import Parser
+from .parser.Pruner import Pruner
+
+#######################################
+# BUILT INS
+#######################################
+
+# Every runtime starts with these in its global symbol table - None of them change, so the runtimes can share them
+
+BUILTINS = {
+    "nil": constants.Number.null,
+    "pi": constants.Number.math_PI,
+    "scribe": constants.BuiltInFunction.print,
+    "initus": constants.BuiltInFunction.input,
+    "purgo": constants.BuiltInFunction.clear,
+    "est_numerus": constants.BuiltInFunction.is_number,
+    "est_filum": constants.BuiltInFunction.is_string,
+    "est_album": constants.BuiltInFunction.is_list,
+    "est_opus": constants.BuiltInFunction.is_function,
+    "adde": constants.BuiltInFunction.append,
+    "remove": constants.BuiltInFunction.pop,
+    "extende": constants.BuiltInFunction.extend,
+    "longitudo": constants.BuiltInFunction.len,
+    "finde": constants.BuiltInFunction.split,
+    "curre": constants.BuiltInFunction.run,
+    "importa": constants.BuiltInFunction.import_,
+}
+
+#######################################
+# BACKENDS
+#######################################
+
+# The interpreter is the reference implementation - Every other backend has to give the same results
+# The other backends are only imported when a program is run with them, so running a script doesn't wait for all of them to load
+
+
+def run_interpreter(node, context):
+    return Interpreter(recursion_depth=0).visit(node, context)
+
+
+def run_closures(node, context):
+    from .closures.ClosureCompiler import ClosureCompiler
+    return ClosureCompiler().run(node, context)
+
+
+def run_vm(node, context):
+    from .bytecode.Compiler import Compiler
+    from .bytecode.VM import VM
+    return VM().run(Compiler().compile_program(node), context)
+
+
+def run_python(node, context):
+    from .transpiler.Transpiler import Transpiler
+    return Transpiler(node.pos_start.fn if node.pos_start else "<program>").run(node, context)
+
+
+BACKENDS = {
+    "interpreter": run_interpreter,
+    "closures": run_closures,
+    "vm": run_vm,
+    "python": run_python,
+}
+
+#######################################
+# LEXERS
+#######################################
+
+# The Lexer is the reference implementation - The Scanner makes the same tokens and errors with one compiled pattern
+
+LEXERS = {
+    "scanner": Scanner,
+    "lexer": Lexer,
+}
+
+#######################################
+# OPTIMIZATION LEVELS
+#######################################
+
+# 0 runs the tree as it was parsed, 1 folds the expressions of literals into literals first (see Folder) and stops loops from
+# keeping values that are never used (see Pruner)
+OPTIMIZE_LEVELS = (0, 1)
+DEFAULT_OPTIMIZE = 1
+
+
+def optimize_tree(node, optimize):
+    if optimize >= 1:
+        node = Pruner().prune(Folder().fold(node))
+    return node
+
+#######################################
+# PARSING
+#######################################
+
+
+def parse_script(fn, text, lexer="scanner", cached=False, optimize=DEFAULT_OPTIMIZE):
+    # Cached is only for when text is what is in the file fn, its tree is then kept in and loaded from __celcache__
+    node = cache.load(fn, optimize) if cached else None
+    if node is not None:
+        return node, None
+
+    # The parser gets the tokens from the lexer as it goes, errors from the lexer still come first
+    ast = Parser(TokenStream(LEXERS[lexer](fn, text))).parse()
+    if ast.error:
+        return None, ast.error
+
+    node = optimize_tree(ast.node, optimize)
+    if cached:
+        cache.store(fn, node, optimize)
+    return node, None
+
+
+def disassemble_script(fn, text, lexer="scanner", cached=False, optimize=DEFAULT_OPTIMIZE):
+    from .bytecode.Compiler import Compiler
+    from .bytecode.disassembler import disassemble
+
+    node, error = parse_script(fn, text, lexer, cached, optimize)
+    if error:
+        return None, error
+
+    return disassemble(Compiler(fn).compile_program(node)), None
+
+#######################################
+# RUNTIME
+#######################################
+
+
+class Runtime:
+    # Owns everything running programs change: the global symbol table and the modules - Runtimes share nothing a program can
+    # change, so separate runtimes can run programs at the same time on different threads. One runtime runs one program at a time
+    def __init__(self, cache=True, optimize=DEFAULT_OPTIMIZE):
+        # Whether scripts read from files keep their trees in __celcache__
+        self.cache = cache
+        # The optimization level every script and module of the runtime is parsed with
+        self.optimize = optimize
+
+        self.global_symbol_table = SymbolTable()
+        for name, value in BUILTINS.items():
+            self.global_symbol_table.set(name, value)
+
+        # Every module that finished running, by the real path of its script - importa() only runs a script the first time
+        self.modules = {}
+        # The real paths of the scripts being imported right now, innermost last, so that an import that goes in a circle is found
+        self.importing = []
+
+    def new_context(self, display_name, symbol_table):
+        # The builtins that run scripts find the runtime through the first context of the program or module
+        context = Context(display_name)
+        context.symbol_table = symbol_table
+        context.runtime = self
+        return context
+
+    def parse_script(self, fn, text, lexer="scanner", cached=False):
+        return parse_script(fn, text, lexer, cached and self.cache, self.optimize)
+
+    def run_script(self, fn, text, backend="interpreter", lexer="scanner", cached=False):
+        # Generate AST
+        node, error = self.parse_script(fn, text, lexer, cached)
+        if error:
+            return None, error
+
+        # Run program
+        context = self.new_context('<program>', self.global_symbol_table)
+        result = BACKENDS[backend](node, context)
+
+        return result.value, result.error
+
+    def stream_script(self, fn, text, backend="interpreter", lexer="scanner"):
+        # Runs each statement of the program as soon as it is parsed, so a huge script is never held as tokens and nodes all at once
+        # Unlike run_script, the statements before an error have already run when it is found, and their results aren't kept
+        context = self.new_context('<program>', self.global_symbol_table)
+
+        parser = Parser(TokenStream(LEXERS[lexer](fn, text)))
+        for ast in parser.iter_statements():
+            if ast.error:
+                return None, ast.error
+
+            result = BACKENDS[backend](optimize_tree(ast.node, self.optimize), context)
+            if result.error:
+                return None, result.error
+
+        return None, None
+
+    def run_module(self, fn, text):
+        # A module runs in a table of its own, it can still see the builtins and the globals of the program through its parent
+        node, error = self.parse_script(fn, text, cached=True)
+        if error:
+            return None, error
+
+        name = os.path.splitext(os.path.basename(fn))[0]
+        context = self.new_context(f'<module {name}>', SymbolTable(self.global_symbol_table))
+        result = run_interpreter(node, context)
+        if result.error:
+            return None, result.error
+
+        return Module(name, context.symbol_table.symbols), None
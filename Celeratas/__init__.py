@@ -1,7 +1,3 @@
-import importlib_metadata
-
-from . import _version
-
 __all__ = (
     "__title__",
     "__summary__",
@@ -15,13 +11,27 @@ __all__ = (
 
 __copyright__ = "Copyright 2022 Finn Mattis"
 
-metadata = importlib_metadata.metadata("Celeratas")
+# Reading the metadata and working out the version (which can run git) are slow, so they are only done the first time they are used
+METADATA_FIELDS = {
+    "__title__": "name",
+    "__summary__": "summary",
+    "__url__": "home-page",
+    "__author__": "author",
+    "__email__": "author-email",
+    "__license__": "license",
+}
+
 
-__title__ = metadata["name"]
-__summary__ = metadata["summary"]
-__url__ = metadata["home-page"]
-__author__ = metadata["author"]
-__email__ = metadata["author-email"]
-__license__ = metadata["license"]
+def __getattr__(name):
+    if name in METADATA_FIELDS:
+        import importlib_metadata
+        value = importlib_metadata.metadata("Celeratas")[METADATA_FIELDS[name]]
+    elif name == "__version__":
+        from . import _version
+        value = _version.get_versions()['version']
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-__version__ = _version.get_versions()['version']
+    # Kept like an attribute set at import, so it is only looked up once
+    globals()[name] = value
+    return value
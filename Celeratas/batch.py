@@ -0,0 +1,133 @@
+#######################################
+# IMPORTS
+#######################################
+
+import argparse
+import contextlib
+import glob
+import io
+import os
+import statistics
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+from .interpreter.values import List
+from .parser import cache
+from .Runtime import (BACKENDS, DEFAULT_OPTIMIZE, LEXERS, OPTIMIZE_LEVELS,
+                      Runtime)
+
+#######################################
+# SCRIPTS
+#######################################
+
+# The files that are run when a folder is given
+SCRIPT_EXTENSIONS = (".cel", ".clr")
+
+
+def find_scripts(patterns):
+    # Every pattern is a script, a folder to search for scripts or a glob - Each script is only run once, in the order it was found
+    scripts = {}
+    for pattern in patterns:
+        for path in sorted(glob.glob(pattern, recursive=True)):
+            if os.path.isdir(path):
+                for fn in sorted(glob.glob(os.path.join(path, "**", "*"), recursive=True)):
+                    if fn.endswith(SCRIPT_EXTENSIONS):
+                        scripts.setdefault(fn, None)
+            else:
+                scripts.setdefault(path, None)
+    return list(scripts)
+
+#######################################
+# WORKERS
+#######################################
+
+
+def run_file(fn, backend="interpreter", lexer="scanner", cached=True, optimize=DEFAULT_OPTIMIZE):
+    # Runs in a worker process, which has already imported everything - Returns the file, its output, its error and how long it took
+    # Every script gets a new runtime, so nothing one script sets is seen by the next one the worker runs
+    start = time.perf_counter()
+    output = io.StringIO()
+
+    try:
+        with open(fn, "r") as f:
+            script = f.read()
+    except (OSError, UnicodeDecodeError):
+        return fn, "", f"Can't open file {fn}", time.perf_counter() - start
+
+    runtime = Runtime(cache=cached, optimize=optimize)
+    runtime.global_symbol_table.set("__args__", List([]))
+    with contextlib.redirect_stdout(output):
+        _, error = runtime.run_script(fn, script, backend, lexer, cached=True)
+
+    return fn, output.getvalue(), error and error.as_string(), time.perf_counter() - start
+
+
+def run_batch(scripts, workers=None, backend="interpreter", lexer="scanner", cached=True, optimize=DEFAULT_OPTIMIZE):
+    # Yields what run_file returns for every script, in the order of scripts
+    # The scripts are handed out in chunks, so thousands of small ones don't each pay for a round trip to a worker
+    workers = workers or os.cpu_count() or 1
+    chunksize = max(1, len(scripts) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(partial(run_file, backend=backend, lexer=lexer, cached=cached, optimize=optimize), scripts, chunksize=chunksize)
+
+#######################################
+# REPORT
+#######################################
+
+
+def percentile(sorted_values, fraction):
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * fraction))]
+
+
+def report(latencies, failed, seconds, workers):
+    latencies = sorted(latencies)
+    print(f"{len(latencies)} scripts, {failed} failed, {seconds:.2f} s, {workers} workers, {len(latencies) / seconds:.1f} scripts/s")
+    if latencies:
+        print(f"latency: mean {statistics.mean(latencies) * 1000:.1f} ms, median {percentile(latencies, 0.5) * 1000:.1f} ms, "
+              f"95th percentile {percentile(latencies, 0.95) * 1000:.1f} ms, max {latencies[-1] * 1000:.1f} ms")
+
+#######################################
+# COMMAND LINE ARGUMENTS
+#######################################
+
+
+def parse_args(argv):
+    arg_parser = argparse.ArgumentParser(prog="celer batch", description="Run many scripts at once, each in a new runtime of a worker process")
+    arg_parser.add_argument("--workers", type=int, default=None,
+                            help="how many worker processes run the scripts (default: one for every CPU)")
+    arg_parser.add_argument("--backend", choices=BACKENDS, default="interpreter",
+                            help="how programs are executed (default: interpreter)")
+    arg_parser.add_argument("--lexer", choices=LEXERS, default="scanner",
+                            help="how scripts are split into tokens (default: scanner)")
+    arg_parser.add_argument("--no-cache", action="store_true",
+                            help=f"parse every script from scratch instead of keeping its tree in {cache.CACHE_DIR}")
+    arg_parser.add_argument("-O", "--optimize", type=int, choices=OPTIMIZE_LEVELS, default=DEFAULT_OPTIMIZE,
+                            help=f"0 runs scripts as they are written, 1 works out expressions of literals once and doesn't keep the values of loops nobody uses (default: {DEFAULT_OPTIMIZE})")
+    arg_parser.add_argument("--quiet", action="store_true", help="only print the scripts that failed and the report")
+    arg_parser.add_argument("scripts", nargs="+",
+                            help=f"scripts, globs, or folders to run every {' and '.join(SCRIPT_EXTENSIONS)} file of")
+    return arg_parser.parse_args(argv)
+
+
+def main(argv):
+    # Returns the exit status, which is 1 when any script failed
+    options = parse_args(argv)
+    scripts = find_scripts(options.scripts)
+    workers = options.workers or os.cpu_count() or 1
+
+    start = time.perf_counter()
+    latencies = []
+    failed = 0
+    for fn, output, error, seconds in run_batch(scripts, workers, options.backend, options.lexer, not options.no_cache, options.optimize):
+        latencies.append(seconds)
+        if error:
+            failed += 1
+        if error or not options.quiet:
+            print(f"==> {fn} ({'failed' if error else 'ok'}, {seconds * 1000:.1f} ms)")
+            print(output, end="")
+            if error:
+                print(error)
+
+    report(latencies, failed, time.perf_counter() - start, workers)
+    return 1 if failed else 0
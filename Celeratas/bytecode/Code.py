@@ -0,0 +1,56 @@
+#######################################
+# CODE
+#######################################
+
+
+class Code:
+    # A compiled block of bytecode - The module and every function body get their own Code object
+    def __init__(self, name, fn):
+        self.name = name
+        self.fn = fn
+        self.instructions = []
+        # The node each instruction came from, used to give errors a position
+        self.nodes = []
+        self.constants = []
+        self.names = []
+        # Named locals come first in the slots, hidden temporaries (loop counters, caught errors...) after them
+        self.local_names = []
+        self.slot_names = {}
+        self.slot_count = 0
+
+    def add_constant(self, value):
+        self.constants.append(value)
+        return len(self.constants) - 1
+
+    def add_name(self, name):
+        if name not in self.names:
+            self.names.append(name)
+        return self.names.index(name)
+
+    def add_local(self, name):
+        if name not in self.slot_names:
+            self.slot_names[name] = len(self.local_names)
+            self.local_names.append(name)
+        self.slot_count = max(self.slot_count, len(self.local_names))
+        return self.slot_names[name]
+
+    def add_temp(self, count=1):
+        slot = max(self.slot_count, len(self.local_names))
+        self.slot_count = slot + count
+        return slot
+
+    def __repr__(self):
+        return f"<code {self.name}>"
+
+
+class FunctionInfo:
+    # Everything MAKE_FUNCTION needs that is known at compile time
+    def __init__(self, name, code, arg_names, should_auto_return):
+        self.name = name
+        self.code = code
+        # (name, has_default) pairs - The default values themselves are computed when the function is defined
+        self.arg_names = arg_names
+        self.should_auto_return = should_auto_return
+
+    def __repr__(self):
+        return f"<function info {self.name or '<anonymous>'}>"
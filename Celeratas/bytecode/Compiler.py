@@ -0,0 +1,348 @@
+#######################################
+# IMPORTS
+#######################################
+
+import Celeratas.helper.tokens as toks
+import Celeratas.interpreter.operations as operations
+import Celeratas.parser.nodes as nodes
+from Celeratas.helper.errors import RTError, TypingError
+from Celeratas.interpreter.values import Bool, Number, Numeral, String
+from Celeratas.parser.Resolver import GLOBAL
+
+from . import opcodes as op
+from .Code import Code, FunctionInfo
+
+#######################################
+# COMPILER
+#######################################
+
+# Operators are stored in the instruction as an index into these lists
+BINARY_OPERATORS = list(operations.BINARY_OPERATIONS)
+UNARY_OPERATORS = list(operations.UNARY_OPERATIONS)
+AUGMENTED_OPERATORS = list(operations.AUGMENTED_OPERATIONS)
+
+
+class Label:
+    # A jump target whose offset is only known once the code after it has been emitted
+    def __init__(self):
+        self.offset = None
+
+
+class Compiler:
+    # Turns an AST into Code objects for the VM - Every node leaves exactly one value (or None) on the stack
+    def __init__(self, fn="<program>"):
+        self.fn = fn
+        self.code = None
+
+    def compile_program(self, node):
+        return self.compile_code("<program>", node, None)
+
+    def compile_code(self, name, body_node, func_node):
+        outer_code = self.code
+        self.code = Code(name, self.fn)
+
+        # Inside of a function every local the Resolver found gets a slot, the program keeps using the symbol table
+        if func_node:
+            for local_name in func_node.slot_names:
+                self.code.add_local(local_name)
+
+        self.compile(body_node)
+        if func_node and not func_node.should_auto_return:
+            self.emit(op.POP_TOP, None, body_node)
+            self.emit(op.LOAD_NONE, None, body_node)
+        self.emit(op.RETURN_VALUE, 1, body_node)
+
+        self.resolve_labels()
+        code, self.code = self.code, outer_code
+        return code
+
+    def compile(self, node):
+        method_name = f'compile_{type(node).__name__}'
+        method = getattr(self, method_name, self.no_compile_method)
+        method(node)
+
+    def no_compile_method(self, node):
+        raise Exception(f'No compile_{type(node).__name__} method defined')
+
+    ###################################
+
+    def emit(self, opcode, arg, node):
+        self.code.instructions.append((opcode, arg))
+        self.code.nodes.append(node)
+
+    def mark(self, label):
+        label.offset = len(self.code.instructions)
+
+    def resolve_labels(self):
+        # Labels can also be nested inside of a tuple argument, e.g. (slot, label)
+        def resolve(arg):
+            if isinstance(arg, Label):
+                return arg.offset
+            if isinstance(arg, tuple):
+                return tuple(resolve(item) for item in arg)
+            return arg
+
+        instructions = self.code.instructions
+        for idx, (opcode, arg) in enumerate(instructions):
+            instructions[idx] = (opcode, resolve(arg))
+
+    def emit_load(self, name, node):
+        slot = self.code.slot_names.get(name)
+        if slot is None:
+            self.emit(op.LOAD_NAME, self.code.add_name(name), node)
+        else:
+            self.emit(op.LOAD_LOCAL, slot, node)
+
+    def emit_store(self, name, node):
+        slot = self.code.slot_names.get(name)
+        if slot is None:
+            self.emit(op.STORE_NAME, self.code.add_name(name), node)
+        else:
+            self.emit(op.STORE_LOCAL, slot, node)
+
+    def emit_result(self, should_return_null, node):
+        if should_return_null:
+            self.emit(op.POP_TOP, None, node)
+            self.emit(op.LOAD_NONE, None, node)
+
+    ###################################
+
+    def compile_NumberNode(self, node):
+        number = Number(node.value).set_pos(node.pos_start, node.pos_end)
+        self.emit(op.LOAD_CONST, self.code.add_constant(number), node)
+
+    def compile_NumeralNode(self, node):
+        numeral = Numeral(node.value).set_pos(node.pos_start, node.pos_end)
+        self.emit(op.LOAD_CONST, self.code.add_constant(numeral), node)
+
+    def compile_StringNode(self, node):
+        if all(isinstance(component, str) for component in node.str_components):
+            string = String("".join(node.str_components)).set_pos(node.pos_start, node.pos_end)
+            self.emit(op.LOAD_CONST, self.code.add_constant(string), node)
+            return
+
+        # The text parts are kept in a constant, None marks where the value of an expression goes
+        parts = []
+        for component in node.str_components:
+            if isinstance(component, str):
+                parts.append(component)
+            else:
+                self.compile(component)
+                parts.append(None)
+        self.emit(op.BUILD_STRING, (self.code.add_constant(tuple(parts)), parts.count(None)), node)
+
+    def compile_BoolNode(self, node):
+        boolean = Bool(node.value == "Verus").set_pos(node.pos_start, node.pos_end)
+        self.emit(op.LOAD_CONST, self.code.add_constant(boolean), node)
+
+    def compile_ListNode(self, node):
+        for element_node in node.element_nodes:
+            self.compile(element_node)
+        self.emit(op.BUILD_LIST, len(node.element_nodes), node)
+
+    def compile_DictNode(self, node):
+        for key, value in node.key_pairs.items():
+            self.compile(key)
+            self.compile(value)
+        self.emit(op.BUILD_DICT, len(node.key_pairs), node)
+
+    def compile_VarAccessNode(self, node):
+        if node.scope == GLOBAL:
+            self.emit(op.LOAD_GLOBAL, self.code.add_name(node.var_name_to_get), node)
+        else:
+            self.emit_load(node.var_name_to_get, node)
+
+        if node.idxes_to_get:
+            self.emit(op.CHECK_INDEXABLE, None, node)
+        for idx_to_get in node.idxes_to_get:
+            self.compile(idx_to_get)
+            self.emit(op.BINARY_INDEX, None, node)
+
+        for attr_to_get in node.attrs_to_get:
+            self.emit(op.GET_ATTR, self.code.add_name(attr_to_get), node)
+
+    def compile_VarAssignNode(self, node):
+        if len(node.vars_to_set) != len(node.values_to_set):
+            error = (TypingError, 'Must have the same number of variables and values')
+            self.emit(op.FAIL, self.code.add_constant(error), node)
+            return
+
+        for (var_name, idxes_to_change), value in zip(node.vars_to_set, node.values_to_set):
+            self.compile(value)
+
+            if idxes_to_change:
+                for idx_to_change in idxes_to_change:
+                    self.compile(idx_to_change)
+                slot = self.code.slot_names.get(var_name)
+                self.emit(op.STORE_INDEX, (self.code.add_name(var_name), slot, len(idxes_to_change)), node)
+
+            if node.assign_type.type != toks.TT_EQ:
+                operator = AUGMENTED_OPERATORS.index(node.assign_type.type)
+                self.emit(op.AUG_ASSIGN, (self.code.add_name(var_name), operator), node)
+
+            self.emit_store(var_name, node)
+
+        self.emit(op.LOAD_NONE, None, node)
+
+    def compile_BinOpNode(self, node):
+        self.compile(node.left_node)
+        self.compile(node.right_node)
+        self.emit(op.BINARY_OP, BINARY_OPERATORS.index(operations.operator_key(node.op_tok)), node)
+
+    def compile_UnaryOpNode(self, node):
+        self.compile(node.node)
+        self.emit(op.UNARY_OP, UNARY_OPERATORS.index(operations.operator_key(node.op_tok)), node)
+
+    def compile_IfNode(self, node):
+        end = Label()
+
+        for condition, expr, should_return_null in node.cases:
+            next_case = Label()
+            self.compile(condition)
+            self.emit(op.JUMP_IF_FALSE, next_case, node)
+            self.compile(expr)
+            self.emit_result(should_return_null, node)
+            self.emit(op.JUMP, end, node)
+            self.mark(next_case)
+
+        if node.else_case:
+            expr, should_return_null = node.else_case
+            self.compile(expr)
+            self.emit_result(should_return_null, node)
+        else:
+            self.emit(op.LOAD_NONE, None, node)
+
+        self.mark(end)
+
+    def compile_TryNode(self, node):
+        handler = Label()
+        swallow = Label()
+        end = Label()
+        error_slot = self.code.add_temp()
+
+        self.emit(op.SETUP_TRY, (handler, error_slot), node)
+        self.compile(node.try_body)
+        self.emit(op.POP_BLOCK, None, node)
+        self.emit(op.CHECK_EXCEPT, None, node)
+        self.emit_result(node.should_return_null, node)
+        self.emit(op.JUMP, end, node)
+
+        # An error that does not match the praeter is swallowed, just like in the interpreter
+        self.mark(handler)
+        self.emit(op.CHECK_EXCEPT, None, node)
+        self.emit(op.MATCH_EXCEPT, (error_slot, swallow), node)
+        if node.except_as:
+            self.emit(op.LOAD_ERROR, error_slot, node)
+            self.emit_store(node.except_as.value, node)
+        if node.except_body:
+            self.compile(node.except_body)
+            self.emit(op.POP_TOP, None, node)
+        if node.except_as:
+            self.emit(op.DELETE_NAME, self.code.add_name(node.except_as.value), node)
+
+        self.mark(swallow)
+        self.emit(op.LOAD_NONE, None, node)
+        self.mark(end)
+
+    def compile_ForNode(self, node):
+        loop_start = Label()
+        loop_exit = Label()
+        end = Label()
+        # Holds the numbers the loop counts through (see operations.loop_numbers)
+        counter_slot = self.code.add_temp()
+        elements_slot = None if node.should_return_null else self.code.add_temp()
+
+        self.compile(node.start_value_node)
+        self.compile(node.end_value_node)
+        if node.step_value_node:
+            self.compile(node.step_value_node)
+        else:
+            self.emit(op.LOAD_CONST, self.code.add_constant(Number(1)), node)
+        self.emit(op.FOR_SETUP, counter_slot, node.start_value_node)
+
+        self.compile_loop(node, loop_start, loop_exit, end, elements_slot)
+        self.emit(op.FOR_ITER, (counter_slot, loop_exit), node)
+        self.emit_store(node.var_name, node)
+
+        self.compile_loop_body(node, loop_start, loop_exit, end, elements_slot)
+
+    def compile_WhileNode(self, node):
+        loop_start = Label()
+        loop_exit = Label()
+        end = Label()
+        elements_slot = None if node.should_return_null else self.code.add_temp()
+
+        self.compile_loop(node, loop_start, loop_exit, end, elements_slot)
+        self.compile(node.condition_node)
+        self.emit(op.JUMP_IF_FALSE, loop_exit, node.condition_node)
+
+        self.compile_loop_body(node, loop_start, loop_exit, end, elements_slot)
+
+    def compile_loop(self, node, loop_start, loop_exit, end, elements_slot):
+        # Everything up to the start of the loop - The condition of the loop is emitted by the caller after this
+        if elements_slot is not None:
+            self.emit(op.NEW_ACC, elements_slot, node)
+        self.emit(op.SETUP_LOOP, (end, loop_start), node)
+        self.mark(loop_start)
+
+    def compile_loop_body(self, node, loop_start, loop_exit, end, elements_slot):
+        self.compile(node.body_node)
+        if elements_slot is None:
+            self.emit(op.POP_TOP, None, node)
+        else:
+            self.emit(op.APPEND_ACC, elements_slot, node)
+        self.emit(op.JUMP, loop_start, node)
+
+        self.mark(loop_exit)
+        self.emit(op.POP_BLOCK, None, node)
+        self.mark(end)
+        if elements_slot is None:
+            self.emit(op.LOAD_NONE, None, node)
+        else:
+            self.emit(op.LOOP_RESULT, elements_slot, node)
+
+    def compile_RaiseNode(self, node):
+        error_to_raise = node.error_to_raise
+
+        for value in error_to_raise.arg_nodes.values():
+            if not isinstance(value, nodes.StringNode):
+                error = (RTError, 'Argument to Exception must be a string')
+                self.emit(op.FAIL, self.code.add_constant(error), error_to_raise)
+                return
+            self.compile(value)
+
+        self.emit(op.RAISE, len(error_to_raise.arg_nodes), node)
+
+    def compile_FuncDefNode(self, node):
+        arg_names = []
+        for arg_name, arg_value in node.args:
+            if arg_value is not None:
+                self.compile(arg_value)
+            arg_names.append((arg_name, arg_value is not None))
+
+        code = self.compile_code(node.func_name or "<anonymous>", node.body_node, node)
+        function_info = FunctionInfo(node.func_name, code, arg_names, node.should_auto_return)
+        self.emit(op.MAKE_FUNCTION, self.code.add_constant(function_info), node)
+
+    def compile_CallNode(self, node):
+        self.emit(op.CHECK_DEPTH, None, node)
+        self.compile(node.node_to_call)
+        for arg_value in node.arg_nodes.values():
+            self.compile(arg_value)
+        self.emit(op.TAIL_CALL if node.is_tail_call else op.CALL, self.code.add_constant(tuple(node.arg_nodes)), node)
+
+    def compile_ReturnNode(self, node):
+        if node.node_to_return:
+            self.compile(node.node_to_return)
+        else:
+            self.emit(op.LOAD_NONE, None, node)
+        self.emit(op.RETURN_VALUE, 0, node)
+
+    def compile_ContinueNode(self, node):
+        self.emit(op.CONTINUE_LOOP, None, node)
+
+    def compile_BreakNode(self, node):
+        self.emit(op.BREAK_LOOP, None, node)
+
+    def compile_PassNode(self, node):
+        self.emit(op.LOAD_NONE, None, node)
@@ -0,0 +1,17 @@
+#######################################
+# FRAME
+#######################################
+
+
+class Frame:
+    # The state of one running Code object - Frames live in a list in the VM instead of on the python stack
+    def __init__(self, code, context, slots, depth, function=None):
+        self.code = code
+        self.context = context
+        self.slots = slots
+        self.depth = depth
+        self.function = function
+        self.stack = []
+        # (kind, target, continue target, stack size, error slot) for every loop and try the frame is inside of
+        self.blocks = []
+        self.pc = 0
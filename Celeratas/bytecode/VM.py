@@ -0,0 +1,433 @@
+#######################################
+# IMPORTS
+#######################################
+
+import Celeratas.interpreter.operations as operations
+from Celeratas.helper.errors import RTError
+from Celeratas.interpreter.RTResult import RTResult
+from Celeratas.interpreter.values import Dict, List, String
+
+from .Compiler import AUGMENTED_OPERATORS, BINARY_OPERATORS, UNARY_OPERATORS
+from .Frame import Frame
+from .opcodes import (APPEND_ACC, AUG_ASSIGN, BINARY_INDEX, BINARY_OP,
+                      BREAK_LOOP, BUILD_DICT, BUILD_LIST, BUILD_STRING, CALL,
+                      CHECK_DEPTH, CHECK_EXCEPT, CHECK_INDEXABLE,
+                      CONTINUE_LOOP, DELETE_NAME, FAIL, FOR_ITER, FOR_SETUP,
+                      GET_ATTR, JUMP, JUMP_IF_FALSE, LOAD_CONST, LOAD_ERROR,
+                      LOAD_GLOBAL, LOAD_LOCAL, LOAD_NAME, LOAD_NONE,
+                      LOOP_RESULT, MAKE_FUNCTION, MATCH_EXCEPT, NEW_ACC,
+                      POP_BLOCK, POP_TOP, RAISE, RETURN_VALUE, SETUP_LOOP,
+                      SETUP_TRY, STORE_INDEX, STORE_LOCAL, STORE_NAME,
+                      TAIL_CALL, UNARY_OP)
+from .VMFunction import VMFunction
+
+#######################################
+# VM
+#######################################
+
+BINARY_FUNCTIONS = [operations.BINARY_OPERATIONS[key] for key in BINARY_OPERATORS]
+UNARY_FUNCTIONS = [operations.UNARY_OPERATIONS[key] for key in UNARY_OPERATORS]
+AUGMENTED_FUNCTIONS = [operations.AUGMENTED_OPERATIONS[key] for key in AUGMENTED_OPERATORS]
+
+LOOP_BLOCK = "loop"
+TRY_BLOCK = "try"
+
+ERROR = "error"
+BREAK = "break"
+CONTINUE = "continue"
+
+
+class Unwind(Exception):
+    # Leaves the dispatch loop with an error, confringe or continua that has to look through the blocks of the frames
+    def __init__(self, kind, error=None):
+        super().__init__(kind)
+        self.kind = kind
+        self.error = error
+
+
+class VM:
+    # Runs Code objects made by the Compiler - Calls between VM functions push a frame instead of recursing in python
+    def __init__(self):
+        self.frames = []
+
+    def run(self, code, context, recursion_depth=0):
+        return self.execute(Frame(code, context, [None] * code.slot_count, recursion_depth))
+
+    def call(self, function, args, recursion_depth):
+        frame, error = self.new_frame(function, args, recursion_depth)
+        if error:
+            return RTResult().failure(error)
+        return self.execute(frame)
+
+    def new_frame(self, function, args, recursion_depth):
+        exec_ctx = function.generate_new_context()
+        res = function.check_and_populate_args(function.arg_names, args, exec_ctx)
+        if res.error:
+            return None, res.error
+
+        frame = Frame(function.code, exec_ctx, exec_ctx.symbol_table.slots, recursion_depth + 1, function)
+        return frame, None
+
+    def execute(self, frame):
+        self.frames = [frame]
+        while True:
+            try:
+                return self.dispatch()
+            except Unwind as signal:
+                result = self.unwind(signal)
+                if result is not None:
+                    return result
+
+    def unwind(self, signal):
+        # Finds the block that handles the signal, frames are left until one is found
+        frames = self.frames
+        while frames:
+            frame = frames[-1]
+            blocks = frame.blocks
+
+            while blocks:
+                kind, target, continue_target, stack_size, error_slot = blocks[-1]
+
+                if kind == TRY_BLOCK and signal.kind == ERROR:
+                    blocks.pop()
+                    del frame.stack[stack_size:]
+                    frame.slots[error_slot] = signal.error
+                    frame.pc = target
+                    return None
+
+                if kind == LOOP_BLOCK and signal.kind != ERROR:
+                    del frame.stack[stack_size:]
+                    if signal.kind == BREAK:
+                        blocks.pop()
+                        frame.pc = target
+                    else:
+                        frame.pc = continue_target
+                    return None
+
+                blocks.pop()
+            frames.pop()
+
+        # Nothing handled it, so the signal becomes the result of the whole run just like in the interpreter
+        if signal.kind == ERROR:
+            return RTResult().failure(signal.error)
+        if signal.kind == BREAK:
+            return RTResult().success_break()
+        return RTResult().success_continue()
+
+    def dispatch(self):
+        frames = self.frames
+
+        while True:
+            frame = frames[-1]
+            code = frame.code
+            instructions = code.instructions
+            constants = code.constants
+            names = code.names
+            nodes = code.nodes
+            slots = frame.slots
+            stack = frame.stack
+            push = stack.append
+            pop = stack.pop
+            blocks = frame.blocks
+            context = frame.context
+            symbol_table = context.symbol_table
+            pc = frame.pc
+
+            while True:
+                opcode, arg = instructions[pc]
+                pc += 1
+
+                if opcode == LOAD_LOCAL:
+                    value = slots[arg]
+                    if value is None:
+                        value = symbol_table.get(code.local_names[arg])
+                        if value is None:
+                            raise Unwind(ERROR, operations.undefined_variable(code.local_names[arg], nodes[pc - 1], context))
+                    push(value)
+
+                elif opcode == LOAD_CONST:
+                    push(constants[arg].set_context(context))
+
+                elif opcode == LOAD_NAME:
+                    value = symbol_table.get(names[arg])
+                    if value is None:
+                        raise Unwind(ERROR, operations.undefined_variable(names[arg], nodes[pc - 1], context))
+                    push(value)
+
+                elif opcode == LOAD_GLOBAL:
+                    value = operations.load_global(names[arg], symbol_table)
+                    if value is None:
+                        raise Unwind(ERROR, operations.undefined_variable(names[arg], nodes[pc - 1], context))
+                    push(value)
+
+                elif opcode == STORE_LOCAL:
+                    slots[arg] = pop()
+
+                elif opcode == STORE_NAME:
+                    symbol_table.set(names[arg], pop())
+
+                elif opcode == BINARY_OP:
+                    right = pop()
+                    left = pop()
+                    result, error = BINARY_FUNCTIONS[arg](left, right)
+                    node = nodes[pc - 1]
+                    if error:
+                        raise Unwind(ERROR, operations.binary_error(BINARY_FUNCTIONS[arg], left, right, node, context))
+                    push(result.set_pos(node.pos_start, node.pos_end))
+
+                elif opcode == JUMP_IF_FALSE:
+                    condition = pop()
+                    if condition is None:
+                        raise Unwind(ERROR, operations.empty_condition(nodes[pc - 1], context))
+                    if not condition.is_true():
+                        pc = arg
+
+                elif opcode == JUMP:
+                    pc = arg
+
+                elif opcode == FOR_ITER:
+                    slot, target = arg
+                    number = next(slots[slot], None)
+                    if number is None:
+                        pc = target
+                    else:
+                        push(number)
+
+                elif opcode == POP_TOP:
+                    pop()
+
+                elif opcode == LOAD_NONE:
+                    push(None)
+
+                elif opcode == APPEND_ACC:
+                    slots[arg].append(pop())
+
+                elif opcode == CHECK_DEPTH:
+                    if frame.depth > operations.MAX_RECURSION_DEPTH:
+                        raise Unwind(ERROR, operations.recursion_error(nodes[pc - 1], context))
+
+                elif opcode == CALL or opcode == TAIL_CALL:
+                    node = nodes[pc - 1]
+                    keys = constants[arg]
+                    values = stack[len(stack) - len(keys):]
+                    del stack[len(stack) - len(keys):]
+                    # A function runs in the context it is called from, so the callee is the one value that is always positioned
+                    value_to_call = operations.positioned(pop(), node, context)
+                    args = dict(zip(keys, values))
+
+                    if type(value_to_call) is VMFunction:
+                        is_tail_call = opcode == TAIL_CALL
+                        new_frame, error = self.new_frame(value_to_call, args, frame.depth - is_tail_call)
+                        if error:
+                            raise Unwind(ERROR, error)
+                        if is_tail_call:
+                            # Nothing of this frame is left to run, so the callee takes its place instead of going on top of it
+                            frames[-1] = new_frame
+                        else:
+                            frame.pc = pc
+                            frames.append(new_frame)
+                        break
+
+                    result = value_to_call.execute(args, frame.depth)
+                    if result.error:
+                        raise Unwind(ERROR, result.error)
+                    if result.loop_should_break:
+                        raise Unwind(BREAK)
+                    if result.loop_should_continue:
+                        raise Unwind(CONTINUE)
+
+                    push(result.value)
+
+                elif opcode == RETURN_VALUE:
+                    value = pop()
+                    # A redi without a value does not leave the function in the interpreter, it only gives None
+                    if value is None and not arg:
+                        push(None)
+                        continue
+
+                    frames.pop()
+                    if not frames:
+                        if frame.function is None and not arg:
+                            return RTResult().success_return(value)
+                        return RTResult().success(value)
+
+                    frames[-1].stack.append(value)
+                    break
+
+                elif opcode == UNARY_OP:
+                    value = pop()
+                    result, error = UNARY_FUNCTIONS[arg](value)
+                    node = nodes[pc - 1]
+                    if error:
+                        raise Unwind(ERROR, operations.unary_error(UNARY_FUNCTIONS[arg], value, node, context))
+                    # Constants are shared between runs, so they can't have their position changed in place
+                    if result is value:
+                        result = value.copy()
+                    push(result.set_pos(node.pos_start, node.pos_end))
+
+                elif opcode == AUG_ASSIGN:
+                    name, operator = arg
+                    value = pop()
+                    old_value = symbol_table.get(names[name])
+                    if old_value is None:
+                        raise Unwind(ERROR, operations.undefined_variable(names[name], nodes[pc - 1], context))
+                    result, error = AUGMENTED_FUNCTIONS[operator](old_value, value)
+                    if error:
+                        node = nodes[pc - 1]
+                        raise Unwind(ERROR, operations.augmented_error(node.assign_type, old_value, value, node, context))
+                    push(result)
+
+                elif opcode == BUILD_LIST:
+                    node = nodes[pc - 1]
+                    elements = stack[len(stack) - arg:]
+                    del stack[len(stack) - arg:]
+                    push(List(elements).set_context(context).set_pos(node.pos_start, node.pos_end))
+
+                elif opcode == BUILD_DICT:
+                    node = nodes[pc - 1]
+                    items = stack[len(stack) - 2 * arg:]
+                    del stack[len(stack) - 2 * arg:]
+                    keypairs = {items[idx].value: items[idx + 1] for idx in range(0, len(items), 2)}
+                    push(Dict(keypairs).set_context(context).set_pos(node.pos_start, node.pos_end))
+
+                elif opcode == BUILD_STRING:
+                    node = nodes[pc - 1]
+                    parts, count = arg
+                    values = iter(stack[len(stack) - count:])
+                    del stack[len(stack) - count:]
+                    string = "".join(str(next(values)) if part is None else part for part in constants[parts])
+                    push(String(string).set_context(context).set_pos(node.pos_start, node.pos_end))
+
+                elif opcode == CHECK_INDEXABLE:
+                    error = operations.check_indexable(stack[-1], nodes[pc - 1], context)
+                    if error:
+                        raise Unwind(ERROR, error)
+
+                elif opcode == BINARY_INDEX:
+                    idx_to_get = pop()
+                    value, error = operations.get_index(pop(), idx_to_get, nodes[pc - 1], context)
+                    if error:
+                        raise Unwind(ERROR, error)
+                    push(value)
+
+                elif opcode == GET_ATTR:
+                    value, error = operations.get_attribute(pop(), names[arg], nodes[pc - 1], context)
+                    if error:
+                        raise Unwind(ERROR, error)
+                    push(value)
+
+                elif opcode == STORE_INDEX:
+                    name, slot, count = arg
+                    node = nodes[pc - 1]
+                    idx_values = stack[len(stack) - count:]
+                    del stack[len(stack) - count:]
+                    value = pop()
+
+                    if slot is None:
+                        if names[name] not in symbol_table.symbols:
+                            raise Unwind(ERROR, operations.undefined_variable(names[name], node, context))
+                        var_to_change = symbol_table.get(names[name])
+                    else:
+                        var_to_change = slots[slot]
+                        if var_to_change is None:
+                            raise Unwind(ERROR, operations.undefined_variable(names[name], node, context))
+
+                    error = operations.set_index(var_to_change, idx_values, value, node, context)
+                    if error:
+                        raise Unwind(ERROR, error)
+                    push(var_to_change)
+
+                elif opcode == DELETE_NAME:
+                    symbol_table.remove(names[arg])
+
+                elif opcode == FOR_SETUP:
+                    step = pop()
+                    end = pop()
+                    start = pop()
+                    if start is None:
+                        node = nodes[pc - 1]
+                        raise Unwind(ERROR, RTError(
+                            node.pos_start, node.pos_end,
+                            'Expression does not have a value',
+                            context
+                        ))
+                    slots[arg] = operations.loop_numbers(start.value, end.value, step.value)
+
+                elif opcode == SETUP_LOOP:
+                    target, continue_target = arg
+                    blocks.append((LOOP_BLOCK, target, continue_target, len(stack), None))
+
+                elif opcode == POP_BLOCK:
+                    blocks.pop()
+
+                elif opcode == BREAK_LOOP:
+                    if not blocks or blocks[-1][0] != LOOP_BLOCK:
+                        raise Unwind(BREAK)
+                    _, target, _, stack_size, _ = blocks.pop()
+                    del stack[stack_size:]
+                    pc = target
+
+                elif opcode == CONTINUE_LOOP:
+                    if not blocks or blocks[-1][0] != LOOP_BLOCK:
+                        raise Unwind(CONTINUE)
+                    _, _, continue_target, stack_size, _ = blocks[-1]
+                    del stack[stack_size:]
+                    pc = continue_target
+
+                elif opcode == NEW_ACC:
+                    slots[arg] = []
+
+                elif opcode == LOOP_RESULT:
+                    node = nodes[pc - 1]
+                    push(List(slots[arg]).set_context(context).set_pos(node.pos_start, node.pos_end))
+                    slots[arg] = None
+
+                elif opcode == SETUP_TRY:
+                    target, error_slot = arg
+                    blocks.append((TRY_BLOCK, target, None, len(stack), error_slot))
+
+                elif opcode == CHECK_EXCEPT:
+                    error = operations.check_except_name(nodes[pc - 1].except_name, context)
+                    if error:
+                        raise Unwind(ERROR, error)
+
+                elif opcode == MATCH_EXCEPT:
+                    error_slot, target = arg
+                    node = nodes[pc - 1]
+                    if not node.except_body or not operations.should_except(node.except_name, slots[error_slot]):
+                        pc = target
+
+                elif opcode == LOAD_ERROR:
+                    push(String(slots[arg].details))
+
+                elif opcode == RAISE:
+                    messages = stack[len(stack) - arg:]
+                    del stack[len(stack) - arg:]
+                    error_message = ", ".join(message.value for message in messages)
+                    raise Unwind(ERROR, operations.raised_error(nodes[pc - 1], error_message, context))
+
+                elif opcode == FAIL:
+                    error_class, message = constants[arg]
+                    node = nodes[pc - 1]
+                    raise Unwind(ERROR, error_class(node.pos_start, node.pos_end, message, context))
+
+                elif opcode == MAKE_FUNCTION:
+                    function_info = constants[arg]
+                    node = nodes[pc - 1]
+
+                    default_count = sum(has_default for _, has_default in function_info.arg_names)
+                    defaults = iter(stack[len(stack) - default_count:])
+                    del stack[len(stack) - default_count:]
+                    args = [
+                        (arg_name, next(defaults) if has_default else None)
+                        for arg_name, has_default in function_info.arg_names
+                    ]
+
+                    func_value = VMFunction(function_info.name, node.body_node, args, function_info.should_auto_return,
+                                            function_info.code).set_context(context).set_module(context).set_pos(node.pos_start, node.pos_end)
+                    if function_info.name:
+                        symbol_table.set(function_info.name, func_value)
+                    push(func_value)
+
+                else:
+                    raise Exception(f'Unknown opcode {opcode}')
@@ -0,0 +1,38 @@
+#####################################
+# IMPORTS
+#####################################
+
+from Celeratas.interpreter.Context import Context
+from Celeratas.interpreter.SlotSymbolTable import SlotSymbolTable
+from Celeratas.interpreter.values import Function
+
+#####################################
+# VM FUNCTION
+#####################################
+
+
+class VMFunction(Function):
+    # A function whose body was compiled to bytecode - The VM runs it in a new frame instead of visiting the AST
+    __slots__ = ('code',)
+
+    def __init__(self, name, body_node, arg_names, should_auto_return, code):
+        super().__init__(name, body_node, arg_names, should_auto_return)
+        self.code = code
+
+    def generate_new_context(self):
+        new_context = Context(self.name, self.context, self.pos_start)
+        new_context.symbol_table = SlotSymbolTable(
+            self.code.slot_names, [None] * self.code.slot_count, self.parent_table())
+        return new_context
+
+    def execute(self, args, recursion_depth):
+        # Only used when something other than the VM calls the function, the VM pushes a frame itself
+        from .VM import VM
+        return VM().call(self, args, recursion_depth)
+
+    def copy(self):
+        copy = VMFunction(self.name, self.body_node, self.arg_names, self.should_auto_return, self.code)
+        copy.module_table = self.module_table
+        copy.set_context(self.context)
+        copy.set_pos(self.pos_start, self.pos_end)
+        return copy
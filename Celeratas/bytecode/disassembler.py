@@ -0,0 +1,61 @@
+#######################################
+# IMPORTS
+#######################################
+
+from . import opcodes as op
+from .Compiler import AUGMENTED_OPERATORS, BINARY_OPERATORS, UNARY_OPERATORS
+
+#######################################
+# DISASSEMBLER
+#######################################
+
+
+def describe_operator(operator_key):
+    # Keyword operators are keyed by (type, keyword)
+    return operator_key[1] if isinstance(operator_key, tuple) else operator_key
+
+
+def describe_arg(code, opcode, arg):
+    if opcode == op.BINARY_OP:
+        return describe_operator(BINARY_OPERATORS[arg])
+    if opcode == op.UNARY_OP:
+        return describe_operator(UNARY_OPERATORS[arg])
+    if opcode == op.AUG_ASSIGN:
+        return f"{code.names[arg[0]]} {AUGMENTED_OPERATORS[arg[1]]}"
+
+    # Other tuple arguments are described by their first item
+    first = arg[0] if isinstance(arg, tuple) else arg
+
+    if opcode in op.HAS_CONST:
+        return repr(code.constants[first])
+    if opcode in op.HAS_NAME:
+        return code.names[first]
+    if opcode in op.HAS_LOCAL:
+        return code.local_names[first]
+    if opcode in op.HAS_JUMP:
+        return f"to {first}"
+    return ""
+
+
+def disassemble(code, lines=None):
+    # Returns a readable listing of a Code object and every function defined in it
+    lines = [] if lines is None else lines
+    lines.append(f"Disassembly of {code.name}:")
+
+    functions = []
+    for offset, (opcode, arg) in enumerate(code.instructions):
+        node = code.nodes[offset]
+        line = str(node.pos_start.ln + 1) if node is not None and node.pos_start else ""
+        arg_text = "" if arg is None else str(arg)
+        description = describe_arg(code, opcode, arg) if arg is not None else ""
+
+        lines.append(f"{line:>4} {offset:>5} {op.OPNAMES[opcode]:<16} {arg_text:<12} {'(' + description + ')' if description else ''}".rstrip())
+
+        if opcode == op.MAKE_FUNCTION:
+            functions.append(code.constants[arg].code)
+
+    for function_code in functions:
+        lines.append("")
+        disassemble(function_code, lines)
+
+    return "\n".join(lines)
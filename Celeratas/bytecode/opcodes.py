@@ -0,0 +1,64 @@
+#######################################
+# OPCODES
+#######################################
+
+# Every instruction is an (opcode, argument) pair - Arguments are indexes into the constants, names or slots of a Code object
+# Opcodes that need more than one number take a tuple
+
+LOAD_CONST = 0
+LOAD_NAME = 1
+STORE_NAME = 2
+LOAD_LOCAL = 3
+STORE_LOCAL = 4
+DELETE_NAME = 5
+LOAD_NONE = 6
+POP_TOP = 7
+LOAD_GLOBAL = 8
+
+BINARY_OP = 10
+UNARY_OP = 11
+AUG_ASSIGN = 12
+
+BUILD_LIST = 20
+BUILD_DICT = 21
+BUILD_STRING = 22
+CHECK_INDEXABLE = 24
+BINARY_INDEX = 25
+GET_ATTR = 26
+STORE_INDEX = 27
+
+JUMP = 30
+JUMP_IF_FALSE = 31
+FOR_SETUP = 32
+FOR_ITER = 33
+SETUP_LOOP = 34
+POP_BLOCK = 35
+BREAK_LOOP = 36
+CONTINUE_LOOP = 37
+NEW_ACC = 38
+APPEND_ACC = 39
+LOOP_RESULT = 40
+
+SETUP_TRY = 50
+CHECK_EXCEPT = 51
+MATCH_EXCEPT = 52
+LOAD_ERROR = 53
+RAISE = 54
+FAIL = 55
+
+MAKE_FUNCTION = 60
+CHECK_DEPTH = 61
+CALL = 62
+RETURN_VALUE = 63
+TAIL_CALL = 64
+
+OPNAMES = {
+    value: name for name, value in list(globals().items())
+    if name.isupper() and isinstance(value, int)
+}
+
+# Used by the disassembler to explain arguments - A few opcodes take a tuple, its first item is described here
+HAS_NAME = {LOAD_NAME, LOAD_GLOBAL, STORE_NAME, DELETE_NAME, GET_ATTR, AUG_ASSIGN, STORE_INDEX}
+HAS_CONST = {LOAD_CONST, BUILD_STRING, MAKE_FUNCTION, CALL, TAIL_CALL, FAIL}
+HAS_LOCAL = {LOAD_LOCAL, STORE_LOCAL}
+HAS_JUMP = {JUMP, JUMP_IF_FALSE, SETUP_LOOP, SETUP_TRY}
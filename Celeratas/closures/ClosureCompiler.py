@@ -0,0 +1,516 @@
+#######################################
+# IMPORTS
+#######################################
+
+import Celeratas.helper.tokens as toks
+import Celeratas.interpreter.operations as operations
+from Celeratas.helper.errors import RTError, TypingError
+from Celeratas.interpreter.signals import (Failure, FunctionReturn, LoopBreak,
+                                           LoopContinue, TailCall, capture,
+                                           unwrap)
+from Celeratas.interpreter.values import (Bool, Dict, List, Number, Numeral,
+                                          String)
+from Celeratas.parser.nodes import StringNode
+from Celeratas.parser.Resolver import LOCAL
+
+from .ClosureFunction import ClosureFunction
+
+#######################################
+# CLOSURE COMPILER
+#######################################
+
+
+class ClosureCompiler:
+    # Turns an AST into a tree of python closures that each take a context and return a value
+    # Errors, redi, continua and confringe are raised as signals so that no RTResult is made on the way
+    # Everything that only depends on the node (operators, constants, child closures) is resolved once here instead of on every run
+    def __init__(self):
+        self.recursion_depth = 0
+        self.in_function = False
+
+    def run(self, node, context):
+        return capture(self.compile(node), context)
+
+    def compile(self, node):
+        method_name = f'compile_{type(node).__name__}'
+        method = getattr(self, method_name, self.no_compile_method)
+        return method(node)
+
+    def no_compile_method(self, node):
+        raise Exception(f'No compile_{type(node).__name__} method defined')
+
+    ###################################
+
+    def compile_NumberNode(self, node):
+        number = Number(node.value).set_pos(node.pos_start, node.pos_end)
+
+        def number_code(context):
+            return number.set_context(context)
+        return number_code
+
+    def compile_NumeralNode(self, node):
+        numeral = Numeral(node.value).set_pos(node.pos_start, node.pos_end)
+
+        def numeral_code(context):
+            return numeral.set_context(context)
+        return numeral_code
+
+    def compile_StringNode(self, node):
+        pos_start, pos_end = node.pos_start, node.pos_end
+
+        # Plain strings can be built once, f-strings have to run their expressions every time
+        if all(isinstance(component, str) for component in node.str_components):
+            string = String("".join(node.str_components)).set_pos(pos_start, pos_end)
+
+            def string_code(context):
+                return string.set_context(context)
+            return string_code
+
+        components = [
+            component if isinstance(component, str) else self.compile(component)
+            for component in node.str_components
+        ]
+
+        def fstring_code(context):
+            string = ""
+            for component in components:
+                if isinstance(component, str):
+                    string += component
+                else:
+                    string += str(component(context))
+
+            return String(string).set_context(context).set_pos(pos_start, pos_end)
+        return fstring_code
+
+    def compile_BoolNode(self, node):
+        boolean = Bool(node.value == "Verus").set_pos(node.pos_start, node.pos_end)
+
+        def bool_code(context):
+            return boolean.set_context(context)
+        return bool_code
+
+    def compile_ListNode(self, node):
+        element_codes = [self.compile(element_node) for element_node in node.element_nodes]
+        pos_start, pos_end = node.pos_start, node.pos_end
+
+        def list_code(context):
+            elements = [element_code(context) for element_code in element_codes]
+            return List(elements).set_context(context).set_pos(pos_start, pos_end)
+        return list_code
+
+    def compile_DictNode(self, node):
+        pair_codes = [(self.compile(key), self.compile(value)) for key, value in node.key_pairs.items()]
+        pos_start, pos_end = node.pos_start, node.pos_end
+
+        def dict_code(context):
+            keypairs = {}
+            for key_code, value_code in pair_codes:
+                key = key_code(context)
+                keypairs[key.value] = value_code(context)
+
+            return Dict(keypairs).set_context(context).set_pos(pos_start, pos_end)
+        return dict_code
+
+    def compile_VarAccessNode(self, node):
+        var_name = node.var_name_to_get
+        idx_codes = [self.compile(idx_to_get) for idx_to_get in node.idxes_to_get]
+        attrs_to_get = node.attrs_to_get
+
+        if not idx_codes and not attrs_to_get and node.scope == LOCAL:
+            slot = node.slot
+
+            def local_code(context):
+                value = context.symbol_table.slots[slot]
+                if value is None:
+                    value = context.symbol_table.get_local(slot, var_name)
+                if value is None:
+                    raise Failure(operations.undefined_variable(var_name, node, context))
+                return value
+            return local_code
+
+        if not idx_codes and not attrs_to_get and not self.in_function:
+            # Outside of a function there is only the table of the program to look in
+            def global_code(context):
+                value = context.symbol_table.get(var_name)
+                if value is None:
+                    raise Failure(operations.undefined_variable(var_name, node, context))
+                return value
+            return global_code
+
+        if not idx_codes and not attrs_to_get:
+            def var_code(context):
+                value = operations.load_variable(node, context)
+                if value is None:
+                    raise Failure(operations.undefined_variable(var_name, node, context))
+                return value
+            return var_code
+
+        def var_access_code(context):
+            value = operations.load_variable(node, context)
+            if value is None:
+                raise Failure(operations.undefined_variable(var_name, node, context))
+
+            if idx_codes:
+                error = operations.check_indexable(value, node, context)
+                if error:
+                    raise Failure(error)
+
+            for idx_code in idx_codes:
+                value, error = operations.get_index(value, idx_code(context), node, context)
+                if error:
+                    raise Failure(error)
+
+            for attr_to_get in attrs_to_get:
+                value, error = operations.get_attribute(value, attr_to_get, node, context)
+                if error:
+                    raise Failure(error)
+
+            return value
+        return var_access_code
+
+    def compile_VarAssignNode(self, node):
+        if len(node.vars_to_set) != len(node.values_to_set):
+            def mismatched_assign_code(context):
+                raise Failure(TypingError(
+                    node.pos_start, node.pos_end,
+                    'Must have the same number of variables and values',
+                    context
+                ))
+            return mismatched_assign_code
+
+        slots = node.slots or [None] * len(node.vars_to_set)
+        targets = [
+            (var_name, slot, [self.compile(idx) for idx in idxes_to_change], self.compile(value))
+            for (var_name, idxes_to_change), value, slot in zip(node.vars_to_set, node.values_to_set, slots)
+        ]
+        assign_type = node.assign_type
+        is_plain = assign_type.type == toks.TT_EQ
+
+        # The most common assignment gets its own closure: one plain name set to one value
+        if is_plain and len(targets) == 1 and not targets[0][2]:
+            var_name, slot, _, value_code = targets[0]
+
+            if slot is not None:
+                def local_assign_code(context):
+                    context.symbol_table.slots[slot] = value_code(context)
+                return local_assign_code
+
+            def simple_assign_code(context):
+                context.symbol_table.set(var_name, value_code(context))
+            return simple_assign_code
+
+        def assign_code(context):
+            for var_name, slot, idx_codes, value_code in targets:
+                value = value_code(context)
+
+                if idx_codes:
+                    if not operations.is_defined_here(var_name, slot, context):
+                        raise Failure(operations.undefined_variable(var_name, node, context))
+
+                    var_to_change = context.symbol_table.get(var_name)
+                    idx_values = [idx_code(context) for idx_code in idx_codes]
+
+                    error = operations.set_index(var_to_change, idx_values, value, node, context)
+                    if error:
+                        raise Failure(error)
+
+                    value = var_to_change
+
+                if not is_plain:
+                    if slot is None:
+                        old_value = context.symbol_table.get(var_name)
+                    else:
+                        old_value = context.symbol_table.get_local(slot, var_name)
+                    if old_value is None:
+                        raise Failure(operations.undefined_variable(var_name, node, context))
+
+                    new_value, error = operations.augmented_assignment(assign_type, old_value, value)
+                    if error:
+                        raise Failure(operations.augmented_error(assign_type, old_value, value, node, context))
+                    value = new_value
+
+                if slot is None:
+                    context.symbol_table.set(var_name, value)
+                else:
+                    context.symbol_table.slots[slot] = value
+        return assign_code
+
+    def compile_BinOpNode(self, node):
+        left_code = self.compile(node.left_node)
+        right_code = self.compile(node.right_node)
+        operation = operations.BINARY_OPERATIONS[operations.operator_key(node.op_tok)]
+        pos_start, pos_end = node.pos_start, node.pos_end
+
+        def bin_op_code(context):
+            left = left_code(context)
+            right = right_code(context)
+            result, error = operation(left, right)
+            if error:
+                raise Failure(operations.binary_error(operation, left, right, node, context))
+            return result.set_pos(pos_start, pos_end)
+        return bin_op_code
+
+    def compile_UnaryOpNode(self, node):
+        operand_code = self.compile(node.node)
+        operation = operations.UNARY_OPERATIONS[operations.operator_key(node.op_tok)]
+        pos_start, pos_end = node.pos_start, node.pos_end
+
+        def unary_op_code(context):
+            operand = operand_code(context)
+            value, error = operation(operand)
+            if error:
+                raise Failure(operations.unary_error(operation, operand, node, context))
+            # Constants are shared between runs, so they can't have their position changed in place
+            if value is operand:
+                value = value.copy()
+            return value.set_pos(pos_start, pos_end)
+        return unary_op_code
+
+    def compile_IfNode(self, node):
+        cases = [
+            (self.compile(condition), self.compile(expr), should_return_null)
+            for condition, expr, should_return_null in node.cases
+        ]
+        if node.else_case:
+            else_expr, else_should_return_null = node.else_case
+            else_code = self.compile(else_expr)
+        else:
+            else_code = None
+
+        def if_code(context):
+            for condition_code, expr_code, should_return_null in cases:
+                condition_value = condition_code(context)
+                if condition_value is None:
+                    raise Failure(operations.empty_condition(node, context))
+
+                if condition_value.is_true():
+                    expr_value = expr_code(context)
+                    return None if should_return_null else expr_value
+
+            if else_code:
+                expr_value = else_code(context)
+                return None if else_should_return_null else expr_value
+
+            return None
+        return if_code
+
+    def compile_TryNode(self, node):
+        try_code = self.compile(node.try_body)
+        except_code = self.compile(node.except_body) if node.except_body else None
+        except_name = node.except_name
+        except_as = node.except_as.value if node.except_as else None
+        should_return_null = node.should_return_null
+
+        def check_except_name(context):
+            error = operations.check_except_name(except_name, context)
+            if error:
+                raise Failure(error)
+
+        def try_except_code(context):
+            try:
+                value = try_code(context)
+            except Failure as failure:
+                check_except_name(context)
+                error = failure.error
+            except (LoopBreak, LoopContinue, FunctionReturn):
+                # The interpreter checks the praeter name before letting anything leave the try body
+                check_except_name(context)
+                raise
+            else:
+                check_except_name(context)
+                return None if should_return_null else value
+
+            if except_code and operations.should_except(except_name, error):
+                if except_as:
+                    context.symbol_table.set(except_as, String(error.details))
+
+                except_code(context)
+
+                if except_as:
+                    context.symbol_table.remove(except_as)
+
+            # An error that is not caught by this praeter is swallowed, just like in the interpreter
+            return None
+        return try_except_code
+
+    def compile_ForNode(self, node):
+        var_name = node.var_name
+        var_slot = node.var_slot
+        start_code = self.compile(node.start_value_node)
+        end_code = self.compile(node.end_value_node)
+        step_code = self.compile(node.step_value_node) if node.step_value_node else None
+        body_code = self.compile(node.body_node)
+        start_node = node.start_value_node
+        should_return_null = node.should_return_null
+        pos_start, pos_end = node.pos_start, node.pos_end
+
+        def for_code(context):
+            start_value = start_code(context)
+            end_value = end_code(context)
+            step = step_code(context).value if step_code else 1
+
+            if start_value is None:
+                raise Failure(RTError(
+                    start_node.pos_start, start_node.pos_end,
+                    'Expression does not have a value',
+                    context
+                ))
+
+            symbol_table = context.symbol_table
+            slots = symbol_table.slots if var_slot is not None else None
+            # The values of the body are only kept when the loop gives them
+            elements = None if should_return_null else []
+
+            for number in operations.loop_numbers(start_value.value, end_value.value, step):
+                if slots is None:
+                    symbol_table.set(var_name, number)
+                else:
+                    slots[var_slot] = number
+
+                try:
+                    value = body_code(context)
+                except LoopContinue:
+                    continue
+                except LoopBreak:
+                    break
+
+                if elements is not None:
+                    elements.append(value)
+
+            return None if should_return_null else List(elements).set_context(context).set_pos(pos_start, pos_end)
+        return for_code
+
+    def compile_WhileNode(self, node):
+        condition_code = self.compile(node.condition_node)
+        body_code = self.compile(node.body_node)
+        condition_node = node.condition_node
+        should_return_null = node.should_return_null
+        pos_start, pos_end = node.pos_start, node.pos_end
+
+        def while_code(context):
+            elements = None if should_return_null else []
+
+            while True:
+                condition_value = condition_code(context)
+                if condition_value is None:
+                    raise Failure(RTError(
+                        condition_node.pos_start, condition_node.pos_end,
+                        'Conditional can not be evaluated',
+                        context
+                    ))
+
+                if not condition_value.is_true():
+                    break
+
+                try:
+                    value = body_code(context)
+                except LoopContinue:
+                    continue
+                except LoopBreak:
+                    break
+
+                if elements is not None:
+                    elements.append(value)
+
+            return None if should_return_null else List(elements).set_context(context).set_pos(pos_start, pos_end)
+        return while_code
+
+    def compile_RaiseNode(self, node):
+        # A None marks an argument that is not a string, which is only reported once the raise is reached
+        message_codes = [
+            self.compile(value) if isinstance(value, StringNode) else None
+            for value in node.error_to_raise.arg_nodes.values()
+        ]
+
+        def raise_code(context):
+            messages = []
+            for message_code in message_codes:
+                if message_code is None:
+                    raise Failure(operations.raise_message_error(node, context))
+                messages.append(message_code(context).value)
+
+            raise Failure(operations.raised_error(node, ", ".join(messages), context))
+        return raise_code
+
+    def compile_FuncDefNode(self, node):
+        func_name = node.func_name if node.func_name else None
+        body_node = node.body_node
+        outer_in_function, self.in_function = self.in_function, True
+        body_code = self.compile(body_node)
+        self.in_function = outer_in_function
+        arg_codes = [
+            (arg_name, None if arg_value is None else self.compile(arg_value))
+            for arg_name, arg_value in node.args
+        ]
+        should_auto_return = node.should_auto_return
+        slot_names = node.slot_names
+        pos_start, pos_end = node.pos_start, node.pos_end
+
+        def func_def_code(context):
+            args = [
+                (arg_name, None if arg_code is None else arg_code(context))
+                for arg_name, arg_code in arg_codes
+            ]
+
+            func_value = ClosureFunction(func_name, body_node, args, should_auto_return, slot_names, body_code, self).set_context(
+                context).set_module(context).set_pos(pos_start, pos_end)
+
+            if func_name:
+                context.symbol_table.set(func_name, func_value)
+
+            return func_value
+        return func_def_code
+
+    def compile_CallNode(self, node):
+        callee_code = self.compile(node.node_to_call)
+        arg_codes = [(arg_key, self.compile(arg_value)) for arg_key, arg_value in node.arg_nodes.items()]
+        is_tail_call = node.is_tail_call
+
+        def call_code(context):
+            if self.recursion_depth > operations.MAX_RECURSION_DEPTH:
+                raise Failure(operations.recursion_error(node, context))
+
+            # A function runs in the context it is called from, so the callee is the one value that is always positioned
+            value_to_call = operations.positioned(callee_code(context), node, context)
+            args = {arg_key: arg_code(context) for arg_key, arg_code in arg_codes}
+
+            # Compiled functions are called directly so that their signals keep going up the python stack - One in tail position
+            # is run by the function this call is in once it has returned, see ClosureFunction.call
+            if type(value_to_call) is ClosureFunction:
+                if is_tail_call:
+                    return TailCall(value_to_call, args)
+                return_value = value_to_call.call(args, self.recursion_depth)
+            else:
+                return_value = unwrap(value_to_call.execute(args, self.recursion_depth))
+            return return_value
+        return call_code
+
+    def compile_ReturnNode(self, node):
+        if not node.node_to_return:
+            # A redi without a value does not leave the function in the interpreter, so it only gives None
+            def bare_return_code(context):
+                return None
+            return bare_return_code
+
+        value_code = self.compile(node.node_to_return)
+
+        def return_code(context):
+            value = value_code(context)
+            if value is not None:
+                raise FunctionReturn(value)
+        return return_code
+
+    def compile_ContinueNode(self, node):
+        def continue_code(context):
+            raise LoopContinue()
+        return continue_code
+
+    def compile_BreakNode(self, node):
+        def break_code(context):
+            raise LoopBreak()
+        return break_code
+
+    def compile_PassNode(self, node):
+        def pass_code(context):
+            return None
+        return pass_code
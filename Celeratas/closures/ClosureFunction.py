@@ -0,0 +1,60 @@
+#####################################
+# IMPORTS
+#####################################
+
+from Celeratas.interpreter.signals import (Failure, FunctionReturn, TailCall,
+                                           capture)
+from Celeratas.interpreter.values import Function
+
+#####################################
+# CLOSURE FUNCTION
+#####################################
+
+
+class ClosureFunction(Function):
+    # A function whose body was compiled by the ClosureCompiler - It runs the compiled body instead of visiting the AST
+    __slots__ = ('body_code', 'compiler')
+
+    def __init__(self, name, body_node, arg_names, should_auto_return, slot_names, body_code, compiler):
+        super().__init__(name, body_node, arg_names, should_auto_return, slot_names)
+        self.body_code = body_code
+        self.compiler = compiler
+
+    def execute(self, args, recursion_depth):
+        # Only used when the function is called from outside of compiled code, which expects an RTResult
+        return capture(self.call, args, recursion_depth)
+
+    def call(self, args, recursion_depth):
+        function = self
+        caller_depth = self.compiler.recursion_depth
+        self.compiler.recursion_depth = recursion_depth + 1
+
+        # A call in tail position gives back the function to run next instead of running it inside of this one
+        try:
+            while True:
+                exec_ctx = function.generate_new_context()
+
+                res = function.check_and_populate_args(function.arg_names, args, exec_ctx)
+                if res.error:
+                    raise Failure(res.error)
+
+                try:
+                    value = function.body_code(exec_ctx)
+                    if not function.should_auto_return:
+                        value = None
+                except FunctionReturn as function_return:
+                    value = function_return.value
+
+                if type(value) is not TailCall:
+                    return value
+                function, args = value.function, value.args
+        finally:
+            self.compiler.recursion_depth = caller_depth
+
+    def copy(self):
+        copy = ClosureFunction(self.name, self.body_node, self.arg_names,
+                               self.should_auto_return, self.slot_names, self.body_code, self.compiler)
+        copy.module_table = self.module_table
+        copy.set_context(self.context)
+        copy.set_pos(self.pos_start, self.pos_end)
+        return copy
@@ -12,17 +12,24 @@ def show_error_loc(text, pos_start, pos_end):
     if idx_end < 0:
         idx_end = len(text)
 
+    # Lines and columns come from the line index of the file - The end is exclusive, so the last line is the one with the last character shown
+    ln_start, col_start = pos_start.source.line_col(pos_start.idx)
+    ln_end, col_end = ln_start, col_start
+    if pos_end.idx > pos_start.idx:
+        ln_end, col_end = pos_end.source.line_col(pos_end.idx - 1)
+        col_end += 1
+
     # Generate each line
-    line_count = pos_end.ln - pos_start.ln + 1
+    line_count = ln_end - ln_start + 1
     for i in range(line_count):
         # Calculate line columns
         line = text[idx_start:idx_end]
-        col_start = pos_start.col if i == 0 else 0
-        col_end = pos_end.col if i == line_count - 1 else len(line) - 1
+        line_col_start = col_start if i == 0 else 0
+        line_col_end = col_end if i == line_count - 1 else len(line) - 1
 
         # Append to result
         result += line + '\n'
-        result += ' ' * col_start + '^' * (col_end - col_start)
+        result += ' ' * line_col_start + '^' * (line_col_end - line_col_start)
 
         # Re-calculate indices
         idx_start = idx_end
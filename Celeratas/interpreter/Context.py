@@ -1,4 +1,7 @@
 class Context:
+    # Only the first context of a program or module is given the Runtime it runs in, see Runtime.new_context
+    runtime = None
+
     def __init__(self, display_name, parent=None, parent_entry_pos=None):
         self.display_name = display_name
         self.parent = parent
@@ -3,12 +3,13 @@
 #######################################
 
 import Celeratas.helper.tokens as toks
-from Celeratas.helper.errors import (AttrError, Error, IndexingError,
-                                     NamingError, RecursingError, RTError,
-                                     TypingError)
+import Celeratas.parser.nodes as nodes
+from Celeratas.helper.errors import RTError, TypingError
 from Celeratas.parser.nodes import StringNode
 
+from . import operations
 from .RTResult import RTResult
+from .signals import TailCall
 from .values import Bool, Dict, Function, List, Number, Numeral, String
 
 #######################################
@@ -17,13 +18,40 @@ from .values import Bool, Dict, Function, List, Number, Numeral, String
 
 
 class Interpreter:
+    # Maps node types to unbound visit methods - Each subclass gets its own table so it can add or override node types
+    dispatch_table = {}
+
     def __init__(self, recursion_depth):
         self.recursion_depth = recursion_depth
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.build_dispatch_table()
+
+    @classmethod
+    def build_dispatch_table(cls):
+        cls.dispatch_table = {}
+        for node_type in vars(nodes).values():
+            if isinstance(node_type, type) and node_type.__module__ == nodes.__name__:
+                cls.register_node_type(node_type)
+
+    @classmethod
+    def register_node_type(cls, node_type, method=None):
+        # If no method is given, it is looked up by name so that visit_<NodeName> methods are picked up automatically
+        if method is None:
+            method = getattr(cls, f'visit_{node_type.__name__}', None)
+        if method is not None:
+            cls.dispatch_table[node_type] = method
+        return method
+
     def visit(self, node, context):
-        method_name = f'visit_{type(node).__name__}'
-        method = getattr(self, method_name, self.no_visit_method)
-        return method(node, context)
+        method = self.dispatch_table.get(type(node))
+        if method is None:
+            # Node types created after the table was built (e.g. by plugins) are resolved once and then cached
+            method = self.register_node_type(type(node))
+            if method is None:
+                return self.no_visit_method(node, context)
+        return method(self, node, context)
 
     def no_visit_method(self, node, context):
         raise Exception(f'No visit_{type(node).__name__} method defined')
@@ -31,10 +59,7 @@ class Interpreter:
     ###################################
 
     def visit_NumberNode(self, node, context):
-        return RTResult().success(
-            Number(node.value).set_context(
-                context).set_pos(node.pos_start, node.pos_end)
-        )
+        return RTResult().success(Number.make(node.value))
 
     def visit_NumeralNode(self, node, context):
         return RTResult().success(
@@ -63,10 +88,7 @@ class Interpreter:
         )
 
     def visit_BoolNode(self, node, context):
-        return RTResult().success(
-            Bool(node.value == "Verus").set_context(
-                context).set_pos(node.pos_start, node.pos_end)
-        )
+        return RTResult().success(Bool.make(node.value == "Verus"))
 
     def visit_ListNode(self, node, context):
         res = RTResult()
@@ -103,101 +125,37 @@ class Interpreter:
     def visit_VarAccessNode(self, node, context):
         res = RTResult()
         var_name_to_get = node.var_name_to_get
-        value = context.symbol_table.get(var_name_to_get)
-        idxes_to_get = node.idxes_to_get
-        attrs_to_get = node.attrs_to_get
+        symbol_table = context.symbol_table
+        # Outside of a function call there is only the one table to look in
+        if symbol_table.global_table is None:
+            value = symbol_table.get(var_name_to_get)
+        else:
+            value = operations.load_variable(node, context)
 
         if not value:
-            return res.failure(NamingError(
-                node.pos_start, node.pos_end,
-                f"'{var_name_to_get}' is not defined",
-                context
-            ))
-
-        value = value.copy().set_pos(node.pos_start, node.pos_end).set_context(context)
+            return res.failure(operations.undefined_variable(var_name_to_get, node, context))
 
         # Check if it is not here before loop because it won't check a value that is from an index
-        if idxes_to_get and not isinstance(value, List) and not isinstance(value, Dict) and not isinstance(value, String):
-            return res.failure(IndexingError(
-                node.pos_start, node.pos_end,
-                "Can only get idx of list, dict, or string",
-                context
-            ))
+        if node.idxes_to_get:
+            error = operations.check_indexable(value, node, context)
+            if error:
+                return res.failure(error)
 
-        for idx_to_get in idxes_to_get:
+        for idx_to_get in node.idxes_to_get:
+            # need to get the value of the RTResult and then the Number class
             idx_to_get = res.register(self.visit(idx_to_get, context))
-            idx_to_get = idx_to_get.value
+            if res.should_return():
+                return res
 
-            # need to get the value of the RTResult and then the Number class
-            # Check if list:
-            if isinstance(value, List):
-                if not isinstance(idx_to_get, int):
-                    return res.failure(IndexingError(
-                        node.pos_start, node.pos_end,
-                        'List index must be an int',
-                        context
-                    ))
-                # If first statement is false, second will not evaluate
-                if isinstance(value.elements, list) and idx_to_get < len(value.elements):
-                    value.elements = value.elements[idx_to_get]
-                    # If list in list:
-                    if isinstance(value.elements, List):
-                        value.elements = value.elements.elements
-                    else:
-                        value = value.elements
-                else:
-                    return res.failure(IndexingError(
-                        node.pos_start, node.pos_end,
-                        'List index out of bounds',
-                        context
-                    ))
-            elif isinstance(value, Dict):
-                found = False
-
-                for key in value.key_pairs:
-                    if key == idx_to_get:
-                        value = value.key_pairs[key]
-                        found = True
-                        break
-
-                if not found:
-                    return res.failure(IndexingError(
-                        node.pos_start, node.pos_end,
-                        'Dict index out of bounds',
-                        context
-                    ))
-            elif isinstance(value, String):
-                if not isinstance(idx_to_get, int):
-                    return res.failure(IndexingError(
-                        node.pos_start, node.pos_end,
-                        'String index must be an int',
-                        context
-                    ))
-                if idx_to_get < len(value.value):
-                    value.value = value.value[idx_to_get]
-                else:
-                    return res.failure(IndexingError(
-                        node.pos_start, node.pos_end,
-                        'String index out of bounds',
-                        context
-                    ))
-            else:
-                return res.failure(TypingError(
-                    node.pos_start, node.pos_end,
-                    'Index out of bounds',
-                    context
-                ))
+            value, error = operations.get_index(value, idx_to_get, node, context)
+            if error:
+                return res.failure(error)
 
-        for attr_to_get in attrs_to_get:
-            value_attr = value.attributes.get(attr_to_get, None)
-            if value_attr is None:
-                return res.failure(AttrError(
-                    node.pos_start, node.pos_end,
-                    f"'{var_name_to_get}' does not have the attribute '{attr_to_get}'",
-                    context
-                ))
+        for attr_to_get in node.attrs_to_get:
+            value, error = operations.get_attribute(value, attr_to_get, node, context)
+            if error:
+                return res.failure(error)
 
-            value = value_attr
         return res.success(value)
 
     def visit_VarAssignNode(self, node, context):
@@ -211,7 +169,8 @@ class Interpreter:
                 context
             ))
 
-        for var, value in zip(node.vars_to_set, node.values_to_set):
+        slots = node.slots or [None] * len(node.vars_to_set)
+        for var, value, slot in zip(node.vars_to_set, node.values_to_set, slots):
             value = res.register(self.visit(value, context))
             var_name = var[0]
             idxes_to_change = var[1]
@@ -220,72 +179,42 @@ class Interpreter:
                 return res
 
             if idxes_to_change:
-                if var_name not in context.symbol_table.symbols:
-                    return res.failure(NamingError(
-                        node.pos_start, node.pos_end,
-                        f"'{var_name}' is not defined",
-                        context
-                    ))
+                if not operations.is_defined_here(var_name, slot, context):
+                    return res.failure(operations.undefined_variable(var_name, node, context))
 
                 var_to_change = context.symbol_table.get(var_name)
 
-                element_to_change = var_to_change
-
-                for for_idx, idx_to_change in enumerate(idxes_to_change):
+                idx_values = []
+                for idx_to_change in idxes_to_change:
                     idx_to_change = res.register(self.visit(idx_to_change, context))
-                    idx_to_change = idx_to_change.value
-
-                    if isinstance(element_to_change, List):
-                        if idx_to_change > len(element_to_change.elements) - 1:
-                            return res.failure(IndexingError(
-                                node.pos_start, node.pos_end,
-                                'List index out of bounds',
-                                context
-                            ))
-                        if for_idx == len(idxes_to_change) - 1:
-                            element_to_change.elements[idx_to_change] = value
-                        else:
-                            element_to_change = element_to_change.elements[idx_to_change]
-                    elif isinstance(element_to_change, Dict) or (hasattr(element_to_change, "elements") and isinstance(element_to_change.elements, Dict)):
-                        if for_idx == len(idxes_to_change) - 1:
-                            element_to_change.key_pairs[idx_to_change] = value
-                        else:
-                            element_to_change = element_to_change.key_pairs[idx_to_change]
-                    else:
-                        return res.failure(IndexingError(
-                            node.pos_start, node.pos_end,
-                            f'Variable must be a list or dict not \'{type(element_to_change).__name__}\' in order to set a specific index',
-                            context
-                        ))
+                    if res.should_return():
+                        return res
+                    idx_values.append(idx_to_change)
+
+                error = operations.set_index(var_to_change, idx_values, value, node, context)
+                if error:
+                    return res.failure(error)
 
                 value = var_to_change
 
-            if assign_type.type != "EQ":
-                error = None
-                old_value = context.symbol_table.get(var_name)
+            if assign_type.type != toks.TT_EQ:
+                if slot is None:
+                    old_value = context.symbol_table.get(var_name)
+                else:
+                    old_value = context.symbol_table.get_local(slot, var_name)
 
                 if old_value is None:
-                    return res.failure(NamingError(
-                        node.pos_start, node.pos_end,
-                        f"'{var_name}' is not defined",
-                        context
-                    ))
-
-                if assign_type.type == "PLUS_EQ":
-                    value, error = old_value.added_to(value)
-                elif assign_type.type == "MIN_EQ":
-                    value, error = old_value.subbed_by(value)
-                elif assign_type.type == "MUL_EQ":
-                    value, error = old_value.multed_by(value)
-                elif assign_type.type == "DIV_EQ":
-                    value, error = old_value.dived_by(value)
-                elif assign_type.type == "MOD_EQ":
-                    value, error = old_value.moded_by(value)
+                    return res.failure(operations.undefined_variable(var_name, node, context))
 
+                new_value, error = operations.augmented_assignment(assign_type, old_value, value)
                 if error:
-                    return res.failure(error)
+                    return res.failure(operations.augmented_error(assign_type, old_value, value, node, context))
+                value = new_value
 
-            context.symbol_table.set(var_name, value)
+            if slot is None:
+                context.symbol_table.set(var_name, value)
+            else:
+                context.symbol_table.slots[slot] = value
 
         return res.success(None)
 
@@ -328,7 +257,8 @@ class Interpreter:
             result, error = left.ored_by(right)
 
         if error:
-            return res.failure(error)
+            operation = operations.BINARY_OPERATIONS[operations.operator_key(node.op_tok)]
+            return res.failure(operations.binary_error(operation, left, right, node, context))
         else:
             return res.success(result.set_pos(node.pos_start, node.pos_end))
 
@@ -338,15 +268,17 @@ class Interpreter:
         if res.should_return():
             return res
 
+        operand = number
         error = None
 
         if node.op_tok.type == toks.TT_MINUS:
-            number, error = number.multed_by(Number(-1))
+            number, error = number.multed_by(Number.make(-1))
         elif node.op_tok.matches(toks.TT_KEYWORD, 'non'):
             number, error = number.notted()
 
         if error:
-            return res.failure(error)
+            operation = operations.UNARY_OPERATIONS[operations.operator_key(node.op_tok)]
+            return res.failure(operations.unary_error(operation, operand, node, context))
         else:
             return res.success(number.set_pos(node.pos_start, node.pos_end))
 
@@ -359,11 +291,7 @@ class Interpreter:
                 return res
 
             if condition_value is None:
-                return res.failure(RTError(
-                    node.pos_start, node.pos_end,
-                    'Conditional can not be evaluated',
-                    context
-                ))
+                return res.failure(operations.empty_condition(node, context))
 
             if condition_value.is_true():
                 expr_value = res.register(self.visit(expr, context))
@@ -384,35 +312,33 @@ class Interpreter:
         res = RTResult()
         try_body = self.visit(node.try_body, context)
 
-        if node.except_name and node.except_name.value not in ["Exception", "TypeError", "NameError", "IndexError", "ZeroDivisionError"]:
-            return res.failure(NamingError(
-                node.except_name.pos_start, node.except_name.pos_end,
-                'Exception type not supported',
-                context
-            ))
+        error = operations.check_except_name(node.except_name, context)
+        if error:
+            return res.failure(error)
 
-        should_except = not node.except_name or node.except_name.value == "Exception" or try_body.error.error_name == node.except_name.value
-        if try_body.error and node.except_body and should_except:
+        value = None
+        if try_body.error and node.except_body and operations.should_except(node.except_name, try_body.error):
             if node.except_as:
                 context.symbol_table.set(
                     node.except_as.value, String(try_body.error.details))
 
             res.register(self.visit(node.except_body, context))
-            if res.error:
+            if res.should_return():
                 return res
 
             if node.except_as:
                 context.symbol_table.remove(node.except_as.value)
         elif try_body.error is None:
-            try_body = res.register(try_body)
-            if res.error:
+            value = res.register(try_body)
+            if res.should_return():
                 return res
 
-        return res.success(None if node.should_return_null else try_body)
+        return res.success(None if node.should_return_null else value)
 
     def visit_ForNode(self, node, context):
         res = RTResult()
-        elements = []
+        # The values of the body are only kept when the loop gives them
+        elements = None if node.should_return_null else []
 
         start_value = res.register(self.visit(node.start_value_node, context))
         if res.should_return():
@@ -428,7 +354,7 @@ class Interpreter:
             if res.should_return():
                 return res
         else:
-            step_value = Number(1)
+            step_value = Number.make(1)
 
         if start_value is None:
             return res.failure(RTError(
@@ -437,30 +363,28 @@ class Interpreter:
                 context
             ))
 
-        i = start_value.value
-
-        if step_value.value >= 0:
-            def condition():
-                return i < end_value.value
-        else:
-            def condition():
-                return i > end_value.value
+        symbol_table = context.symbol_table
+        slots = symbol_table.slots if node.var_slot is not None else None
+        var_name, var_slot, body_node = node.var_name, node.var_slot, node.body_node
+        # The body is the same node every time around, so its visit method is only looked up once
+        visit_body = self.dispatch_table.get(type(body_node)) or type(self).visit
 
-        while condition():
-            context.symbol_table.set(node.var_name, Number(i))
-            i += step_value.value
+        for number in operations.loop_numbers(start_value.value, end_value.value, step_value.value):
+            if slots is None:
+                symbol_table.set(var_name, number)
+            else:
+                slots[var_slot] = number
 
-            value = res.register(self.visit(node.body_node, context))
-            if res.should_return() and res.loop_should_continue and res.loop_should_break:
+            value = res.register(visit_body(self, body_node, context))
+            if res.should_return():
+                if res.loop_should_continue:
+                    continue
+                if res.loop_should_break:
+                    break
                 return res
 
-            if res.loop_should_continue:
-                continue
-
-            if res.loop_should_break:
-                break
-
-            elements.append(value)
+            if elements is not None:
+                elements.append(value)
 
         return res.success(
             None if node.should_return_null else
@@ -470,7 +394,7 @@ class Interpreter:
 
     def visit_WhileNode(self, node, context):
         res = RTResult()
-        elements = []
+        elements = None if node.should_return_null else []
 
         while True:
             condition_value = res.register(
@@ -489,7 +413,7 @@ class Interpreter:
                 break
 
             value = res.register(self.visit(node.body_node, context))
-            if res.should_return() and res.loop_should_continue and res.loop_should_break:
+            if res.should_return() and not res.loop_should_continue and not res.loop_should_break:
                 return res
 
             if res.loop_should_continue:
@@ -498,7 +422,8 @@ class Interpreter:
             if res.loop_should_break:
                 break
 
-            elements.append(value)
+            if elements is not None:
+                elements.append(value)
 
         return res.success(
             None if node.should_return_null else
@@ -508,20 +433,12 @@ class Interpreter:
 
     def visit_RaiseNode(self, node, context):
         res = RTResult()
-        # For pos_start and pos_end if error
-        error_to_raise = node.error_to_raise
-
-        error_name = node.error_to_raise.node_to_call.var_name_to_get
         error_message = node.error_to_raise.arg_nodes
         error_message_string = ""
 
         for idx, value in enumerate(error_message.values()):
             if not isinstance(value, StringNode):
-                return res.failure(RTError(
-                    error_to_raise.pos_start, error_to_raise.pos_end,
-                    'Argument to Exception must be a string',
-                    context
-                ))
+                return res.failure(operations.raise_message_error(node, context))
 
             # Two dot values bc need to unpack RTResult and Interpreter String Class
             value = self.visit_StringNode(value, context).value.value
@@ -530,14 +447,7 @@ class Interpreter:
             if idx < len(error_message) - 1:
                 error_message_string += ", "
 
-        if error_name not in ["Exception", "TypeError", "NameError", "IndexError", "ZeroDivisionError"]:
-            return res.failure(Error(
-                error_to_raise.pos_start, error_to_raise.pos_end,
-                'Exception type not supported',
-                context
-            ))
-
-        return res.failure(Error(error_to_raise.pos_start, error_to_raise.pos_end, error_name, error_message_string))
+        return res.failure(operations.raised_error(node, error_message_string, context))
 
     def visit_FuncDefNode(self, node, context):
         res = RTResult()
@@ -554,8 +464,8 @@ class Interpreter:
                     return res
                 args.append((arg_name, arg_value))
 
-        func_value = Function(func_name, body_node, args, node.should_auto_return).set_context(
-            context).set_pos(node.pos_start, node.pos_end)
+        func_value = Function(func_name, body_node, args, node.should_auto_return, node.slot_names).set_context(
+            context).set_module(context).set_pos(node.pos_start, node.pos_end)
 
         if node.func_name:
             context.symbol_table.set(func_name, func_value)
@@ -563,12 +473,8 @@ class Interpreter:
         return res.success(func_value)
 
     def visit_CallNode(self, node, context):
-        if self.recursion_depth > 100:
-            return RTResult().failure(RecursingError(
-                node.pos_start, node.pos_end,
-                'Recursion depth exceeded',
-                context
-            ))
+        if self.recursion_depth > operations.MAX_RECURSION_DEPTH:
+            return RTResult().failure(operations.recursion_error(node, context))
 
         res = RTResult()
         args = {}
@@ -576,7 +482,8 @@ class Interpreter:
         value_to_call = res.register(self.visit(node.node_to_call, context))
         if res.should_return():
             return res
-        value_to_call = value_to_call.copy().set_pos(node.pos_start, node.pos_end)
+        # A function runs in the context it is called from, so the callee is the one value that is always positioned
+        value_to_call = operations.positioned(value_to_call, node, context)
 
         for arg_key, arg_value in node.arg_nodes.items():
             arg_value = res.register(self.visit(arg_value, context))
@@ -585,14 +492,13 @@ class Interpreter:
 
             args[arg_key] = arg_value
 
+        # The function this call is in runs the callee once it has returned, see Function.execute
+        if node.is_tail_call and type(value_to_call) is Function:
+            return res.success(TailCall(value_to_call, args))
+
         return_value = res.register(value_to_call.execute(args, self.recursion_depth))
         if res.should_return():
             return res
-        if return_value is None:
-            return res.success(None)
-
-        return_value = return_value.copy().set_pos(
-            node.pos_start, node.pos_end).set_context(context)
         return res.success(return_value)
 
     def visit_ReturnNode(self, node, context):
@@ -615,3 +521,6 @@ class Interpreter:
 
     def visit_PassNode(self, node, context):
         return RTResult().success(None)
+
+
+Interpreter.build_dispatch_table()
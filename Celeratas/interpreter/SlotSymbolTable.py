@@ -0,0 +1,49 @@
+#######################################
+# IMPORTS
+#######################################
+
+from Celeratas.interpreter.SymbolTable import SymbolTable
+
+#######################################
+# SLOT SYMBOL TABLE
+#######################################
+
+
+class SlotSymbolTable(SymbolTable):
+    # The symbol table of a function call - Its locals live in a fixed size list of slots so they can be reached by index
+    # Lookups by name still work, callees see the locals of their caller because functions are dynamically scoped
+    def __init__(self, slot_names, slots, parent=None):
+        # One of these is made for every call, so the attributes of SymbolTable are set here instead of through super()
+        self.symbols = {}
+        self.parent = parent
+        self.slot_names = slot_names
+        self.slots = slots
+        # The first table above the calls is the one of the program, names the Resolver marked as global are read from it directly
+        self.global_table = parent.global_table if isinstance(parent, SlotSymbolTable) else parent
+
+    def get(self, name):
+        slot = self.slot_names.get(name)
+        if slot is None:
+            return super().get(name)
+        return self.get_local(slot, name)
+
+    def get_local(self, slot, name):
+        # A slot that was not set yet still falls back to the caller, the name might be one of its variables
+        value = self.slots[slot]
+        if value is None and self.parent:
+            return self.parent.get(name)
+        return value
+
+    def set(self, name, value):
+        slot = self.slot_names.get(name)
+        if slot is None:
+            self.symbols[name] = value
+        else:
+            self.slots[slot] = value
+
+    def remove(self, name):
+        slot = self.slot_names.get(name)
+        if slot is None:
+            del self.symbols[name]
+        else:
+            self.slots[slot] = None
@@ -1,4 +1,7 @@
 class SymbolTable:
+    # Only the tables of function calls know where the globals are, see SlotSymbolTable
+    global_table = None
+
     def __init__(self, parent=None):
         self.symbols = {}
         self.parent = parent
@@ -27,3 +27,5 @@ BuiltInFunction.extend = BuiltInFunction("extend")
 BuiltInFunction.len = BuiltInFunction("len")
 BuiltInFunction.split = BuiltInFunction("split")
 BuiltInFunction.run = BuiltInFunction("run")
+# import is a keyword in python
+BuiltInFunction.import_ = BuiltInFunction("import")
@@ -0,0 +1,381 @@
+#######################################
+# IMPORTS
+#######################################
+
+import sys
+
+import Celeratas.helper.tokens as toks
+from Celeratas.helper.errors import (AttrError, Error, IndexingError,
+                                     NamingError, RecursingError, RTError,
+                                     TypingError)
+from Celeratas.parser.Resolver import ENCLOSING, GLOBAL, LOCAL, Resolver
+
+from .values import Dict, List, Number, String
+
+#######################################
+# OPERATORS
+#######################################
+
+# Shared by every backend so that an operator token only has to be resolved once, when the code is compiled
+
+BINARY_OPERATIONS = {
+    toks.TT_PLUS: lambda left, right: left.added_to(right),
+    toks.TT_MINUS: lambda left, right: left.subbed_by(right),
+    toks.TT_MUL: lambda left, right: left.multed_by(right),
+    toks.TT_DIV: lambda left, right: left.dived_by(right),
+    toks.TT_MOD: lambda left, right: left.moded_by(right),
+    toks.TT_POW: lambda left, right: left.powed_by(right),
+    toks.TT_EE: lambda left, right: left.get_comparison_eq(right),
+    toks.TT_NE: lambda left, right: left.get_comparison_ne(right),
+    toks.TT_LT: lambda left, right: left.get_comparison_lt(right),
+    toks.TT_GT: lambda left, right: left.get_comparison_gt(right),
+    toks.TT_LTE: lambda left, right: left.get_comparison_lte(right),
+    toks.TT_GTE: lambda left, right: left.get_comparison_gte(right),
+    (toks.TT_KEYWORD, 'et'): lambda left, right: left.anded_by(right),
+    (toks.TT_KEYWORD, 'aut'): lambda left, right: left.ored_by(right),
+}
+
+UNARY_OPERATIONS = {
+    toks.TT_MINUS: lambda value: value.multed_by(Number.make(-1)),
+    toks.TT_PLUS: lambda value: (value, None),
+    (toks.TT_KEYWORD, 'non'): lambda value: value.notted(),
+}
+
+AUGMENTED_OPERATIONS = {
+    toks.TT_PLUS_EQ: BINARY_OPERATIONS[toks.TT_PLUS],
+    toks.TT_MIN_EQ: BINARY_OPERATIONS[toks.TT_MINUS],
+    toks.TT_MUL_EQ: BINARY_OPERATIONS[toks.TT_MUL],
+    toks.TT_DIV_EQ: BINARY_OPERATIONS[toks.TT_DIV],
+    toks.TT_MOD_EQ: BINARY_OPERATIONS[toks.TT_MOD],
+}
+
+SUPPORTED_EXCEPTIONS = ["Exception", "TypeError", "NameError", "IndexError", "ZeroDivisionError"]
+
+
+def operator_key(op_tok):
+    # Keyword operators share a token type, so they are keyed by their value as well
+    if op_tok.type == toks.TT_KEYWORD:
+        return (op_tok.type, op_tok.value)
+    return op_tok.type
+
+#######################################
+# POSITIONS
+#######################################
+
+# Reading a variable gives the value that is stored, not a copy of it, so a value doesn't know where it is being used
+# The position and context of the node are only put on a copy when they are needed, for a call or for an error
+
+
+def positioned(value, node, context):
+    return value.copy().set_pos(node.pos_start, node.pos_end).set_context(context)
+
+
+def binary_error(operation, left, right, node, context):
+    # Operations never change their operands, so running one again on positioned copies gives the same error
+    _, error = operation(positioned(left, node.left_node, context), positioned(right, node.right_node, context))
+    return error
+
+
+def unary_error(operation, value, node, context):
+    _, error = operation(positioned(value, node.node, context))
+    return error
+
+#######################################
+# INDEXING
+#######################################
+
+
+def get_index(value, idx_to_get, node, context):
+    # idx_to_get is the value the index evaluated to, lists, dicts and strings are all indexed with its python value
+    idx_to_get = Dict.key(idx_to_get)
+
+    if isinstance(value, List):
+        if not isinstance(idx_to_get, int):
+            return None, IndexingError(
+                node.pos_start, node.pos_end,
+                'List index must be an int',
+                context
+            )
+        if idx_to_get >= len(value.elements):
+            return None, IndexingError(
+                node.pos_start, node.pos_end,
+                'List index out of bounds',
+                context
+            )
+
+        return value.elements[idx_to_get], None
+
+    elif isinstance(value, Dict):
+        # Entries are never None, so one lookup tells if the key is there and gets its value
+        entry = value.key_pairs.get(idx_to_get)
+        if entry is not None:
+            return entry, None
+
+        return None, missing_key(idx_to_get, node, context)
+
+    elif isinstance(value, String):
+        if not isinstance(idx_to_get, int):
+            return None, IndexingError(
+                node.pos_start, node.pos_end,
+                'String index must be an int',
+                context
+            )
+        if idx_to_get >= len(value.value):
+            return None, IndexingError(
+                node.pos_start, node.pos_end,
+                'String index out of bounds',
+                context
+            )
+        return String(value.value[idx_to_get]).set_pos(node.pos_start, node.pos_end).set_context(context), None
+
+    return None, TypingError(
+        node.pos_start, node.pos_end,
+        'Index out of bounds',
+        context
+    )
+
+
+def missing_key(key, node, context):
+    if key is None:
+        return IndexingError(
+            node.pos_start, node.pos_end,
+            'Dict key must be a number, numeral, string or bool',
+            context
+        )
+    return IndexingError(
+        node.pos_start, node.pos_end,
+        'Dict index out of bounds',
+        context
+    )
+
+
+def check_indexable(value, node, context):
+    if not isinstance(value, List) and not isinstance(value, Dict) and not isinstance(value, String):
+        return IndexingError(
+            node.pos_start, node.pos_end,
+            "Can only get idx of list, dict, or string",
+            context
+        )
+    return None
+
+
+def get_attribute(value, attr_to_get, node, context):
+    value_attr = value.attributes.get(attr_to_get, None)
+    if value_attr is None:
+        return None, AttrError(
+            node.pos_start, node.pos_end,
+            f"'{node.var_name_to_get}' does not have the attribute '{attr_to_get}'",
+            context
+        )
+    return value_attr, None
+
+
+def undefined_variable(var_name, node, context):
+    return NamingError(
+        node.pos_start, node.pos_end,
+        f"'{var_name}' is not defined",
+        context
+    )
+
+#######################################
+# VARIABLES
+#######################################
+
+
+def load_variable(node, context):
+    # Goes straight to the scope the Resolver found - Trees that were not resolved look the name up in every table
+    symbol_table = context.symbol_table
+    var_name = node.var_name_to_get
+
+    if node.scope == LOCAL:
+        value = symbol_table.slots[node.slot]
+        if value is None:
+            # Not set in this call yet, so it might be a variable of the caller
+            return symbol_table.get_local(node.slot, var_name)
+        return value
+    if node.scope == ENCLOSING:
+        return symbol_table.parent.get(var_name)
+    if node.scope == GLOBAL:
+        return load_global(var_name, symbol_table)
+    return symbol_table.get(var_name)
+
+
+def load_global(var_name, symbol_table):
+    # The tables of the callers are skipped, which matters in a deep recursion where there are as many of them as calls
+    if symbol_table.global_table is not None and var_name not in Resolver.local_names:
+        return symbol_table.global_table.get(var_name)
+    return symbol_table.get(var_name)
+
+
+def is_defined_here(var_name, slot, context):
+    # Only the current table counts, an index can't be set on a variable of the caller
+    if slot is None:
+        return var_name in context.symbol_table.symbols
+    return context.symbol_table.slots[slot] is not None
+
+#######################################
+# ASSIGNMENT
+#######################################
+
+
+def set_index(var_to_change, idxes_to_change, value, node, context):
+    element_to_change = var_to_change
+
+    for for_idx, idx_to_change in enumerate(idxes_to_change):
+        is_last = for_idx == len(idxes_to_change) - 1
+        idx_to_change = Dict.key(idx_to_change)
+
+        if isinstance(element_to_change, List):
+            if not isinstance(idx_to_change, int):
+                return IndexingError(
+                    node.pos_start, node.pos_end,
+                    'List index must be an int',
+                    context
+                )
+            if idx_to_change > len(element_to_change.elements) - 1:
+                return IndexingError(
+                    node.pos_start, node.pos_end,
+                    'List index out of bounds',
+                    context
+                )
+            if is_last:
+                element_to_change.elements[idx_to_change] = value
+            else:
+                element_to_change = element_to_change.elements[idx_to_change]
+        elif isinstance(element_to_change, Dict):
+            if idx_to_change is None:
+                return missing_key(idx_to_change, node, context)
+            if is_last:
+                element_to_change.key_pairs[idx_to_change] = value
+            else:
+                entry = element_to_change.key_pairs.get(idx_to_change)
+                if entry is None:
+                    return missing_key(idx_to_change, node, context)
+                element_to_change = entry
+        else:
+            return IndexingError(
+                node.pos_start, node.pos_end,
+                f'Variable must be a list or dict not \'{type(element_to_change).__name__}\' in order to set a specific index',
+                context
+            )
+
+    return None
+
+
+def augmented_assignment(assign_type, old_value, value):
+    return AUGMENTED_OPERATIONS[assign_type.type](old_value, value)
+
+
+def augmented_error(assign_type, old_value, value, node, context):
+    # The value that is assigned doesn't always come from a node of its own, so the error points at the whole assignment
+    _, error = AUGMENTED_OPERATIONS[assign_type.type](positioned(old_value, node, context), positioned(value, node, context))
+    return error
+
+#######################################
+# EXCEPTIONS
+#######################################
+
+
+def check_except_name(except_name, context):
+    if except_name and except_name.value not in SUPPORTED_EXCEPTIONS:
+        return NamingError(
+            except_name.pos_start, except_name.pos_end,
+            'Exception type not supported',
+            context
+        )
+    return None
+
+
+def should_except(except_name, error):
+    return not except_name or except_name.value == "Exception" or error.error_name == except_name.value
+
+
+def raised_error(node, error_message_string, context):
+    error_to_raise = node.error_to_raise
+    error_name = error_to_raise.node_to_call.var_name_to_get
+
+    if error_name not in SUPPORTED_EXCEPTIONS:
+        return NamingError(
+            error_to_raise.pos_start, error_to_raise.pos_end,
+            'Exception type not supported',
+            context
+        )
+
+    return Error(error_to_raise.pos_start, error_to_raise.pos_end, error_name, error_message_string)
+
+
+def raise_message_error(node, context):
+    error_to_raise = node.error_to_raise
+    return RTError(
+        error_to_raise.pos_start, error_to_raise.pos_end,
+        'Argument to Exception must be a string',
+        context
+    )
+
+
+def empty_condition(node, context):
+    return RTError(
+        node.pos_start, node.pos_end,
+        'Conditional can not be evaluated',
+        context
+    )
+
+#######################################
+# LOOPS
+#######################################
+
+
+def loop_numbers(start, end, step):
+    # The values a pro loop sets its variable to, from the values of its start, end and step - Every backend goes through
+    # this, so a loop of ints is counted by a python range instead of comparing and adding Numbers on every time around
+    # The counter is never read back from the variable, so setting the variable in the body doesn't change the loop
+    if type(start) is int and type(end) is int and type(step) is int and step != 0:
+        numbers = range(start, end, step)
+        if numbers and Number.cache_start <= min(numbers[0], numbers[-1]) and max(numbers[0], numbers[-1]) < Number.cache_end:
+            # Every number is already made, so none has to be made at all
+            return map(Number.cache.__getitem__, range(start - Number.cache_start, end - Number.cache_start, step))
+        return map(Number.make, numbers)
+    return counted_numbers(start, end, step)
+
+
+def counted_numbers(start, end, step):
+    # Floats, and a step of 0, which a range can't count - A step of 0 loops forever, like it always has
+    make, i = Number.make, start
+    if step >= 0:
+        while i < end:
+            number = make(i)
+            i += step
+            yield number
+    else:
+        while i > end:
+            number = make(i)
+            i += step
+            yield number
+
+#######################################
+# CALLS
+#######################################
+
+
+# Calls in the vm are frames in a list, the other backends go deeper in the python stack with every call - From 3.11 on a
+# python call only takes memory, not C stack, so python's recursion limit can go far higher without crashing the process
+DEFAULT_MAX_RECURSION_DEPTH = 10000 if sys.version_info >= (3, 11) else 1000
+MAX_RECURSION_DEPTH = DEFAULT_MAX_RECURSION_DEPTH
+
+# How many python frames a call can take in those backends, more than that when it is deep in an expression
+PYTHON_FRAMES_PER_CALL = 40
+
+
+def set_max_recursion_depth(depth):
+    # For the whole process, like python's own recursion limit, which is raised so that a program can reach the depth
+    global MAX_RECURSION_DEPTH
+    MAX_RECURSION_DEPTH = depth
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), depth * PYTHON_FRAMES_PER_CALL))
+
+
+def recursion_error(node, context):
+    return RecursingError(
+        node.pos_start, node.pos_end,
+        'Recursion depth exceeded',
+        context
+    )
@@ -0,0 +1,78 @@
+#######################################
+# IMPORTS
+#######################################
+
+from .RTResult import RTResult
+
+#######################################
+# SIGNALS
+#######################################
+
+# Backends that return values directly can't hand back an RTResult from every node, so anything that leaves a node early is raised
+# Only code that talks to the rest of the interpreter (builtins, run_script) converts between the two with capture and unwrap
+
+
+class Failure(Exception):
+    def __init__(self, error):
+        super().__init__(error.error_name)
+        self.error = error
+
+
+class LoopBreak(Exception):
+    pass
+
+
+class LoopContinue(Exception):
+    pass
+
+
+class FunctionReturn(Exception):
+    def __init__(self, value):
+        super().__init__()
+        self.value = value
+
+#######################################
+# TAIL CALLS
+#######################################
+
+
+class TailCall:
+    # What a call in tail position gives back instead of running the function (see analysis.tail_calls) - The function that is
+    # returning runs it next in its own loop, so a tail call doesn't take any more of the python stack than the function did
+    __slots__ = ('function', 'args')
+
+    def __init__(self, function, args):
+        self.function = function
+        self.args = args
+
+#######################################
+# CONVERSIONS
+#######################################
+
+
+def capture(function, *args):
+    # Runs code that raises signals and turns the outcome into an RTResult
+    res = RTResult()
+    try:
+        return res.success(function(*args))
+    except Failure as failure:
+        return res.failure(failure.error)
+    except LoopBreak:
+        return res.success_break()
+    except LoopContinue:
+        return res.success_continue()
+    except FunctionReturn as function_return:
+        return res.success_return(function_return.value)
+
+
+def unwrap(result):
+    # The reverse of capture: gives the value of an RTResult or raises whatever it was signalling
+    if result.error:
+        raise Failure(result.error)
+    if result.loop_should_break:
+        raise LoopBreak()
+    if result.loop_should_continue:
+        raise LoopContinue()
+    if result.func_return_value:
+        raise FunctionReturn(result.func_return_value)
+    return result.value
@@ -10,10 +10,21 @@ from .Value import Value
 
 
 class Bool(Value):
+    __slots__ = ('value',)
+
     def __init__(self, value):
         super().__init__()
         self.value = value
 
+    @classmethod
+    def make(cls, value):
+        # Every comparison gives Verus or Falsus, so those two are shared instead of made again each time
+        if value is True:
+            return cls.true
+        if value is False:
+            return cls.false
+        return cls(value)
+
     def copy(self):
         copy = Bool(self.value)
         copy.set_pos(self.pos_start, self.pos_end)
@@ -22,54 +33,54 @@ class Bool(Value):
 
     def get_comparison_eq(self, other):
         if isinstance(other, Bool):
-            return Bool(self.value == other.value).set_context(self.context), None
+            return Bool.make(self.value == other.value), None
         else:
             return None, Value.illegal_operation(self, other)
 
     def get_comparison_ne(self, other):
         if isinstance(other, Bool):
-            return Bool(self.value != other.value).set_context(self.context), None
+            return Bool.make(self.value != other.value), None
         else:
             return None, Value.illegal_operation(self, other)
 
     def get_comparison_lt(self, other):
         if isinstance(other, Bool):
-            return Bool(self.value < other.value).set_context(self.context), None
+            return Bool.make(self.value < other.value), None
         else:
             return None, Value.illegal_operation(self, other)
 
     def get_comparison_gt(self, other):
         if isinstance(other, Bool):
-            return Bool(self.value > other.value).set_context(self.context), None
+            return Bool.make(self.value > other.value), None
         else:
             return None, Value.illegal_operation(self, other)
 
     def get_comparison_lte(self, other):
         if isinstance(other, Bool):
-            return Bool(self.value <= other.value).set_context(self.context), None
+            return Bool.make(self.value <= other.value), None
         else:
             return None, Value.illegal_operation(self, other)
 
     def get_comparison_gte(self, other):
         if isinstance(other, Bool):
-            return Bool(self.value >= other.value).set_context(self.context), None
+            return Bool.make(self.value >= other.value), None
         else:
             return None, Value.illegal_operation(self, other)
 
     def anded_by(self, other):
         if isinstance(other, Bool):
-            return Bool(self.value and other.value).set_context(self.context), None
+            return Bool.make(self.value and other.value), None
         else:
             return None, Value.illegal_operation(self, other)
 
     def ored_by(self, other):
         if isinstance(other, Bool):
-            return Bool(self.value or other.value).set_context(self.context), None
+            return Bool.make(self.value or other.value), None
         else:
             return None, Value.illegal_operation(self, other)
 
     def notted(self):
-        return Bool(not self.value).set_context(self.context), None
+        return Bool.make(not self.value), None
 
     def is_true(self):
         return self.value
@@ -79,3 +90,7 @@ class Bool(Value):
 
     def __repr__(self):
         return str(self.value)
+
+
+Bool.true = Bool(True)
+Bool.false = Bool(False)
@@ -2,6 +2,9 @@
 # IMPORTS
 #######################################
 
+from .Bool import Bool
+from .Number import Number, Numeral
+from .String import String
 from .Value import Value
 
 #######################################
@@ -10,10 +13,21 @@ from .Value import Value
 
 
 class Dict(Value):
+    __slots__ = ('key_pairs',)
+
+    # The entries are kept under the python values of their keys, which hash and compare like the keys do
+    # So 1, 1.0 and the numeral I are the same key, as they are equal
+    KEY_TYPES = (Number, Numeral, String, Bool)
+
     def __init__(self, key_pairs):
         super().__init__()
         self.key_pairs = key_pairs
 
+    @classmethod
+    def key(cls, value):
+        # The python value an entry for value is kept under, or None when value can't be a key
+        return value.value if isinstance(value, cls.KEY_TYPES) else None
+
     def copy(self):
         copy = Dict(self.key_pairs)
         copy.set_pos(self.pos_start, self.pos_end)
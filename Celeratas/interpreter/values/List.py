@@ -10,6 +10,8 @@ from .Value import Value
 
 
 class List(Value):
+    __slots__ = ('elements',)
+
     def __init__(self, elements):
         super().__init__()
         self.elements = elements
@@ -0,0 +1,32 @@
+#######################################
+# IMPORTS
+#######################################
+
+from .Dict import Dict
+
+#######################################
+# MODULE
+#######################################
+
+
+class Module(Dict):
+    # What importa() returns - The globals of a script, which can be read as entries (m["f"]) or as attributes (m.f)
+    # The entries are the symbols of the table the script ran in, so a function of the module that sets a global changes them too
+    __slots__ = ('name', 'attributes')
+
+    def __init__(self, name, symbols):
+        super().__init__(symbols)
+        self.name = name
+        self.attributes = symbols
+
+    def copy(self):
+        copy = Module(self.name, self.key_pairs)
+        copy.set_pos(self.pos_start, self.pos_end)
+        copy.set_context(self.context)
+        return copy
+
+    def __str__(self):
+        return f"<module {self.name}>"
+
+    def __repr__(self):
+        return f"<module {self.name}>"
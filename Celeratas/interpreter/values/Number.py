@@ -14,25 +14,46 @@ from .Value import Value
 
 
 class Number(Value):
+    # Ints in this range are made once and shared by every loop and operation that gives them, see make
+    cache_start = -5
+    cache_end = 257
+    cache = []
+
+    __slots__ = ('value',)
+
     def __init__(self, value):
         super().__init__()
         self.value = value
 
+    @classmethod
+    def set_cache_range(cls, start, end):
+        cls.cache_start = start
+        cls.cache_end = end
+        cls.cache = [cls(value) for value in range(start, end)]
+
+    @classmethod
+    def make(cls, value):
+        # Positions and contexts are only read from positioned copies (see operations.positioned), so a cached number
+        # can be given to everything that needs it as long as no context is put on it - Only ints are cached, 2.0 stays a float
+        if type(value) is int and cls.cache_start <= value < cls.cache_end:
+            return cls.cache[value - cls.cache_start]
+        return cls(value)
+
     def added_to(self, other):
         if isinstance(other, Number) or isinstance(other, Numeral):
-            return Number(self.value + other.value).set_context(self.context), None
+            return Number.make(self.value + other.value), None
         else:
             return None, Value.illegal_operation(self, other)
 
     def subbed_by(self, other):
         if isinstance(other, Number) or isinstance(other, Numeral):
-            return Number(self.value - other.value).set_context(self.context), None
+            return Number.make(self.value - other.value), None
         else:
             return None, Value.illegal_operation(self, other)
 
     def multed_by(self, other):
         if isinstance(other, Number) or isinstance(other, Numeral):
-            return Number(self.value * other.value).set_context(self.context), None
+            return Number.make(self.value * other.value), None
         else:
             return None, Value.illegal_operation(self, other)
 
@@ -45,72 +66,72 @@ class Number(Value):
                     self.context
                 )
 
-            return Number(self.value / other.value).set_context(self.context), None
+            return Number.make(self.value / other.value), None
         else:
             return None, Value.illegal_operation(self, other)
 
     def moded_by(self, other):
         if isinstance(other, Number) or isinstance(other, Numeral):
-            return Number(self.value % other.value).set_context(self.context), None
+            return Number.make(self.value % other.value), None
         else:
             return None, Value.illegal_operation(self, other)
 
     def powed_by(self, other):
         if isinstance(other, Number) or isinstance(other, Numeral):
-            return Number(self.value ** other.value).set_context(self.context), None
+            return Number.make(self.value ** other.value), None
         else:
             return None, Value.illegal_operation(self, other)
 
     def get_comparison_eq(self, other):
         if isinstance(other, Number) or isinstance(other, Numeral):
-            return Bool(self.value == other.value).set_context(self.context), None
+            return Bool.make(self.value == other.value), None
         else:
             return None, Value.illegal_operation(self, other)
 
     def get_comparison_ne(self, other):
         if isinstance(other, Number) or isinstance(other, Numeral):
-            return Bool(self.value != other.value).set_context(self.context), None
+            return Bool.make(self.value != other.value), None
         else:
             return None, Value.illegal_operation(self, other)
 
     def get_comparison_lt(self, other):
         if isinstance(other, Number) or isinstance(other, Numeral):
-            return Bool(self.value < other.value).set_context(self.context), None
+            return Bool.make(self.value < other.value), None
         else:
             return None, Value.illegal_operation(self, other)
 
     def get_comparison_gt(self, other):
         if isinstance(other, Number) or isinstance(other, Numeral):
-            return Bool(self.value > other.value).set_context(self.context), None
+            return Bool.make(self.value > other.value), None
         else:
             return None, Value.illegal_operation(self, other)
 
     def get_comparison_lte(self, other):
         if isinstance(other, Number) or isinstance(other, Numeral):
-            return Bool(self.value <= other.value).set_context(self.context), None
+            return Bool.make(self.value <= other.value), None
         else:
             return None, Value.illegal_operation(self, other)
 
     def get_comparison_gte(self, other):
         if isinstance(other, Number) or isinstance(other, Numeral):
-            return Bool(self.value >= other.value).set_context(self.context), None
+            return Bool.make(self.value >= other.value), None
         else:
             return None, Value.illegal_operation(self, other)
 
     def anded_by(self, other):
         if isinstance(other, Number) or isinstance(other, Numeral):
-            return Number(self.value and other.value).set_context(self.context), None
+            return Number.make(self.value and other.value), None
         else:
             return None, Value.illegal_operation(self, other)
 
     def ored_by(self, other):
         if isinstance(other, Number) or isinstance(other, Numeral):
-            return Number(self.value or other.value).set_context(self.context), None
+            return Number.make(self.value or other.value), None
         else:
             return None, Value.illegal_operation(self, other)
 
     def notted(self):
-        return Bool(self.value == 0).set_context(self.context), None
+        return Bool.make(self.value == 0), None
 
     def copy(self):
         copy = Number(self.value)
@@ -127,12 +148,17 @@ class Number(Value):
     def __repr__(self):
         return str(self.value)
 
+
+Number.set_cache_range(Number.cache_start, Number.cache_end)
+
 #######################################
 # NUMERAL
 #######################################
 
 
 class Numeral(Value):
+    __slots__ = ('value',)
+
     def __init__(self, value):
         super().__init__()
         self.value = value
@@ -176,54 +202,54 @@ class Numeral(Value):
 
     def get_comparison_eq(self, other):
         if isinstance(other, Numeral) or isinstance(other, Number):
-            return Bool(self.value == other.value).set_context(self.context), None
+            return Bool.make(self.value == other.value), None
         else:
             return None, Value.illegal_operation(self, other)
 
     def get_comparison_ne(self, other):
         if isinstance(other, Numeral) or isinstance(other, Number):
-            return Bool(self.value != other.value).set_context(self.context), None
+            return Bool.make(self.value != other.value), None
         else:
             return None, Value.illegal_operation(self, other)
 
     def get_comparison_lt(self, other):
         if isinstance(other, Numeral) or isinstance(other, Number):
-            return Bool(self.value < other.value).set_context(self.context), None
+            return Bool.make(self.value < other.value), None
         else:
             return None, Value.illegal_operation(self, other)
 
     def get_comparison_gt(self, other):
         if isinstance(other, Numeral) or isinstance(other, Number):
-            return Bool(self.value > other.value).set_context(self.context), None
+            return Bool.make(self.value > other.value), None
         else:
             return None, Value.illegal_operation(self, other)
 
     def get_comparison_lte(self, other):
         if isinstance(other, Numeral) or isinstance(other, Number):
-            return Bool(self.value <= other.value).set_context(self.context), None
+            return Bool.make(self.value <= other.value), None
         else:
             return None, Value.illegal_operation(self, other)
 
     def get_comparison_gte(self, other):
         if isinstance(other, Numeral) or isinstance(other, Number):
-            return Bool(self.value >= other.value).set_context(self.context), None
+            return Bool.make(self.value >= other.value), None
         else:
             return None, Value.illegal_operation(self, other)
 
     def anded_by(self, other):
         if isinstance(other, Numeral) or isinstance(other, Number):
-            return Bool(self.value and other.value).set_context(self.context), None
+            return Bool.make(self.value and other.value), None
         else:
             return None, Value.illegal_operation(self, other)
 
     def ored_by(self, other):
         if isinstance(other, Numeral) or isinstance(other, Number):
-            return Bool(self.value or other.value).set_context(self.context), None
+            return Bool.make(self.value or other.value), None
         else:
             return None, Value.illegal_operation(self, other)
 
     def notted(self):
-        return Bool(True if self.value == 0 else False).set_context(self.context), None
+        return Bool.make(self.value == 0), None
 
     def copy(self):
         copy = Numeral(self.value)
@@ -12,57 +12,59 @@ from .Value import Value
 
 
 class String(Value):
+    __slots__ = ('value', 'attributes')
+
     def __init__(self, value):
         super().__init__()
         self.value = value
 
-        self.attributes = {"length": Number(len(value))}
+        self.attributes = {"length": Number.make(len(value))}
 
     def added_to(self, other):
         if isinstance(other, String):
-            return String(self.value + other.value, self.length + other.length).set_context(self.context), None
+            return String(self.value + other.value).set_context(self.context), None
         else:
             return None, Value.illegal_operation(self, other)
 
     def multed_by(self, other):
         if isinstance(other, Number):
-            return String(self.value * other.value, self.length * other.value).set_context(self.context), None
+            return String(self.value * other.value).set_context(self.context), None
         else:
             return None, Value.illegal_operation(self, other)
 
     def get_comparison_eq(self, other):
         if isinstance(other, String):
-            return Bool(self.value == other.value), None
+            return Bool.make(self.value == other.value), None
         else:
             return None, Value.illegal_operation(self, other)
 
     def get_comparison_ne(self, other):
         if isinstance(other, String):
-            return Bool(self.value != other.value), None
+            return Bool.make(self.value != other.value), None
         else:
             return None, Value.illegal_operation(self, other)
 
     def get_comparison_lt(self, other):
         if isinstance(other, String):
-            return Bool(self.value < other.value), None
+            return Bool.make(self.value < other.value), None
         else:
             return None, Value.illegal_operation(self, other)
 
     def get_comparison_gt(self, other):
         if isinstance(other, String):
-            return Bool(self.value > other.value), None
+            return Bool.make(self.value > other.value), None
         else:
             return None, Value.illegal_operation(self, other)
 
     def get_comparison_lte(self, other):
         if isinstance(other, String):
-            return Bool(self.value <= other.value), None
+            return Bool.make(self.value <= other.value), None
         else:
             return None, Value.illegal_operation(self, other)
 
     def get_comparison_gte(self, other):
         if isinstance(other, String):
-            return Bool(self.value >= other.value), None
+            return Bool.make(self.value >= other.value), None
         else:
             return None, Value.illegal_operation(self, other)
 
@@ -79,7 +81,7 @@ class String(Value):
             return None, Value.illegal_operation(self, other)
 
     def notted(self):
-        return Bool(len(self.value) == 0), None
+        return Bool.make(len(self.value) == 0), None
 
     def is_true(self):
         return len(self.value) > 0
@@ -11,10 +11,15 @@ from Celeratas.interpreter.RTResult import RTResult
 
 
 class Value:
+    # A program can make a lot of values, slots keep each of them small
+    __slots__ = ('pos_start', 'pos_end', 'context')
+
+    # Only strings have attributes (see String), every other value shares this empty dict
+    attributes = {}
+
     def __init__(self):
         self.set_pos()
         self.set_context()
-        self.attributes = {}
 
     def set_pos(self, pos_start=None, pos_end=None):
         self.pos_start = pos_start
@@ -70,7 +75,7 @@ class Value:
     def notted(self, other):
         return None, self.illegal_operation(other)
 
-    def execute(self, args):
+    def execute(self, args, recursion_depth=0):
         return RTResult().failure(self.illegal_operation())
 
     def copy(self):
@@ -2,5 +2,6 @@ from .Bool import Bool
 from .Dict import Dict
 from .functions.Function import Function
 from .List import List
+from .Module import Module
 from .Number import Number, Numeral
 from .String import String
@@ -14,6 +14,8 @@ from Celeratas.interpreter.values.Value import Value
 
 
 class BaseFunction(Value):
+    __slots__ = ('name',)
+
     def __init__(self, name):
         super().__init__()
         self.name = name or "<anonymous>"
@@ -51,16 +53,12 @@ class BaseFunction(Value):
             arg_name = arg[0]
             arg_value = arg[1]
 
+            # The caller still holds the values it passed in, so they are stored as they are and not changed
             if arg_name in input_args:
-                input_arg_value = input_args[arg_name]
-                input_arg_value.set_context(exec_ctx)
-                exec_ctx.symbol_table.set(arg_name, input_arg_value)
+                exec_ctx.symbol_table.set(arg_name, input_args[arg_name])
             elif arg_idx in input_args:
-                input_arg_value = input_args[arg_idx]
-                input_arg_value.set_context(exec_ctx)
-                exec_ctx.symbol_table.set(arg_name, input_arg_value)
+                exec_ctx.symbol_table.set(arg_name, input_args[arg_idx])
             else:
-                arg_value.set_context(exec_ctx)
                 exec_ctx.symbol_table.set(arg_name, arg_value)
 
     def check_and_populate_args(self, arg_names, args, exec_ctx):
@@ -16,6 +16,8 @@ from .BaseFunction import BaseFunction
 
 
 class BuiltInFunction(BaseFunction):
+    __slots__ = ()
+
     def __init__(self, name):
         super().__init__(name)
 
@@ -36,6 +38,17 @@ class BuiltInFunction(BaseFunction):
             return res
         return res.success(return_value)
 
+    def get_runtime(self, exec_ctx):
+        # Only the first context of the program or module knows the runtime, the contexts of calls only know their caller
+        context = exec_ctx
+        while context.parent:
+            context = context.parent
+        if context.runtime is None:
+            # Need the import here to avoid circular import
+            from Celeratas.shell import default_runtime
+            return default_runtime
+        return context.runtime
+
     def no_visit_method(self, node, context):
         raise Exception(f'No execute_{self.name} method defined')
 
@@ -70,23 +83,23 @@ class BuiltInFunction(BaseFunction):
 
     def execute_is_number(self, exec_ctx):
         is_number = isinstance(exec_ctx.symbol_table.get("value"), Number)
-        return RTResult().success(Bool(is_number))
+        return RTResult().success(Bool.make(is_number))
     execute_is_number.arg_names = [('value', None)]
 
     def execute_is_string(self, exec_ctx):
         is_number = isinstance(exec_ctx.symbol_table.get("value"), String)
-        return RTResult().success(Bool(is_number))
+        return RTResult().success(Bool.make(is_number))
     execute_is_string.arg_names = [("value", None)]
 
     def execute_is_list(self, exec_ctx):
         is_number = isinstance(exec_ctx.symbol_table.get("value"), List)
-        return RTResult().success(Bool(is_number))
+        return RTResult().success(Bool.make(is_number))
     execute_is_list.arg_names = [("value", None)]
 
     def execute_is_function(self, exec_ctx):
         is_number = isinstance(
             exec_ctx.symbol_table.get("value"), BaseFunction)
-        return RTResult().success(Bool(is_number))
+        return RTResult().success(Bool.make(is_number))
     execute_is_function.arg_names = [("value", None)]
 
     def execute_append(self, exec_ctx):
@@ -165,7 +178,7 @@ class BuiltInFunction(BaseFunction):
                 exec_ctx
             ))
 
-        return RTResult().success(Number(len(input_.elements if isinstance(input_, List) else input_.value)))
+        return RTResult().success(Number.make(len(input_.elements if isinstance(input_, List) else input_.value)))
     execute_len.arg_names = [("input", None)]
 
     def execute_split(self, exec_ctx):
@@ -205,9 +218,7 @@ class BuiltInFunction(BaseFunction):
                 exec_ctx
             ))
 
-        # Need the import here to avoid circular import
-        from Celeratas.shell import run_script
-        _, error = run_script(fn, script)
+        _, error = self.get_runtime(exec_ctx).run_script(fn, script, cached=True)
 
         if error:
             return RTResult().failure(TypingError(
@@ -218,3 +229,60 @@ class BuiltInFunction(BaseFunction):
 
         return RTResult().success(None)
     execute_run.arg_names = [("fn", None)]
+
+    def execute_import(self, exec_ctx):
+        fn = exec_ctx.symbol_table.get("fn")
+
+        if not isinstance(fn, String):
+            return RTResult().failure(TypingError(
+                self.pos_start, self.pos_end,
+                "Argument must be string",
+                exec_ctx
+            ))
+
+        fn = fn.value
+
+        runtime = self.get_runtime(exec_ctx)
+        modules = runtime.modules
+        importing = runtime.importing
+
+        # The same script is the same module, however the path to it is written
+        path = os.path.realpath(fn)
+        if path in modules:
+            return RTResult().success(modules[path])
+
+        if path in importing:
+            cycle = importing[importing.index(path):] + [path]
+            return RTResult().failure(RTError(
+                self.pos_start, self.pos_end,
+                "Circular import " + " -> ".join(f"\"{os.path.basename(script_path)}\"" for script_path in cycle),
+                exec_ctx
+            ))
+
+        try:
+            with open(fn, "r") as f:
+                script = f.read()
+        except Exception:
+            return RTResult().failure(RTError(
+                self.pos_start, self.pos_end,
+                f"Failed to load script \"{fn}\"",
+                exec_ctx
+            ))
+
+        importing.append(path)
+        try:
+            module, error = runtime.run_module(fn, script)
+        finally:
+            importing.pop()
+
+        # A module that failed isn't kept, importing it again runs it again
+        if error:
+            return RTResult().failure(RTError(
+                self.pos_start, self.pos_end,
+                f"Failed to finish executing script \"{fn}\"\n" + error.as_string(),
+                exec_ctx
+            ))
+
+        modules[path] = module
+        return RTResult().success(module)
+    execute_import.arg_names = [("fn", None)]
@@ -2,7 +2,11 @@
 # IMPORTS
 #####################################
 
+from Celeratas.interpreter.Context import Context
 from Celeratas.interpreter.RTResult import RTResult
+from Celeratas.interpreter.signals import TailCall
+from Celeratas.interpreter.SlotSymbolTable import SlotSymbolTable
+from Celeratas.interpreter.SymbolTable import SymbolTable
 
 from .BaseFunction import BaseFunction
 
@@ -11,34 +15,68 @@ from .BaseFunction import BaseFunction
 # FUNCTION
 #####################################
 class Function(BaseFunction):
-    def __init__(self, name, body_node, arg_names, should_auto_return):
+    __slots__ = ('body_node', 'arg_names', 'should_auto_return', 'slot_names', 'module_table')
+
+    def __init__(self, name, body_node, arg_names, should_auto_return, slot_names=None):
         super().__init__(name)
         self.body_node = body_node
         self.arg_names = arg_names
         self.should_auto_return = should_auto_return
+        # The locals the Resolver found in the body, a call keeps them in a list instead of a dict
+        self.slot_names = slot_names
+        # The table of the program or module the function was made in, see parent_table
+        self.module_table = None
+
+    def set_module(self, context):
+        symbol_table = context.symbol_table
+        self.module_table = symbol_table.global_table or symbol_table
+        return self
+
+    def parent_table(self):
+        # Functions are dynamically scoped, so a call sees the variables of its caller - Only a call from another module
+        # starts at the top of the module the function was made in, so that it still sees the globals of its own module
+        caller_table = self.context.symbol_table
+        if self.module_table is None or (caller_table.global_table or caller_table) is self.module_table:
+            return caller_table
+        return self.module_table
+
+    def generate_new_context(self):
+        new_context = Context(self.name, self.context, self.pos_start)
+        if self.slot_names is None:
+            new_context.symbol_table = SymbolTable(self.parent_table())
+        else:
+            new_context.symbol_table = SlotSymbolTable(self.slot_names, [None] * len(self.slot_names), self.parent_table())
+        return new_context
 
     def execute(self, args, recursion_depth):
         res = RTResult()
         from Celeratas.interpreter.Interpreter import Interpreter
         interpreter = Interpreter(recursion_depth + 1)
-        exec_ctx = self.generate_new_context()
+        function = self
+
+        # A call in tail position gives back the function to run next instead of running it inside of this one
+        while True:
+            exec_ctx = function.generate_new_context()
 
-        res.register(self.check_and_populate_args(
-            self.arg_names, args, exec_ctx))
-        if res.should_return():
-            return res
+            res.register(function.check_and_populate_args(
+                function.arg_names, args, exec_ctx))
+            if res.should_return():
+                return res
 
-        value = res.register(interpreter.visit(self.body_node, exec_ctx))
-        if res.should_return() and res.func_return_value is None:
-            return res
+            value = res.register(interpreter.visit(function.body_node, exec_ctx))
+            if res.should_return() and res.func_return_value is None:
+                return res
 
-        ret_value = (
-            value if self.should_auto_return else None) or res.func_return_value or None
-        return res.success(ret_value)
+            ret_value = (
+                value if function.should_auto_return else None) or res.func_return_value or None
+            if type(ret_value) is not TailCall:
+                return res.success(ret_value)
+            function, args = ret_value.function, ret_value.args
 
     def copy(self):
         copy = Function(self.name, self.body_node,
-                        self.arg_names, self.should_auto_return)
+                        self.arg_names, self.should_auto_return, self.slot_names)
+        copy.module_table = self.module_table
         copy.set_context(self.context)
         copy.set_pos(self.pos_start, self.pos_end)
         return copy
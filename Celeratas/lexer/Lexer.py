@@ -9,6 +9,7 @@ from Celeratas.helper.errors import (ExpectedItemError, IllegalCharError,
                                      IndentError, InvalidNumeral)
 
 from .Position import Position
+from .Source import Source
 from .Token import Token
 
 #######################################
@@ -20,27 +21,46 @@ class Lexer:
     def __init__(self, fn, text):
         self.fn = fn
         self.text = text
-        self.pos = Position(-1, 0, -1, fn, text)
+        self.source = Source(fn, text)
+        # Only the offset is tracked, lines and columns are worked out from it when an error needs them (see Source)
+        self.idx = -1
         self.current_char = None
         self.tab_style = ""
+        self.error = None
         self.advance()
 
+    @property
+    def pos(self):
+        return Position(self.idx, self.source)
+
     def advance(self):
-        self.pos.advance(self.current_char)
-        self.current_char = self.text[self.pos.idx] if self.pos.idx < len(
-            self.text) else None
+        self.idx += 1
+        self.current_char = self.text[self.idx] if self.idx < len(self.text) else None
 
     def make_tokens(self):
+        tokens = list(self.iter_tokens())
+        if self.error:
+            return [], self.error
+        return tokens, None
+
+    def iter_tokens(self):
+        # Yields the tokens a chunk at a time and stops at the first error, which is kept in self.error
         tokens = []
         self.start_of_statement = True
         # Start of statements is before character other than space/tab - After this is false, tabs and spaces are ignored by make_spaces() method
         # non_space_char is set to True if anything other than space/tab is read - This var updates start of statements at the end of while loop
         while self.current_char:
+            if len(tokens) > constants.TOKEN_CHUNK_SIZE:
+                # The last token is held back, it could still be the f of an f-string
+                yield from tokens[:-1]
+                del tokens[:-1]
+
             non_space_char = True
             if self.current_char in ' \t':
                 new_toks, error = self.make_space(tokens)
                 if error:
-                    return [], error
+                    self.error = error
+                    return
                 tokens = new_toks
                 non_space_char = False
             elif self.current_char == '#':
@@ -55,12 +75,14 @@ class Lexer:
             elif self.current_char in constants.ROMAN_NUMERAL_CHARS:
                 token, error = self.make_numeral()
                 if error:
-                    return [], error
+                    self.error = error
+                    return
                 tokens.append(token)
             elif self.current_char in constants.LETTERS + "_":
                 token, error = self.make_identifier()
                 if error:
-                    return [], error
+                    self.error = error
+                    return
                 tokens.append(token)
             elif self.current_char == ".":
                 tokens.append(Token(toks.TT_DOT, pos_start=self.pos))
@@ -76,7 +98,8 @@ class Lexer:
                     token, error = self.make_string(fstring=False)
 
                 if error:
-                    return [], error
+                    self.error = error
+                    return
                 tokens.append(token)
             elif self.current_char == '+':
                 tokens.append(self.make_mult_toks(toks.TT_PLUS, toks.TT_PLUS_EQ, "="))
@@ -84,13 +107,10 @@ class Lexer:
                 tokens.append(self.make_mult_toks(toks.TT_MINUS, toks.TT_MIN_EQ, "="))
             elif self.current_char == '*':
                 tokens.append(self.make_mult_toks(toks.TT_MUL, toks.TT_MUL_EQ, "="))
-                self.advance()
             elif self.current_char == '/':
                 tokens.append(self.make_mult_toks(toks.TT_DIV, toks.TT_DIV_EQ, "="))
-                self.advance()
             elif self.current_char == "%":
                 tokens.append(self.make_mult_toks(toks.TT_MOD, toks.TT_MOD_EQ, "="))
-                self.advance()
             elif self.current_char == '^':
                 tokens.append(Token(toks.TT_POW, pos_start=self.pos))
                 self.advance()
@@ -115,7 +135,8 @@ class Lexer:
             elif self.current_char == '!':
                 token, error = self.make_not_equals()
                 if error:
-                    return [], error
+                    self.error = error
+                    return
                 tokens.append(token)
             elif self.current_char == '=':
                 tokens.append(self.make_equals())
@@ -130,20 +151,21 @@ class Lexer:
                 tokens.append(Token(toks.TT_COMMA, pos_start=self.pos))
                 self.advance()
             else:
-                pos_start = self.pos.copy()
+                pos_start = self.pos
                 char = self.current_char
                 self.advance()
-                return [], IllegalCharError(pos_start, self.pos, "'" + char + "'")
+                self.error = IllegalCharError(pos_start, self.pos, "'" + char + "'")
+                return
 
             # When Grammatical Token is read, tabs/spaces from this point on will be ignored
             if self.start_of_statement and non_space_char:
                 self.start_of_statement = False
 
         tokens.append(Token(toks.TT_EOF, pos_start=self.pos))
-        return tokens, None
+        yield from tokens
 
     def make_space(self, tokens):
-        pos_start = self.pos.copy()
+        pos_start = self.pos
         if self.start_of_statement:
             if self.current_char == ' ':
                 # Check tab style
@@ -176,7 +198,7 @@ class Lexer:
     def make_numeral(self):
         numeral_str = ''
         dot_count = 0
-        pos_start = self.pos.copy()
+        pos_start = self.pos
 
         while self.current_char and self.current_char in constants.ROMAN_NUMERAL_CHARS + '.':
             if self.current_char == '.':
@@ -204,7 +226,7 @@ class Lexer:
     def make_number(self):
         num_str = ''
         dot_count = 0
-        pos_start = self.pos.copy()
+        pos_start = self.pos
 
         while self.current_char and self.current_char in constants.DIGITS + '.':
             if self.current_char == '.':
@@ -220,7 +242,7 @@ class Lexer:
             return Token(toks.TT_FLOAT, float(num_str), pos_start, self.pos)
 
     def make_string(self, fstring):
-        pos_start = self.pos.copy()
+        pos_start = self.pos
         escape_character = False
         # Can be either " or '
         string_char = self.current_char
@@ -258,7 +280,9 @@ class Lexer:
                 to_lex = ""
                 self.advance()
 
-                pos_after_brace = self.pos.copy()
+                pos_after_brace = self.pos
+                if self.current_char is None:
+                    return None, ExpectedItemError(pos_after_brace, self.pos, "Expected '}'")
 
                 while self.current_char != "}":
                     to_lex += self.current_char
@@ -295,7 +319,7 @@ class Lexer:
 
     def make_identifier(self, start_value=""):
         id_str = start_value
-        pos_start = self.pos.copy()
+        pos_start = self.pos
 
         while self.current_char and self.current_char in constants.LETTERS_DIGITS + '_':
             id_str += self.current_char
@@ -305,7 +329,7 @@ class Lexer:
         return Token(tok_type, id_str, pos_start, self.pos), None
 
     def make_not_equals(self):
-        pos_start = self.pos.copy()
+        pos_start = self.pos
         self.advance()
 
         if self.current_char == '=':
@@ -317,7 +341,7 @@ class Lexer:
 
     def make_equals(self):
         tok_type = toks.TT_EQ
-        pos_start = self.pos.copy()
+        pos_start = self.pos
         self.advance()
 
         if self.current_char == '>':
@@ -331,7 +355,7 @@ class Lexer:
 
     def make_mult_toks(self, tok_type_1, tok_type_2, switch_factor):
         tok_type = tok_type_1
-        pos_start = self.pos.copy()
+        pos_start = self.pos
         self.advance()
 
         if self.current_char == switch_factor:
@@ -347,4 +371,6 @@ class Lexer:
         while self.current_char and self.current_char not in ';\n':
             self.advance()
 
-        self.advance()
+        # The newline is skipped as well, but there is nothing to skip at the end of the file
+        if self.current_char:
+            self.advance()
@@ -1,20 +1,27 @@
 class Position:
-    def __init__(self, idx, ln, col, fn, ftxt):
+    # There is a start and an end position for every token and node, so a position is just an offset into its Source
+    __slots__ = ('idx', 'source')
+
+    def __init__(self, idx, source):
         self.idx = idx
-        self.ln = ln
-        self.col = col
-        self.fn = fn
-        self.ftxt = ftxt
+        self.source = source
+
+    def __reduce__(self):
+        # Cached trees hold a position for every node and token, pickled like this they are smaller and quicker to load
+        return Position, (self.idx, self.source)
 
-    def advance(self, current_char=None):
-        self.idx += 1
-        self.col += 1
+    @property
+    def ln(self):
+        return self.source.line_col(self.idx)[0]
 
-        if current_char == '\n':
-            self.ln += 1
-            self.col = 0
+    @property
+    def col(self):
+        return self.source.line_col(self.idx)[1]
 
-        return self
+    @property
+    def fn(self):
+        return self.source.fn
 
-    def copy(self):
-        return Position(self.idx, self.ln, self.col, self.fn, self.ftxt)
+    @property
+    def ftxt(self):
+        return self.source.text
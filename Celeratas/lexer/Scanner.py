@@ -0,0 +1,299 @@
+#######################################
+# IMPORTS
+#######################################
+
+import re
+
+import Celeratas.helper.tokens as toks
+import Celeratas.lexer.constants as constants
+from Celeratas.helper.convert_roman import toNum
+from Celeratas.helper.errors import (ExpectedItemError, IllegalCharError,
+                                     IndentError, InvalidNumeral)
+
+from .Position import Position
+from .Source import Source
+from .Token import Token
+
+#######################################
+# PATTERNS
+#######################################
+
+# One pattern for every kind of token, tried in the same order as the checks of the Lexer - The name of the group that matched is the kind
+TOKEN = re.compile(r"""
+    (?P<space>[ \t]+)
+  | (?P<comment>\#[^;\n]*[;\n]?)
+  | (?P<newline>[;\n])
+  | (?P<numeral>[IVXLCDM]+(?:\.[IVXLCDM]*)?)
+  | (?P<identifier>[A-Za-z_][A-Za-z0-9_]*)
+  | (?P<number>[0-9]+(?:\.[0-9]*)?)
+  | (?P<string>["'])
+  | (?P<operator>\+=|-=|\*=|/=|%=|==|=>|!=|<=|>=|[-+*/%^()\[\]{}=<>:,.])
+  | (?P<not_equals>!)
+""", re.VERBOSE)
+
+# A numeral that runs into letters is the start of an identifier
+IDENTIFIER_REST = re.compile(r"[A-Za-z0-9_]*")
+
+# Everything up to the next character a string has to look at
+STRING_CHARS = {
+    '"': re.compile(r'[^"\\\n{]*'),
+    "'": re.compile(r"[^'\\\n{]*"),
+}
+FSTRING_CHARS = re.compile(r"[^}{\n]*")
+
+ESCAPE_CHARACTERS = {
+    'n': '\n',
+    't': '\t'
+}
+
+OPERATORS = {
+    '+': toks.TT_PLUS,
+    '+=': toks.TT_PLUS_EQ,
+    '-': toks.TT_MINUS,
+    '-=': toks.TT_MIN_EQ,
+    '*': toks.TT_MUL,
+    '*=': toks.TT_MUL_EQ,
+    '/': toks.TT_DIV,
+    '/=': toks.TT_DIV_EQ,
+    '%': toks.TT_MOD,
+    '%=': toks.TT_MOD_EQ,
+    '^': toks.TT_POW,
+    '(': toks.TT_LPAREN,
+    ')': toks.TT_RPAREN,
+    '[': toks.TT_LSQUARE,
+    ']': toks.TT_RSQUARE,
+    '{': toks.TT_LBRACE,
+    '}': toks.TT_RBRACE,
+    '=': toks.TT_EQ,
+    '==': toks.TT_EE,
+    '=>': toks.TT_ARROW,
+    '!=': toks.TT_NE,
+    '<': toks.TT_LT,
+    '<=': toks.TT_LTE,
+    '>': toks.TT_GT,
+    '>=': toks.TT_GTE,
+    ':': toks.TT_COLON,
+    ',': toks.TT_COMMA,
+    '.': toks.TT_DOT,
+}
+
+KEYWORDS = frozenset(toks.KEYWORDS)
+
+#######################################
+# SCANNER
+#######################################
+
+
+class Scanner:
+    # Makes the same tokens and errors as the Lexer, but matches whole lexemes with one compiled pattern and slices them out of the text
+    def __init__(self, fn, text):
+        self.fn = fn
+        self.text = text
+        self.source = Source(fn, text)
+        self.tab_style = ""
+        self.error = None
+
+    def position(self, idx):
+        return Position(idx, self.source)
+
+    def make_tokens(self):
+        tokens = list(self.iter_tokens())
+        if self.error:
+            return [], self.error
+        return tokens, None
+
+    def iter_tokens(self):
+        # Yields the tokens a chunk at a time and stops at the first error, which is kept in self.error
+        text = self.text
+        source = self.source
+        tokens = []
+        # Spaces and tabs are only indentation before the first grammatical token of a statement
+        start_of_statement = True
+        idx = 0
+
+        # Looked up once, this loop runs for every token
+        match_token = TOKEN.match
+        length = len(text)
+
+        while idx < length:
+            if len(tokens) > constants.TOKEN_CHUNK_SIZE:
+                # The last token is held back, it could still be the f of an f-string
+                yield from tokens[:-1]
+                del tokens[:-1]
+
+            match = match_token(text, idx)
+            if match is None:
+                self.error = IllegalCharError(Position(idx, source), Position(idx + 1, source), "'" + text[idx] + "'")
+                return
+
+            kind = match.lastgroup
+            end = match.end()
+
+            if kind == 'operator':
+                tokens.append(Token(OPERATORS[match.group()], None, Position(idx, source), Position(end, source)))
+            elif kind == 'identifier':
+                id_str = match.group()
+                tok_type = toks.TT_KEYWORD if id_str in KEYWORDS else toks.TT_IDENTIFIER
+                tokens.append(Token(tok_type, id_str, Position(idx, source), Position(end, source)))
+            elif kind == 'space':
+                if start_of_statement:
+                    error = self.make_indents(tokens, idx, end)
+                    if error:
+                        self.error = error
+                        return
+                idx = end
+                continue
+            elif kind == 'newline' or kind == 'comment':
+                # A comment takes the newline that ends it with it
+                if kind == 'newline':
+                    tokens.append(Token(toks.TT_NEWLINE, None, Position(idx, source), Position(end, source)))
+                start_of_statement = True
+                idx = end
+                continue
+            elif kind == 'number':
+                lexeme = match.group()
+                if '.' in lexeme:
+                    tokens.append(Token(toks.TT_FLOAT, float(lexeme), Position(idx, source), Position(end, source)))
+                else:
+                    tokens.append(Token(toks.TT_INT, int(lexeme), Position(idx, source), Position(end, source)))
+            elif kind == 'numeral':
+                token, end, error = self.make_numeral(match.group(), idx, end)
+                if error:
+                    self.error = error
+                    return
+                tokens.append(token)
+            elif kind == 'string':
+                # Need the first clause incase the code starts with a quote
+                fstring = len(tokens) > 0 and tokens[-1].matches(toks.TT_IDENTIFIER, 'f')
+                if fstring:
+                    tokens.pop()
+                token, end, error = self.make_string(idx, fstring)
+                if error:
+                    self.error = error
+                    return
+                tokens.append(token)
+            else:
+                # The character after the '!' is skipped, like the Lexer does
+                self.error = ExpectedItemError(Position(idx, source), Position(idx + 2, source), "Expected '=' after '!'")
+                return
+
+            start_of_statement = False
+            idx = end
+
+        tokens.append(Token(toks.TT_EOF, None, Position(idx, source), Position(idx + 1, source)))
+        yield from tokens
+
+    def make_indents(self, tokens, idx, end):
+        # Every four spaces or tab at the start of a statement is one level of indentation
+        text = self.text
+        while idx < end:
+            if text[idx] == ' ':
+                if self.tab_style not in ["", "space"]:
+                    return IndentError(self.position(idx), self.position(idx), "Inconsistent indentation")
+                if text[idx:idx + 4] != '    ':
+                    # Points at the first character that isn't a space
+                    error_idx = idx + 1
+                    while text[error_idx:error_idx + 1] == ' ':
+                        error_idx += 1
+                    return IndentError(self.position(idx), self.position(error_idx), "Improper indentation")
+
+                self.tab_style = "space"
+                tokens.append(Token(toks.TT_TAB, None, self.position(idx), self.position(idx + 4)))
+                idx += 4
+            else:
+                if self.tab_style not in ["", "tab"]:
+                    return IndentError(self.position(idx), self.position(idx), "Inconsistent indentation")
+
+                self.tab_style = "tab"
+                # The Lexer puts a tab token after the tab
+                tokens.append(Token(toks.TT_TAB, None, self.position(idx + 1), self.position(idx + 2)))
+                idx += 1
+        return None
+
+    def make_identifier(self, id_str, idx, end):
+        tok_type = toks.TT_KEYWORD if id_str in KEYWORDS else toks.TT_IDENTIFIER
+        return Token(tok_type, id_str, Position(idx, self.source), Position(end, self.source))
+
+    def make_numeral(self, numeral_str, idx, end):
+        if end < len(self.text) and self.text[end] in constants.LETTERS:
+            # Letters after a numeral make it an identifier (or a keyword like Verus)
+            end = IDENTIFIER_REST.match(self.text, end).end()
+            return self.make_identifier(self.text[idx:end], idx, end), end, None
+
+        numeral_final = toNum(numeral_str)
+        if numeral_final is None:
+            return None, end, InvalidNumeral(self.position(idx), self.position(end), f"{numeral_str} is not a valid numeral")
+
+        return Token(toks.TT_NUMERAL, numeral_final, self.position(idx), self.position(end)), end, None
+
+    def make_string(self, idx, fstring):
+        text = self.text
+        pos_start = self.position(idx)
+        # Can be either " or '
+        string_char = text[idx]
+        string_chars = STRING_CHARS[string_char]
+        idx += 1
+
+        str_components = []
+        cur_str = ""
+
+        while True:
+            match = string_chars.match(text, idx)
+            cur_str += match.group()
+            idx = match.end()
+            if idx >= len(text):
+                return None, idx, IllegalCharError(pos_start, self.position(idx), "Unexpected end to string")
+
+            char = text[idx]
+            if char == string_char:
+                break
+            elif char == '\n':
+                return None, idx, IllegalCharError(pos_start, self.position(idx), "Unexpected end to string")
+            elif char == '\\':
+                idx += 1
+                if idx >= len(text):
+                    return None, idx, IllegalCharError(pos_start, self.position(idx), "Unexpected end to string")
+                # An escaped quote still ends the string
+                if text[idx] == string_char:
+                    break
+                # If the escape character is not in the lookup, it simply adds the character
+                cur_str += ESCAPE_CHARACTERS.get(text[idx], text[idx])
+            elif fstring:
+                # Append cur_str to str_components and reset cur_str
+                if cur_str != "":
+                    str_components.append(cur_str)
+                    cur_str = ""
+
+                tokens, idx, error = self.make_fstring_tokens(idx + 1)
+                if error:
+                    return None, idx, error
+                str_components.append(tokens)
+            else:
+                cur_str += char
+            idx += 1
+
+        if cur_str != "":
+            str_components.append(cur_str)
+
+        return Token(toks.TT_STRING, str_components, pos_start, self.position(idx + 1)), idx + 1, None
+
+    def make_fstring_tokens(self, brace_start):
+        # Scans the code between the braces of an f-string and returns the index of the closing brace
+        text = self.text
+        brace_end = brace_start
+        if text[brace_start:brace_start + 1] != '}':
+            # The first character is always part of the code, even if it is a brace or a newline
+            brace_end = FSTRING_CHARS.match(text, brace_start + 1).end()
+            if brace_end >= len(text) or text[brace_end] != '}':
+                return None, brace_end, ExpectedItemError(self.position(brace_start), self.position(brace_end), "Expected '}'")
+
+        tokens, error = Scanner("fstring", text[brace_start:brace_end]).make_tokens()
+        if error:
+            return None, brace_end, error
+
+        # Check if there is a string in tokens
+        for token in tokens:
+            if token.type == toks.TT_STRING:
+                return None, brace_end, IllegalCharError(self.position(brace_start), self.position(brace_end), "Unexpected string")
+
+        return tokens, brace_end, None
@@ -0,0 +1,19 @@
+from bisect import bisect_right
+
+
+class Source:
+    # Every position in a file shares its Source, so a position only has to hold its offset into the text
+    __slots__ = ('fn', 'text', 'line_starts')
+
+    def __init__(self, fn, text):
+        self.fn = fn
+        self.text = text
+        # Only worked out the first time a line or column is needed, which is usually when an error is shown
+        self.line_starts = None
+
+    def line_col(self, idx):
+        if self.line_starts is None:
+            self.line_starts = [0] + [char_idx + 1 for char_idx, char in enumerate(self.text) if char == '\n']
+
+        ln = bisect_right(self.line_starts, idx) - 1
+        return ln, idx - self.line_starts[ln]
@@ -1,15 +1,21 @@
+from .Position import Position
+
+
 class Token:
+    __slots__ = ('type', 'value', 'pos_start', 'pos_end')
+
     def __init__(self, type_, value=None, pos_start=None, pos_end=None):
         self.type = type_
         self.value = value
 
+        # Positions never change, so the token keeps the ones it is given
         if pos_start:
-            self.pos_start = pos_start.copy()
-            self.pos_end = pos_start.copy()
-            self.pos_end.advance()
+            self.pos_start = pos_start
+            if not pos_end:
+                self.pos_end = Position(pos_start.idx + 1, pos_start.source)
 
         if pos_end:
-            self.pos_end = pos_end.copy()
+            self.pos_end = pos_end
 
     def matches(self, type_, value):
         return self.type == type_ and self.value == value
@@ -0,0 +1,55 @@
+import Celeratas.helper.tokens as toks
+
+from .Token import Token
+
+
+class TokenStream:
+    # Hands the parser its tokens as the lexer makes them, so lexing and parsing go together through the file
+    # Only the tokens the parser could still go back to are kept (see release), not every token of the file
+    def __init__(self, lexer):
+        # Takes a Lexer or Scanner, or a list of tokens that were already made
+        if isinstance(lexer, list):
+            self.lexer = None
+            self.pending = None
+            self.buffer = lexer
+        else:
+            self.lexer = lexer
+            self.pending = lexer.iter_tokens()
+            self.buffer = []
+        # The index of the first token in the buffer
+        self.offset = 0
+
+    def get(self, idx):
+        # None past the last token, like indexing past the end of a list of tokens
+        idx -= self.offset
+        while idx >= len(self.buffer) and self.pending is not None:
+            self.fill()
+        return self.buffer[idx] if idx < len(self.buffer) else None
+
+    def fill(self):
+        token = next(self.pending, None)
+        if token is not None:
+            self.buffer.append(token)
+            return
+
+        self.pending = None
+        if self.lexer.error:
+            # Gives the parser an end to stop at - The error itself comes from lexing_error
+            self.buffer.append(Token(toks.TT_EOF, pos_start=self.lexer.error.pos_start))
+
+    def release(self, idx):
+        # The parser won't go back before idx any more - A list that was passed in belongs to the caller, so it is left alone
+        drop = idx - self.offset
+        if self.lexer is not None and drop > 0:
+            del self.buffer[:drop]
+            self.offset += drop
+
+    def lexing_error(self):
+        # The rest of the file is lexed as well when the parser stopped early, an error from the lexer comes first anywhere in the file
+        if self.lexer is None:
+            return None
+        if self.pending is not None:
+            for _ in self.pending:
+                pass
+            self.pending = None
+        return self.lexer.error
@@ -12,3 +12,6 @@ ROMAN_NUMERAL_CHARS = "IVXLCDM"
 DIGITS = '0123456789'
 LETTERS = string.ascii_letters
 LETTERS_DIGITS = LETTERS + DIGITS
+
+# How many tokens the lexers make before handing them over, so a parser never waits on more than this
+TOKEN_CHUNK_SIZE = 64
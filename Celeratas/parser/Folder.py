@@ -0,0 +1,164 @@
+#######################################
+# IMPORTS
+#######################################
+
+import Celeratas.helper.tokens as toks
+from Celeratas.interpreter import operations
+from Celeratas.interpreter.values import Bool, Number, Numeral, String
+
+from . import nodes
+
+#######################################
+# LIMITS
+#######################################
+
+# A folded value is kept in the tree (and in __celcache__), so expressions that would make a huge one are left to run instead
+MAX_STRING_LENGTH = 4096
+MAX_INT_BITS = 128
+
+#######################################
+# FOLDER
+#######################################
+
+
+class Folder:
+    # Runs after the Resolver when optimizing - Every expression of literals is replaced by a literal of its value, so it is only
+    # worked out once instead of every time it runs. An expression that gives an error is left as it is, so the error still comes
+    # when it runs, from the same place
+    # Only literals are folded, a name like pi can be set to something else, so it is never a constant
+
+    def __init__(self):
+        # The method and the slots with children of every type of node, looked up once per type instead of once per node
+        self.methods = {}
+        self.child_slots = {}
+
+    def fold(self, node):
+        node_type = type(node)
+        method = self.methods.get(node_type)
+        if method is None:
+            method = self.methods[node_type] = getattr(self, f'fold_{node_type.__name__}', self.fold_children)
+        return method(node)
+
+    def fold_children(self, node):
+        node_type = type(node)
+        slots = self.child_slots.get(node_type)
+        if slots is None:
+            slots = self.child_slots[node_type] = [attr for attr in node_type.__slots__ if attr not in ("pos_start", "pos_end")]
+
+        for attr in slots:
+            setattr(node, attr, self.fold_item(getattr(node, attr)))
+        return node
+
+    def fold_item(self, item):
+        item_type = type(item)
+        if item_type is list:
+            return [self.fold_item(child) for child in item]
+        if item_type is tuple:
+            return tuple(self.fold_item(child) for child in item)
+        if item_type is dict:
+            return {self.fold_item(key): self.fold_item(value) for key, value in item.items()}
+        if item_type.__module__ == nodes.__name__:
+            return self.fold(item)
+        return item
+
+    ###################################
+
+    def fold_BinOpNode(self, node):
+        self.fold_children(node)
+        left, right = constant(node.left_node), constant(node.right_node)
+        if left is None or right is None or too_big(node.op_tok, left, right):
+            return node
+
+        operation = operations.BINARY_OPERATIONS.get(operations.operator_key(node.op_tok))
+        return self.folded(operation, node, left, right)
+
+    def fold_UnaryOpNode(self, node):
+        self.fold_children(node)
+        # +x is always x itself
+        if node.op_tok.type == toks.TT_PLUS:
+            return node.node
+
+        value = constant(node.node)
+        if value is None:
+            return node
+
+        operation = operations.UNARY_OPERATIONS.get(operations.operator_key(node.op_tok))
+        return self.folded(operation, node, value)
+
+    def fold_StringNode(self, node):
+        # An f-string of literals is a plain string
+        self.fold_children(node)
+        if all(isinstance(component, str) for component in node.str_components):
+            return node
+
+        values = [component if isinstance(component, str) else constant(component) for component in node.str_components]
+        if None in values:
+            return node
+
+        string = "".join(value if isinstance(value, str) else str(value) for value in values)
+        if len(string) > MAX_STRING_LENGTH:
+            return node
+        return nodes.StringNode([string], node.pos_start, node.pos_end)
+
+    def fold_RaiseNode(self, node):
+        # The message of attolle has to be written as strings, so an expression that gives a string still isn't one
+        return node
+
+    def folded(self, operation, node, *operands):
+        if operation is None:
+            return node
+
+        try:
+            value, error = operation(*operands)
+        except Exception:
+            # Errors of python itself, like an overflow, are left to happen when the expression runs as well
+            return node
+
+        if error:
+            return node
+        return literal(value, node) or node
+
+#######################################
+# CONSTANTS
+#######################################
+
+
+def constant(node):
+    # The value a literal always evaluates to, or None when node isn't a literal
+    node_type = type(node)
+    if node_type is nodes.NumberNode:
+        return Number.make(node.value)
+    if node_type is nodes.NumeralNode:
+        return Numeral(node.value)
+    if node_type is nodes.BoolNode:
+        return Bool.make(node.value == "Verus")
+    if node_type is nodes.StringNode and all(isinstance(component, str) for component in node.str_components):
+        return String("".join(node.str_components))
+    return None
+
+
+def literal(value, node):
+    # The literal that evaluates to value, in the place of node - None when there is no literal for it
+    value_type = type(value)
+    if value_type is Number and type(value.value) in (int, float) and fits(value.value):
+        return nodes.NumberNode(value.value, node.pos_start, node.pos_end)
+    if value_type is Numeral and type(value.value) in (int, float) and fits(value.value):
+        return nodes.NumeralNode(value.value, node.pos_start, node.pos_end)
+    if value_type is Bool:
+        return nodes.BoolNode("Verus" if value.value else "Falsus", node.pos_start, node.pos_end)
+    if value_type is String and len(value.value) <= MAX_STRING_LENGTH:
+        return nodes.StringNode([value.value], node.pos_start, node.pos_end)
+    return None
+
+
+def fits(number):
+    return not isinstance(number, int) or number.bit_length() <= MAX_INT_BITS
+
+
+def too_big(op_tok, left, right):
+    # Checked before the operation, since making the value could itself take too long
+    if op_tok.type == toks.TT_MUL and isinstance(left, String) and isinstance(right.value, int):
+        return len(left.value) * right.value > MAX_STRING_LENGTH
+    if op_tok.type == toks.TT_POW and isinstance(left.value, int) and isinstance(right.value, int):
+        return right.value > MAX_INT_BITS or left.value.bit_length() * right.value > MAX_INT_BITS
+    return False
@@ -5,6 +5,7 @@
 import Celeratas.helper.tokens as toks
 from Celeratas.helper.errors import (ExpectedItemError, IndentError,
                                      InteractivePrompt, InvalidSyntaxError)
+from Celeratas.lexer.TokenStream import TokenStream
 
 from .nodes import (BinOpNode, BoolNode, BreakNode, CallNode, ContinueNode,
                     DictNode, ForNode, FuncDefNode, IfNode, ListNode,
@@ -12,6 +13,43 @@ from .nodes import (BinOpNode, BoolNode, BreakNode, CallNode, ContinueNode,
                     StringNode, TryNode, UnaryOpNode, VarAccessNode,
                     VarAssignNode, WhileNode)
 from .ParseResult import ParseResult
+from .Resolver import Resolver
+
+#######################################
+# PRECEDENCE
+#######################################
+
+# How tightly each binary operator binds, the levels of expr, comp_expr, arith_expr and term in grammar.txt
+LOGIC_PRECEDENCE = 1
+COMPARISON_PRECEDENCE = 2
+ARITH_PRECEDENCE = 3
+TERM_PRECEDENCE = 4
+
+BINARY_PRECEDENCE = {
+    (toks.TT_KEYWORD, 'et'): LOGIC_PRECEDENCE,
+    (toks.TT_KEYWORD, 'aut'): LOGIC_PRECEDENCE,
+    toks.TT_EE: COMPARISON_PRECEDENCE,
+    toks.TT_NE: COMPARISON_PRECEDENCE,
+    toks.TT_LT: COMPARISON_PRECEDENCE,
+    toks.TT_GT: COMPARISON_PRECEDENCE,
+    toks.TT_LTE: COMPARISON_PRECEDENCE,
+    toks.TT_GTE: COMPARISON_PRECEDENCE,
+    toks.TT_PLUS: ARITH_PRECEDENCE,
+    toks.TT_MINUS: ARITH_PRECEDENCE,
+    toks.TT_MUL: TERM_PRECEDENCE,
+    toks.TT_DIV: TERM_PRECEDENCE,
+    toks.TT_MOD: TERM_PRECEDENCE,
+}
+
+# The tokens an expression or a statement can start with - Looking at the current token is enough to know whether one follows
+EXPRESSION_START_TYPES = frozenset((
+    toks.TT_INT, toks.TT_FLOAT, toks.TT_NUMERAL, toks.TT_STRING, toks.TT_IDENTIFIER,
+    toks.TT_PLUS, toks.TT_MINUS, toks.TT_LPAREN, toks.TT_LSQUARE, toks.TT_LBRACE,
+))
+EXPRESSION_START_KEYWORDS = frozenset(('non', 'Verus', 'Falsus', 'opus', 'si', 'tempta', 'pro', 'dum', 'attolle'))
+STATEMENT_START_KEYWORDS = EXPRESSION_START_KEYWORDS | {'redi', 'continua', 'confringe', 'transiet'}
+
+ASSIGN_TYPES = (toks.TT_EQ, toks.TT_PLUS_EQ, toks.TT_MIN_EQ, toks.TT_MUL_EQ, toks.TT_DIV_EQ, toks.TT_MOD_EQ)
 
 #######################################
 # PARSER
@@ -19,8 +57,10 @@ from .ParseResult import ParseResult
 
 
 class Parser:
+    # Nodes share the positions of their tokens - Nothing changes a position once the lexer has made the token
     def __init__(self, tokens):
-        self.tokens = tokens
+        # A list of tokens, or a TokenStream that gets them from the lexer while parsing
+        self.tokens = tokens if isinstance(tokens, TokenStream) else TokenStream(tokens)
         self.tok_idx = -1
         self.indent_count = 0
         self.in_loop = False
@@ -32,37 +72,106 @@ class Parser:
         self.update_current_tok()
         return self.current_tok
 
-    def reverse(self, amount=1):
-        self.tok_idx -= amount
-        self.update_current_tok()
-        return self.current_tok
+    def peek(self, amount=1):
+        # The token amount places after the current one - The parser never goes back, so it looks ahead instead
+        # Past the end the current token is the EOF, like advancing past it leaves it there
+        token = self.tokens.get(self.tok_idx + amount)
+        return token if token is not None else self.current_tok
+
+    def starts_expression(self):
+        tok = self.current_tok
+        return tok.type in EXPRESSION_START_TYPES or (tok.type == toks.TT_KEYWORD and tok.value in EXPRESSION_START_KEYWORDS)
+
+    def starts_statement(self):
+        tok = self.current_tok
+        return tok.type in EXPRESSION_START_TYPES or (tok.type == toks.TT_KEYWORD and tok.value in STATEMENT_START_KEYWORDS)
 
     def update_current_tok(self):
-        if self.tok_idx >= 0 and self.tok_idx < len(self.tokens):
-            self.current_tok = self.tokens[self.tok_idx]
+        if self.tok_idx >= 0:
+            token = self.tokens.get(self.tok_idx)
+            if token is not None:
+                self.current_tok = token
 
     def parse(self):
-        res = self.statements()
+        res = self.statements(top_level=True)
 
         if not res.error and self.current_tok.type != toks.TT_EOF:
-            return res.failure(InvalidSyntaxError(
+            res.failure(InvalidSyntaxError(
                 self.current_tok.pos_start, self.current_tok.pos_end,
                 "Token cannot appear after previous tokens"
             ))
+
+        # An error from the lexer comes before any error of the parser, like when every token was made before parsing
+        lexing_error = self.tokens.lexing_error()
+        if lexing_error:
+            return ParseResult().failure(lexing_error)
+
+        if not res.error:
+            Resolver().resolve(res.node)
         return res
 
+    def iter_statements(self):
+        # Parses the program one statement at a time, like the top level of statements() does, so each one can be run before
+        # the next is parsed - Yields a ParseResult with a ListNode of one statement, the last one has the error if there is one
+        first_statement = True
+
+        while True:
+            self.tokens.release(self.tok_idx)
+
+            while self.current_tok.type == toks.TT_NEWLINE:
+                self.advance()
+
+            if self.current_tok.type == toks.TT_EOF and not first_statement:
+                lexing_error = self.tokens.lexing_error()
+                if lexing_error:
+                    yield ParseResult().failure(lexing_error)
+                return
+
+            _, error = self.check_indent_amount()
+            if error:
+                yield ParseResult().failure(self.tokens.lexing_error() or error.error)
+                return
+
+            # Like statements(), the program ends at the first token that can't start a statement
+            if not first_statement and not self.starts_statement():
+                yield ParseResult().failure(self.tokens.lexing_error() or InvalidSyntaxError(
+                    self.current_tok.pos_start, self.current_tok.pos_end,
+                    "Token cannot appear after previous tokens"
+                ))
+                return
+
+            pos_start = self.current_tok.pos_start
+            statement = self.statement()
+            if statement.error:
+                yield ParseResult().failure(self.tokens.lexing_error() or statement.error)
+                return
+
+            # The lexer stops at its error, so an end of the tokens right after the statement could be where it failed
+            if self.current_tok.type == toks.TT_EOF:
+                lexing_error = self.tokens.lexing_error()
+                if lexing_error:
+                    yield ParseResult().failure(lexing_error)
+                    return
+
+            first_statement = False
+            yield ParseResult().success(Resolver().resolve(ListNode([statement.node], pos_start, self.current_tok.pos_end)))
+
+    def count_tabs(self):
+        tab_count = 0
+        while self.peek(tab_count).type == toks.TT_TAB:
+            tab_count += 1
+        return tab_count
+
     def check_indent_amount(self):
+        # The tabs are counted by looking ahead and only taken when the line belongs to the block - With fewer the block ends,
+        # and they are left for the block around it
         res = ParseResult()
-        tab_count = 0
+        tab_count = self.count_tabs()
 
-        # Check Tab count from tokens
-        while True:
-            if self.current_tok.type == toks.TT_TAB:
+        if tab_count >= self.indent_count:
+            for _ in range(tab_count):
                 res.register_advancement()
                 self.advance()
-                tab_count += 1
-            else:
-                break
 
         # Check if greater than expected tab count
         if tab_count > self.indent_count:
@@ -71,12 +180,26 @@ class Parser:
                 "Incorrect number of tabs!"))
         return tab_count, None
 
+    def continues_with(self, keyword, after_block):
+        # Whether the statement goes on with keyword, like alioquin after si - After a block the keyword starts a line with the
+        # indentation of the statement, the tabs before it are only taken when it is there
+        if not after_block:
+            return self.current_tok.matches(toks.TT_KEYWORD, keyword)
+
+        tab_count = self.count_tabs()
+        if tab_count != self.indent_count or not self.peek(tab_count).matches(toks.TT_KEYWORD, keyword):
+            return False
+
+        for _ in range(tab_count):
+            self.advance()
+        return True
+
     ###################################
 
-    def statements(self):
+    def statements(self, top_level=False):
         res = ParseResult()
         statements = []
-        pos_start = self.current_tok.pos_start.copy()
+        pos_start = self.current_tok.pos_start
 
         while self.current_tok.type == toks.TT_NEWLINE:
             res.register_advancement()
@@ -88,8 +211,10 @@ class Parser:
             return res
 
         if tab_amount < self.indent_count:
+            # Points at what comes after the tabs there are
+            tok = self.peek(tab_amount)
             return res.failure(ExpectedItemError(
-                self.current_tok.pos_start, self.current_tok.pos_end,
+                tok.pos_start, tok.pos_end,
                 "Expected Tab"))
 
         statement = res.register(self.statement())
@@ -101,6 +226,10 @@ class Parser:
         more_statements = True
 
         while True:
+            if top_level:
+                # A statement of the program is never parsed again, so its tokens aren't needed any more
+                self.tokens.release(self.tok_idx)
+
             newline_count = 0
             while self.current_tok.type == toks.TT_NEWLINE:
                 res.register_advancement()
@@ -116,27 +245,25 @@ class Parser:
             if tab_amount < self.indent_count:
                 more_statements = False
 
-            if not more_statements:
+            # The statements end at a token that can't start one, anything that can is parsed once and its error is the error
+            if not more_statements or not self.starts_statement():
                 break
 
-            statement = res.try_register(self.statement())
-
-            if not statement:
-                self.reverse(res.to_reverse_count)
-                more_statements = False
-                continue
+            statement = res.register(self.statement())
+            if res.error:
+                return res
 
             statements.append(statement)
 
         return res.success(ListNode(
             statements,
             pos_start,
-            self.current_tok.pos_end.copy()
+            self.current_tok.pos_end
         ))
 
     def statement(self):
         res = ParseResult()
-        pos_start = self.current_tok.pos_start.copy()
+        pos_start = self.current_tok.pos_start
 
         if self.current_tok.matches(toks.TT_KEYWORD, 'redi'):
             if not self.in_func:
@@ -148,10 +275,12 @@ class Parser:
             res.register_advancement()
             self.advance()
 
-            expr = res.try_register(self.expr())
-            if not expr:
-                self.reverse(res.to_reverse_count)
-            return res.success(ReturnNode(expr, pos_start, self.current_tok.pos_start.copy()))
+            expr = None
+            if self.starts_expression():
+                expr = res.register(self.expr())
+                if res.error:
+                    return res
+            return res.success(ReturnNode(expr, pos_start, self.current_tok.pos_start))
 
         elif self.current_tok.matches(toks.TT_KEYWORD, 'continua'):
             if not self.in_loop:
@@ -162,7 +291,7 @@ class Parser:
 
             res.register_advancement()
             self.advance()
-            return res.success(ContinueNode(pos_start, self.current_tok.pos_start.copy()))
+            return res.success(ContinueNode(pos_start, self.current_tok.pos_start))
 
         elif self.current_tok.matches(toks.TT_KEYWORD, 'confringe'):
             if not self.in_loop:
@@ -173,7 +302,7 @@ class Parser:
 
             res.register_advancement()
             self.advance()
-            return res.success(BreakNode(pos_start, self.current_tok.pos_start.copy()))
+            return res.success(BreakNode(pos_start, self.current_tok.pos_start))
 
         elif self.current_tok.matches(toks.TT_KEYWORD, 'transiet'):
             if not self.in_loop and not self.in_func:
@@ -184,9 +313,9 @@ class Parser:
 
             res.register_advancement()
             self.advance()
-            return res.success(PassNode(pos_start, self.current_tok.pos_start.copy()))
+            return res.success(PassNode(pos_start, self.current_tok.pos_start))
 
-        expr = res.register(self.expr())
+        expr = res.register(self.expr(multi_assign=True))
         if res.error:
             return res.failure(ExpectedItemError(
                 self.current_tok.pos_start, self.current_tok.pos_end,
@@ -194,82 +323,91 @@ class Parser:
             ))
         return res.success(expr)
 
-    def expr(self):
+    def expr(self, multi_assign=False):
+        # An expression, or an assignment to it when it is a name with only indexes after it and an assign follows
+        # Names separated by commas are only assigned to at the start of a statement, anywhere else the comma is left to the caller
         res = ParseResult()
+        tok = self.current_tok
+        pos_start = tok.pos_start
 
-        if self.current_tok.type == toks.TT_IDENTIFIER:
-            vars_to_set = []
-            pos_start = self.current_tok.pos_start.copy()
+        node = res.register(self.bin_op())
 
-            while True:
-                var_name = self.current_tok.value
-                idxes_to_change = []
-
-                res.register_advancement()
-                self.advance()
+        if res.error:
+            return res.failure(ExpectedItemError(
+                self.current_tok.pos_start, self.current_tok.pos_end,
+                "Expected expression"
+            ))
 
-                while self.current_tok.type == toks.TT_LSQUARE:
-                    res.register_advancement()
-                    self.advance()
+        if tok.type != toks.TT_IDENTIFIER or not isinstance(node, VarAccessNode) or node.attrs_to_get:
+            return res.success(node)
+        if self.current_tok.type not in ASSIGN_TYPES and not (multi_assign and self.current_tok.type == toks.TT_COMMA):
+            return res.success(node)
 
-                    idxes_to_change.append(res.register(self.bin_op(self.comp_expr, ((toks.TT_KEYWORD, 'et'), (toks.TT_KEYWORD, 'aut')))))
+        vars_to_set = [[node.var_name_to_get, node.idxes_to_get]]
 
-                    if res.error:
-                        return res
+        while self.current_tok.type == toks.TT_COMMA:
+            res.register_advancement()
+            self.advance()
 
-                    res.register_advancement()
-                    self.advance()
+            if self.current_tok.type != toks.TT_IDENTIFIER:
+                return res.failure(ExpectedItemError(
+                    self.current_tok.pos_start, self.current_tok.pos_end,
+                    "Expected identifier"
+                ))
 
-                vars_to_set.append([var_name, idxes_to_change])
+            var_name = self.current_tok.value
+            idxes_to_change = []
 
-                if not self.current_tok.type == toks.TT_COMMA:
-                    break
+            res.register_advancement()
+            self.advance()
 
+            while self.current_tok.type == toks.TT_LSQUARE:
                 res.register_advancement()
                 self.advance()
 
-                if self.current_tok.type != toks.TT_IDENTIFIER:
-                    return res.failure(ExpectedItemError(
-                        self.current_tok.pos_start, self.current_tok.pos_end,
-                        "Expected identifier"
-                    ))
+                idxes_to_change.append(res.register(self.bin_op()))
 
-            if self.current_tok.type not in [toks.TT_EQ, toks.TT_PLUS_EQ, toks.TT_MIN_EQ, toks.TT_MUL_EQ, toks.TT_DIV_EQ, toks.TT_MOD_EQ]:
-                self.reverse(res.advance_count)
-            else:
-                assign_type = self.current_tok
+                if res.error:
+                    return res
 
                 res.register_advancement()
                 self.advance()
 
-                values = []
+            vars_to_set.append([var_name, idxes_to_change])
 
-                while True:
-                    values.append(res.register(
-                        self.bin_op(self.comp_expr, ((toks.TT_KEYWORD, 'et'), (toks.TT_KEYWORD, 'aut')))))
+        if self.current_tok.type not in ASSIGN_TYPES:
+            return res.failure(ExpectedItemError(
+                self.current_tok.pos_start, self.current_tok.pos_end,
+                "Expected '='"
+            ))
 
-                    if res.error:
-                        return res
+        assign_type = self.current_tok
 
-                    if not self.current_tok.type == toks.TT_COMMA:
-                        break
+        res.register_advancement()
+        self.advance()
 
-                    res.register_advancement()
-                    self.advance()
+        values = []
 
-                return res.success(VarAssignNode(vars_to_set, values, assign_type, pos_start, pos_end=values[-1].pos_end))
+        while True:
+            values.append(res.register(
+                self.bin_op()))
 
-        node = res.register(self.bin_op(self.comp_expr, ((toks.TT_KEYWORD, 'et'), (toks.TT_KEYWORD, 'aut'))))
+            if res.error:
+                return res
 
-        if res.error:
-            return res.failure(ExpectedItemError(
-                self.current_tok.pos_start, self.current_tok.pos_end,
-                "Expected expression"
-            ))
+            if not self.current_tok.type == toks.TT_COMMA:
+                break
 
-        return res.success(node)
+            res.register_advancement()
+            self.advance()
+
+        return res.success(VarAssignNode(vars_to_set, values, assign_type, pos_start, pos_end=values[-1].pos_end))
+
+    def operand(self, min_precedence):
+        # An operand of bin_op - Anything tighter than a comparison starts with a factor, anything looser can also be a non
+        if min_precedence > COMPARISON_PRECEDENCE:
+            return self.factor()
 
-    def comp_expr(self):
         res = ParseResult()
 
         if self.current_tok.matches(toks.TT_KEYWORD, 'non'):
@@ -277,12 +415,12 @@ class Parser:
             res.register_advancement()
             self.advance()
 
-            node = res.register(self.comp_expr())
+            node = res.register(self.bin_op(COMPARISON_PRECEDENCE))
             if res.error:
                 return res
             return res.success(UnaryOpNode(op_tok, node, op_tok.pos_start, node.pos_end))
 
-        node = res.register(self.bin_op(self.arith_expr, (toks.TT_EE, toks.TT_NE, toks.TT_LT, toks.TT_GT, toks.TT_LTE, toks.TT_GTE)))
+        node = res.register(self.factor())
 
         if res.error:
             return res.failure(ExpectedItemError(
@@ -292,12 +430,6 @@ class Parser:
 
         return res.success(node)
 
-    def arith_expr(self):
-        return self.bin_op(self.term, (toks.TT_PLUS, toks.TT_MINUS))
-
-    def term(self):
-        return self.bin_op(self.factor, (toks.TT_MUL, toks.TT_DIV, toks.TT_MOD))
-
     def factor(self):
         res = ParseResult()
         tok = self.current_tok
@@ -310,14 +442,25 @@ class Parser:
                 return res
             return res.success(UnaryOpNode(tok, factor, tok.pos_start, factor.pos_end))
 
-        return self.power()
+        # power: The right side of a ^ is a factor, so 2^3^2 is 2^(3^2) and 2^-1 works
+        left = res.register(self.call())
+        if res.error:
+            return res
+
+        while self.current_tok.type == toks.TT_POW:
+            op_tok = self.current_tok
+            res.register_advancement()
+            self.advance()
+            right = res.register(self.factor())
+            if res.error:
+                return res
+            left = BinOpNode(left, op_tok, right, left.pos_start, right.pos_end)
 
-    def power(self):
-        return self.bin_op(self.call, (toks.TT_POW, ), self.factor)
+        return res.success(left)
 
     def call(self):
         res = ParseResult()
-        pos_start = self.current_tok.pos_start.copy()
+        pos_start = self.current_tok.pos_start
         atom = res.register(self.atom())
         if res.error:
             return res
@@ -345,16 +488,14 @@ class Parser:
                                     f"Duplicate argument '{arg_name}'"
                                 ))
                                 return res
-                        self.advance()
 
-                        if self.current_tok.type != toks.TT_EQ:
-                            self.reverse(1)
-                        else:
+                        if self.peek().type == toks.TT_EQ:
                             res.register_advancement()
                             res.register_advancement()
                             self.advance()
+                            self.advance()
 
-                            arg_value = res.register(self.bin_op(self.comp_expr, ((toks.TT_KEYWORD, 'et'), (toks.TT_KEYWORD, 'aut'))))
+                            arg_value = res.register(self.bin_op())
                             if res.error:
                                 return res
 
@@ -369,7 +510,7 @@ class Parser:
                                 "Positional argument cannot follow keyword argument"
                             ))
 
-                        arg_nodes[arg_idx] = res.register(self.bin_op(self.comp_expr, ((toks.TT_KEYWORD, 'et'), (toks.TT_KEYWORD, 'aut'))))
+                        arg_nodes[arg_idx] = res.register(self.bin_op())
                         if res.error:
                             return res
 
@@ -430,19 +571,14 @@ class Parser:
                 return res
             return res.success(var_access)
 
-        elif tok.matches(toks.TT_KEYWORD, 'opus') or tok.type == toks.TT_LPAREN:
-            func_def = self.func_def()
-            # If LPAREN, then func will check if it's a anonymous function and return the number of advances if it is not, the code below will then reverse the operation
-            if isinstance(func_def, int):
-                self.reverse(func_def)
-            elif res.error:
+        elif tok.matches(toks.TT_KEYWORD, 'opus') or (tok.type == toks.TT_LPAREN and self.starts_anonymous_function()):
+            func_def = res.register(self.func_def())
+            if res.error:
                 return res
-            else:
-                func_def = res.register(func_def)
-                return res.success(func_def)
+            return res.success(func_def)
 
         # For Order of operations
-        if tok.type == toks.TT_LPAREN:
+        elif tok.type == toks.TT_LPAREN:
             res.register_advancement()
             self.advance()
             expr = res.register(self.expr())
@@ -517,7 +653,7 @@ class Parser:
                 res.register_advancement()
                 self.advance()
 
-                idxes_to_get.append(res.register(self.bin_op(self.comp_expr, ((toks.TT_KEYWORD, 'et'), (toks.TT_KEYWORD, 'aut')))))
+                idxes_to_get.append(res.register(self.bin_op()))
 
                 if res.error:
                     return res
@@ -547,7 +683,7 @@ class Parser:
     def list_expr(self):
         res = ParseResult()
         element_nodes = []
-        pos_start = self.current_tok.pos_start.copy()
+        pos_start = self.current_tok.pos_start
 
         res.register_advancement()
         self.advance()
@@ -557,7 +693,7 @@ class Parser:
             self.advance()
         else:
             element_nodes.append(res.register(
-                self.bin_op(self.comp_expr, ((toks.TT_KEYWORD, 'et'), (toks.TT_KEYWORD, 'aut')))))
+                self.bin_op()))
             if res.error:
                 return res.failure(ExpectedItemError(
                     self.current_tok.pos_start, self.current_tok.pos_end,
@@ -584,13 +720,15 @@ class Parser:
         return res.success(ListNode(
             element_nodes,
             pos_start,
-            self.current_tok.pos_end.copy()
+            self.current_tok.pos_end
         ))
 
     def dict_expr(self):
         res = ParseResult()
         key_pairs = {}
-        pos_start = self.current_tok.pos_start.copy()
+        # The literal values of the keys so far, so that finding a duplicate doesn't compare against every one of them
+        key_values = set()
+        pos_start = self.current_tok.pos_start
 
         res.register_advancement()
         self.advance()
@@ -600,17 +738,17 @@ class Parser:
             self.advance()
         else:
             while True:
-                key = res.register(self.bin_op(self.comp_expr, ((toks.TT_KEYWORD, 'et'), (toks.TT_KEYWORD, 'aut'))))
+                key = res.register(self.bin_op())
                 if res.error:
                     return res
 
                 # Check for duplicate keys:
                 if isinstance(key, ListNode):
                     return res.failure(InvalidSyntaxError(self.current_tok.pos_start, self.current_tok.pos_end, "Key cannot be a list"))
-                key_value = key.str_components if isinstance(key, StringNode) else key.value
-                prev_keys_values = [x.str_components if isinstance(x, StringNode) else x.value for x in key_pairs]
-                if key_value in prev_keys_values:
+                key_value = tuple(key.str_components) if isinstance(key, StringNode) else key.value
+                if key_value in key_values:
                     return res.failure(InvalidSyntaxError(self.current_tok.pos_start, self.current_tok.pos_end, f"Duplicate key '{key}' in dict"))
+                key_values.add(key_value)
 
                 if self.current_tok.type != toks.TT_COLON:
                     return res.failure(ExpectedItemError(
@@ -621,7 +759,7 @@ class Parser:
                 res.register_advancement()
                 self.advance()
 
-                value = res.register(self.bin_op(self.comp_expr, ((toks.TT_KEYWORD, 'et'), (toks.TT_KEYWORD, 'aut'))))
+                value = res.register(self.bin_op())
                 if res.error:
                     return res
 
@@ -636,7 +774,7 @@ class Parser:
             res.register_advancement()
             self.advance()
 
-        return res.success(DictNode(key_pairs, pos_start, self.current_tok.pos_end.copy()))
+        return res.success(DictNode(key_pairs, pos_start, self.current_tok.pos_end))
 
     def if_expr(self):
         res = ParseResult()
@@ -649,11 +787,11 @@ class Parser:
     def if_expr_b(self):
         return self.if_expr_cases('alioquinsi')
 
-    def if_expr_c(self):
+    def if_expr_c(self, after_block):
         res = ParseResult()
         else_case = None
 
-        if self.current_tok.matches(toks.TT_KEYWORD, 'alioquin'):
+        if self.continues_with('alioquin', after_block):
             res.register_advancement()
             self.advance()
 
@@ -686,17 +824,17 @@ class Parser:
 
         return res.success(else_case)
 
-    def if_expr_b_or_c(self):
+    def if_expr_b_or_c(self, after_block):
         res = ParseResult()
         cases, else_case = [], None
 
-        if self.current_tok.matches(toks.TT_KEYWORD, 'alioquinsi'):
+        if self.continues_with('alioquinsi', after_block):
             all_cases = res.register(self.if_expr_b())
             if res.error:
                 return res
             cases, else_case = all_cases
         else:
-            else_case = res.register(self.if_expr_c())
+            else_case = res.register(self.if_expr_c(after_block))
             if res.error:
                 return res
 
@@ -744,7 +882,7 @@ class Parser:
                 return res
             cases.append((condition, statements, True))
 
-            all_cases = res.register(self.if_expr_b_or_c())
+            all_cases = res.register(self.if_expr_b_or_c(True))
             if res.error:
                 return res
             new_cases, else_case = all_cases
@@ -755,7 +893,7 @@ class Parser:
                 return res
             cases.append((condition, expr, False))
 
-            all_cases = res.register(self.if_expr_b_or_c())
+            all_cases = res.register(self.if_expr_b_or_c(False))
             if res.error:
                 return res
             new_cases, else_case = all_cases
@@ -765,7 +903,7 @@ class Parser:
 
     def try_expr(self):
         res = ParseResult()
-        pos_start = self.current_tok.pos_start.copy()
+        pos_start = self.current_tok.pos_start
 
         res.register_advancement()
         self.advance()
@@ -794,7 +932,7 @@ class Parser:
 
             should_return_null = True
 
-            if self.current_tok.matches(toks.TT_KEYWORD, "praeter"):
+            if self.continues_with("praeter", True):
                 self.advance()
                 res.register_advancement()
 
@@ -854,7 +992,7 @@ class Parser:
 
     def for_expr(self):
         res = ParseResult()
-        pos_start = self.current_tok.pos_start.copy()
+        pos_start = self.current_tok.pos_start
         self.in_loop = True
 
         res.register_advancement()
@@ -879,7 +1017,7 @@ class Parser:
         res.register_advancement()
         self.advance()
 
-        start_value = res.register(self.bin_op(self.comp_expr, ((toks.TT_KEYWORD, 'et'), (toks.TT_KEYWORD, 'aut'))))
+        start_value = res.register(self.bin_op())
         if res.error:
             return res
 
@@ -892,7 +1030,7 @@ class Parser:
         res.register_advancement()
         self.advance()
 
-        end_value = res.register(self.bin_op(self.comp_expr, ((toks.TT_KEYWORD, 'et'), (toks.TT_KEYWORD, 'aut'))))
+        end_value = res.register(self.bin_op())
         if res.error:
             return res
 
@@ -900,7 +1038,7 @@ class Parser:
             res.register_advancement()
             self.advance()
 
-            step_value = res.register(self.bin_op(self.comp_expr, ((toks.TT_KEYWORD, 'et'), (toks.TT_KEYWORD, 'aut'))))
+            step_value = res.register(self.bin_op())
             if res.error:
                 return res
         else:
@@ -941,7 +1079,7 @@ class Parser:
 
     def while_expr(self):
         res = ParseResult()
-        pos_start = self.current_tok.pos_start.copy()
+        pos_start = self.current_tok.pos_start
         self.in_loop = True
 
         res.register_advancement()
@@ -986,7 +1124,7 @@ class Parser:
 
     def raise_expr(self):
         res = ParseResult()
-        pos_start = self.current_tok.pos_start.copy()
+        pos_start = self.current_tok.pos_start
 
         res.register_advancement()
         self.advance()
@@ -1040,7 +1178,7 @@ class Parser:
                 if self.current_tok.type == toks.TT_EQ:
                     res.register_advancement()
                     self.advance()
-                    arg_value = res.register(self.bin_op(self.comp_expr, ((toks.TT_KEYWORD, 'et'), (toks.TT_KEYWORD, 'aut'))))
+                    arg_value = res.register(self.bin_op())
                     if res.error:
                         return res
 
@@ -1077,24 +1215,39 @@ class Parser:
         self.advance()
         return res.success(args)
 
+    def starts_anonymous_function(self):
+        # Call this function when current token is '(' - () =>, (x) =>, (x, and (x= start an anonymous function, anything else
+        # in brackets is an expression
+        tok = self.peek()
+        if tok.type == toks.TT_RPAREN:
+            return self.peek(2).type == toks.TT_ARROW
+        if tok.type != toks.TT_IDENTIFIER:
+            return False
+
+        tok = self.peek(2)
+        if tok.type == toks.TT_RPAREN:
+            return self.peek(3).type == toks.TT_ARROW
+        return tok.type in (toks.TT_COMMA, toks.TT_EQ)
+
     def func_def(self):
         # Need helper function because anynomous and full-fledged functions are handled differently
         # Call this function when current token is '('
 
         res = ParseResult()
-        pos_start = self.current_tok.pos_start.copy()
+        pos_start = self.current_tok.pos_start
         self.in_func = True
 
         # Anonymous function
         if self.current_tok.type == toks.TT_LPAREN:
             arg_name_toks = res.register(self._register_args())
-
-            # Need to divide advance count by 2 for weird inner function reasons
             if res.error:
-                return res.advance_count
+                return res
 
             if self.current_tok.type != toks.TT_ARROW:
-                return res.advance_count
+                return res.failure(ExpectedItemError(
+                    self.current_tok.pos_start, self.current_tok.pos_end,
+                    "Expected '=>'"
+                ))
 
             res.register_advancement()
             self.advance()
@@ -1170,20 +1323,23 @@ class Parser:
 
     ###################################
 
-    def bin_op(self, func_a, ops, func_b=None):
-        if func_b is None:
-            func_b = func_a
-
+    def bin_op(self, min_precedence=LOGIC_PRECEDENCE):
+        # Precedence climbing - Takes an operand, then every operator that binds at least as tightly as min_precedence
+        # The right side of an operator only takes operators that bind tighter, so operators of one level go left to right
         res = ParseResult()
-        left = res.register(func_a())
+        left = res.register(self.operand(min_precedence))
         if res.error:
             return res
 
-        while self.current_tok.type in ops or (self.current_tok.type, self.current_tok.value) in ops:
+        while True:
             op_tok = self.current_tok
+            precedence = BINARY_PRECEDENCE.get((op_tok.type, op_tok.value) if op_tok.type == toks.TT_KEYWORD else op_tok.type)
+            if precedence is None or precedence < min_precedence:
+                break
+
             res.register_advancement()
             self.advance()
-            right = res.register(func_b())
+            right = res.register(self.bin_op(precedence + 1))
             if res.error:
                 return res
             left = BinOpNode(left, op_tok, right, left.pos_start, right.pos_end)
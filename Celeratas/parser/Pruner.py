@@ -0,0 +1,98 @@
+#######################################
+# IMPORTS
+#######################################
+
+from . import nodes
+from .analysis import child_nodes
+
+#######################################
+# PRUNER
+#######################################
+
+# Statements that always leave the block they are in, so the statements after them never run
+JUMP_NODES = (nodes.ReturnNode, nodes.ContinueNode, nodes.BreakNode)
+
+
+class Pruner:
+    # Runs after the Folder when optimizing - Finds the loops, ifs and tries whose value is never used and marks them with
+    # should_return_null, like the parser does for the ones with an indented block, so no backend keeps the value of every
+    # time around a loop only to throw them all away. Statements after a redi, continua or confringe are dropped as well
+    # The value of a node is used unless it is a statement of a block whose value isn't used - The statements of the program
+    # itself are kept, as running a script gives the value of each of them
+
+    def __init__(self):
+        # The method of every type of node, looked up once per type instead of once per node
+        self.methods = {}
+
+    def prune(self, node, used=True):
+        node_type = type(node)
+        method = self.methods.get(node_type)
+        if method is None:
+            method = self.methods[node_type] = getattr(self, f'prune_{node_type.__name__}', self.prune_children)
+        method(node, used)
+        return node
+
+    def prune_children(self, node, used):
+        # The value of a node can't be worked out without the values of its children
+        for child in child_nodes(node):
+            self.prune(child)
+
+    ###################################
+
+    def prune_ListNode(self, node, used):
+        # The list isn't made when its value isn't used, so neither are the values of its elements
+        if not used:
+            for idx, element in enumerate(node.element_nodes):
+                if isinstance(element, JUMP_NODES):
+                    del node.element_nodes[idx + 1:]
+                    break
+
+        for element in node.element_nodes:
+            self.prune(element, used)
+
+    def prune_ForNode(self, node, used):
+        if not used:
+            node.should_return_null = True
+
+        for child in (node.start_value_node, node.end_value_node, node.step_value_node):
+            if child is not None:
+                self.prune(child)
+        self.prune(node.body_node, not node.should_return_null)
+
+    def prune_WhileNode(self, node, used):
+        if not used:
+            node.should_return_null = True
+
+        self.prune(node.condition_node)
+        self.prune(node.body_node, not node.should_return_null)
+
+    def prune_IfNode(self, node, used):
+        cases = []
+        for condition, expr, should_return_null in node.cases:
+            should_return_null = should_return_null or not used
+            self.prune(condition)
+            self.prune(expr, not should_return_null)
+            cases.append((condition, expr, should_return_null))
+        node.cases = cases
+
+        if node.else_case:
+            expr, should_return_null = node.else_case
+            should_return_null = should_return_null or not used
+            self.prune(expr, not should_return_null)
+            node.else_case = (expr, should_return_null)
+
+    def prune_TryNode(self, node, used):
+        if not used:
+            node.should_return_null = True
+
+        self.prune(node.try_body, not node.should_return_null)
+        # The value of the except block is never given
+        if node.except_body:
+            self.prune(node.except_body, False)
+
+    def prune_FuncDefNode(self, node, used):
+        for _, arg_value in node.args:
+            if arg_value is not None:
+                self.prune(arg_value)
+        # Only an arrow function gives the value of its body, the others give what they return
+        self.prune(node.body_node, node.should_auto_return)
@@ -0,0 +1,103 @@
+#######################################
+# IMPORTS
+#######################################
+
+from . import nodes
+from .analysis import assigned_names, child_nodes, tail_calls
+
+#######################################
+# SCOPES
+#######################################
+
+# Where a variable is found when the program runs:
+#   LOCAL - a slot in the frame of the function the name is used in
+#   ENCLOSING - a name that some other function sets, it comes from the caller since functions are dynamically scoped
+#   GLOBAL - a name outside of every function, or one that no function sets, it can only be in the symbol table of the program
+LOCAL = "local"
+ENCLOSING = "enclosing"
+GLOBAL = "global"
+
+#######################################
+# RESOLVER
+#######################################
+
+
+class Resolver:
+    # Runs once after parsing - It numbers the locals of every function and marks each variable with its scope and slot, and
+    # every call in tail position
+    # The backends use this so that a function call only needs a fixed size list and a local is found by indexing it
+
+    # Every local of every function resolved so far - The shell and curre() resolve more than one tree, and a function
+    # from one of them can call a function from another, so a global has to be checked against this before it skips the callers
+    local_names = set()
+
+    def __init__(self):
+        self.slot_names = None
+        self.tree_local_names = set()
+
+    def resolve(self, node):
+        # The locals of all functions have to be known first, a name that none of them set can only be a global
+        self.number_locals(node)
+        self.visit(node)
+        return node
+
+    def number_locals(self, node):
+        if isinstance(node, nodes.FuncDefNode):
+            slot_names = {}
+            for local_name in [arg_name for arg_name, _ in node.args] + assigned_names(node.body_node):
+                slot_names.setdefault(local_name, len(slot_names))
+            node.slot_names = slot_names
+            self.tree_local_names.update(slot_names)
+            Resolver.local_names.update(slot_names)
+
+        for child in child_nodes(node):
+            self.number_locals(child)
+
+    def visit(self, node):
+        method_name = f'visit_{type(node).__name__}'
+        method = getattr(self, method_name, self.visit_children)
+        method(node)
+
+    def visit_children(self, node):
+        for child in child_nodes(node):
+            self.visit(child)
+
+    def scope(self, name):
+        if self.slot_names is None:
+            return GLOBAL
+        if name in self.slot_names:
+            return LOCAL
+        if name in self.tree_local_names:
+            return ENCLOSING
+        return GLOBAL
+
+    def slot(self, name):
+        return None if self.slot_names is None else self.slot_names.get(name)
+
+    ###################################
+
+    def visit_VarAccessNode(self, node):
+        node.scope = self.scope(node.var_name_to_get)
+        node.slot = self.slot(node.var_name_to_get)
+        self.visit_children(node)
+
+    def visit_VarAssignNode(self, node):
+        node.slots = [self.slot(var_name) for var_name, _ in node.vars_to_set]
+        self.visit_children(node)
+
+    def visit_ForNode(self, node):
+        node.var_slot = self.slot(node.var_name)
+        self.visit_children(node)
+
+    def visit_FuncDefNode(self, node):
+        # Default values are run where the function is defined, the body gets its own locals
+        for _, arg_value in node.args:
+            if arg_value is not None:
+                self.visit(arg_value)
+
+        outer_slot_names, self.slot_names = self.slot_names, node.slot_names
+        self.visit(node.body_node)
+        self.slot_names = outer_slot_names
+
+        for call in tail_calls(node):
+            call.is_tail_call = True
@@ -0,0 +1,104 @@
+#######################################
+# IMPORTS
+#######################################
+
+from . import nodes
+
+#######################################
+# ANALYSIS
+#######################################
+
+# Helpers for the backends that look at a whole tree before running it
+
+
+def is_node(item):
+    return type(item).__module__ == nodes.__name__
+
+
+def child_nodes(node):
+    # Every node directly below this one, in the order the interpreter evaluates them
+    children = []
+
+    def collect(item):
+        if isinstance(item, (list, tuple)):
+            for child in item:
+                collect(child)
+        elif isinstance(item, dict):
+            for key, value in item.items():
+                collect(key)
+                collect(value)
+        elif is_node(item):
+            children.append(item)
+
+    # The slots of a node are listed in the order its constructor sets them
+    for attr in node.__slots__:
+        if attr not in ("pos_start", "pos_end"):
+            collect(getattr(node, attr))
+    return children
+
+
+def assigned_names(node):
+    # Names a function body can set - The bodies of inner functions are left out since they get their own locals
+    names = []
+
+    def add(name):
+        if name not in names:
+            names.append(name)
+
+    def visit(item):
+        if isinstance(item, nodes.VarAssignNode):
+            for var_name, _ in item.vars_to_set:
+                add(var_name)
+        elif isinstance(item, nodes.ForNode):
+            add(item.var_name)
+        elif isinstance(item, nodes.TryNode) and item.except_as:
+            add(item.except_as.value)
+        elif isinstance(item, nodes.FuncDefNode):
+            if item.func_name:
+                add(item.func_name)
+            for _, arg_value in item.args:
+                if arg_value is not None:
+                    visit(arg_value)
+            return
+
+        for child in child_nodes(item):
+            visit(child)
+
+    visit(node)
+    return names
+
+
+def tail_calls(func_node):
+    # The calls whose value the function gives back as it is, with nothing of the function left to run after them - A backend
+    # can run the callee in place of the function instead of inside of it. A call in a loop or a tempta is never one
+    calls = []
+
+    def statement(item):
+        # Nothing of the function runs after item, but its value isn't given back
+        if isinstance(item, nodes.ListNode) and item.element_nodes:
+            statement(item.element_nodes[-1])
+        elif isinstance(item, nodes.IfNode):
+            for _, expr, _ in item.cases:
+                statement(expr)
+            if item.else_case:
+                statement(item.else_case[0])
+        elif isinstance(item, nodes.ReturnNode) and item.node_to_return:
+            # A redi of a value that turns out to be None goes on with the function, which then ends here anyway
+            value(item.node_to_return)
+
+    def value(item):
+        # The value of item is what the function gives back
+        if isinstance(item, nodes.CallNode):
+            calls.append(item)
+        elif isinstance(item, nodes.IfNode):
+            for _, expr, should_return_null in item.cases:
+                if not should_return_null:
+                    value(expr)
+            if item.else_case and not item.else_case[1]:
+                value(item.else_case[0])
+
+    if func_node.should_auto_return:
+        value(func_node.body_node)
+    else:
+        statement(func_node.body_node)
+    return calls
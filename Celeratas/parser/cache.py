@@ -0,0 +1,86 @@
+#######################################
+# IMPORTS
+#######################################
+
+import hashlib
+import os
+import pickle
+import threading
+from functools import lru_cache
+
+from . import nodes
+from .analysis import child_nodes
+from .Resolver import Resolver
+
+#######################################
+# CACHE
+#######################################
+
+# The resolved tree of a script is kept in __celcache__ next to it, so running it again skips lexing, parsing and resolving
+# An entry is only used while the path, modification time and size of the script, the source of Celeratas and the optimization
+# level are the same
+CACHE_DIR = "__celcache__"
+
+
+def cache_path(fn):
+    directory, name = os.path.split(os.path.abspath(fn))
+    return os.path.join(directory, CACHE_DIR, name + ".pickle")
+
+
+@lru_cache(maxsize=None)
+def source_stamp():
+    # The modification times and sizes of the files of Celeratas - Working out the version instead would run git in a checkout
+    # A new version changes them too, and so does editing the parser without making a new version
+    package = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    stamp = []
+    for directory, _, names in sorted(os.walk(package)):
+        for name in sorted(names):
+            if name.endswith(".py"):
+                stat = os.stat(os.path.join(directory, name))
+                stamp.append((name, stat.st_mtime_ns, stat.st_size))
+    return hashlib.sha1(repr(stamp).encode()).hexdigest()
+
+
+def cache_key(fn, optimize):
+    stat = os.stat(fn)
+    return (os.path.abspath(fn), stat.st_mtime_ns, stat.st_size, source_stamp(), optimize)
+
+
+def function_locals(node):
+    # The Resolver remembers the locals of every tree it has seen, a tree that is loaded instead has to add its own
+    names = set(node.slot_names) if isinstance(node, nodes.FuncDefNode) else set()
+    for child in child_nodes(node):
+        names.update(function_locals(child))
+    return names
+
+
+def load(fn, optimize):
+    # The tree of the script fn, or None when there is no entry for it or the script changed since it was made
+    try:
+        key = cache_key(fn, optimize)
+        with open(cache_path(fn), "rb") as f:
+            entry_key, local_names, node = pickle.load(f)
+    except Exception:
+        # A missing script or entry, or one that was written by something else, is the same as no entry
+        return None
+
+    if entry_key != key:
+        return None
+
+    Resolver.local_names.update(local_names)
+    return node
+
+
+def store(fn, node, optimize):
+    # Keeping the tree is only to save time, so a script that can't be cached is still run
+    path = cache_path(fn)
+    try:
+        entry = pickle.dumps((cache_key(fn, optimize), function_locals(node), node), pickle.HIGHEST_PROTOCOL)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Written next to the entry and then moved over it, so a script run twice at once never reads half an entry
+        temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temp_path, "wb") as f:
+            f.write(entry)
+        os.replace(temp_path, path)
+    except (OSError, RecursionError, pickle.PicklingError):
+        pass
@@ -1,5 +1,7 @@
 
 class NumberNode:
+    __slots__ = ('value', 'pos_start', 'pos_end')
+
     def __init__(self, value, pos_start, pos_end):
         self.value = value
 
@@ -11,6 +13,8 @@ class NumberNode:
 
 
 class NumeralNode:
+    __slots__ = ('value', 'pos_start', 'pos_end')
+
     def __init__(self, value, pos_start, pos_end):
         self.value = value
 
@@ -22,6 +26,8 @@ class NumeralNode:
 
 
 class StringNode:
+    __slots__ = ('str_components', 'pos_start', 'pos_end')
+
     def __init__(self, str_components, pos_start, pos_end):
         self.str_components = str_components
 
@@ -33,6 +39,8 @@ class StringNode:
 
 
 class BoolNode:
+    __slots__ = ('value', 'pos_start', 'pos_end')
+
     def __init__(self, value, pos_start, pos_end):
         self.value = value
 
@@ -44,6 +52,8 @@ class BoolNode:
 
 
 class ListNode:
+    __slots__ = ('element_nodes', 'pos_start', 'pos_end')
+
     def __init__(self, element_nodes, pos_start, pos_end):
         self.element_nodes = element_nodes
 
@@ -52,6 +62,8 @@ class ListNode:
 
 
 class DictNode:
+    __slots__ = ('key_pairs', 'pos_start', 'pos_end')
+
     def __init__(self, key_pairs, pos_start, pos_end):
         self.key_pairs = key_pairs
 
@@ -60,26 +72,37 @@ class DictNode:
 
 
 class VarAccessNode:
+    __slots__ = ('var_name_to_get', 'idxes_to_get', 'attrs_to_get', 'scope', 'slot', 'pos_start', 'pos_end')
+
     def __init__(self, var_name_to_get, idxes_to_get, attrs_to_get, pos_start, pos_end):
         self.var_name_to_get = var_name_to_get
         self.idxes_to_get = idxes_to_get
         self.attrs_to_get = attrs_to_get
+        # Filled in by the Resolver
+        self.scope = None
+        self.slot = None
 
         self.pos_start = pos_start
         self.pos_end = pos_end
 
 
 class VarAssignNode:
+    __slots__ = ('vars_to_set', 'values_to_set', 'assign_type', 'slots', 'pos_start', 'pos_end')
+
     def __init__(self, vars_to_set, values_to_set, assign_type, pos_start, pos_end):
         self.vars_to_set = vars_to_set
         self.values_to_set = values_to_set
         self.assign_type = assign_type
+        # Filled in by the Resolver, one slot per variable
+        self.slots = None
 
         self.pos_start = pos_start
         self.pos_end = pos_end
 
 
 class BinOpNode:
+    __slots__ = ('left_node', 'op_tok', 'right_node', 'pos_start', 'pos_end')
+
     def __init__(self, left_node, op_tok, right_node, pos_start, pos_end):
         self.left_node = left_node
         self.op_tok = op_tok
@@ -93,6 +116,8 @@ class BinOpNode:
 
 
 class UnaryOpNode:
+    __slots__ = ('op_tok', 'node', 'pos_start', 'pos_end')
+
     def __init__(self, op_tok, node, pos_start, pos_end):
         self.op_tok = op_tok
         self.node = node
@@ -105,6 +130,8 @@ class UnaryOpNode:
 
 
 class IfNode:
+    __slots__ = ('cases', 'else_case', 'pos_start', 'pos_end')
+
     def __init__(self, cases, else_case, pos_start, pos_end):
         self.cases = cases
         self.else_case = else_case
@@ -114,6 +141,8 @@ class IfNode:
 
 
 class TryNode:
+    __slots__ = ('try_body', 'except_body', 'except_name', 'except_as', 'should_return_null', 'pos_start', 'pos_end')
+
     def __init__(self, try_body, except_body, except_name, except_as, should_return_null, pos_start, pos_end):
         self.try_body = try_body
         self.except_body = except_body
@@ -126,6 +155,8 @@ class TryNode:
 
 
 class ForNode:
+    __slots__ = ('var_name', 'start_value_node', 'end_value_node', 'step_value_node', 'body_node', 'should_return_null', 'var_slot', 'pos_start', 'pos_end')
+
     def __init__(self, var_name, start_value_node, end_value_node, step_value_node, body_node, should_return_null, pos_start, pos_end):
         self.var_name = var_name
         self.start_value_node = start_value_node
@@ -133,12 +164,16 @@ class ForNode:
         self.step_value_node = step_value_node
         self.body_node = body_node
         self.should_return_null = should_return_null
+        # Filled in by the Resolver
+        self.var_slot = None
 
         self.pos_start = pos_start
         self.pos_end = pos_end
 
 
 class WhileNode:
+    __slots__ = ('condition_node', 'body_node', 'should_return_null', 'pos_start', 'pos_end')
+
     def __init__(self, condition_node, body_node, should_return_null, pos_start, pos_end):
         self.condition_node = condition_node
         self.body_node = body_node
@@ -149,6 +184,8 @@ class WhileNode:
 
 
 class RaiseNode:
+    __slots__ = ('error_to_raise', 'pos_start', 'pos_end')
+
     def __init__(self, error_to_raise, pos_start, pos_end):
         self.error_to_raise = error_to_raise
 
@@ -157,26 +194,36 @@ class RaiseNode:
 
 
 class FuncDefNode:
+    __slots__ = ('func_name', 'args', 'body_node', 'should_auto_return', 'slot_names', 'pos_start', 'pos_end')
+
     def __init__(self, func_name, args, body_node, should_auto_return, pos_start, pos_end):
         self.func_name = func_name
         self.args = args
         self.body_node = body_node
         self.should_auto_return = should_auto_return
+        # Filled in by the Resolver
+        self.slot_names = None
 
         self.pos_start = pos_start
         self.pos_end = pos_end
 
 
 class CallNode:
+    __slots__ = ('node_to_call', 'arg_nodes', 'is_tail_call', 'pos_start', 'pos_end')
+
     def __init__(self, node_to_call, arg_nodes, pos_start, pos_end):
         self.node_to_call = node_to_call
         self.arg_nodes = arg_nodes
+        # Filled in by the Resolver
+        self.is_tail_call = False
 
         self.pos_start = pos_start
         self.pos_end = pos_end
 
 
 class ReturnNode:
+    __slots__ = ('node_to_return', 'pos_start', 'pos_end')
+
     def __init__(self, node_to_return, pos_start, pos_end):
         self.node_to_return = node_to_return
 
@@ -185,18 +232,24 @@ class ReturnNode:
 
 
 class ContinueNode:
+    __slots__ = ('pos_start', 'pos_end')
+
     def __init__(self, pos_start, pos_end):
         self.pos_start = pos_start
         self.pos_end = pos_end
 
 
 class BreakNode:
+    __slots__ = ('pos_start', 'pos_end')
+
     def __init__(self, pos_start, pos_end):
         self.pos_start = pos_start
         self.pos_end = pos_end
 
 
 class PassNode:
+    __slots__ = ('pos_start', 'pos_end')
+
     def __init__(self, pos_start, pos_end):
         self.pos_start = pos_start
         self.pos_end = pos_end
@@ -2,74 +2,66 @@
 # IMPORTS
 #######################################
 
-# Readline will make the up and down arrows cycle through history
-import readline
+import argparse
 import sys
 from datetime import datetime
 
-import inquirer
-
-import Celeratas.interpreter.constants as constants
 from Celeratas.helper.errors import InteractivePrompt
 
-from .interpreter.Context import Context
-from .interpreter.Interpreter import Interpreter
-from .interpreter.SymbolTable import SymbolTable
 from .interpreter.values import List
-from .lexer.Lexer import Lexer
-from .parser.Parser import Parser
+from .parser import cache
+from .Runtime import (BACKENDS, DEFAULT_OPTIMIZE, LEXERS, OPTIMIZE_LEVELS,
+                      Runtime, disassemble_script, parse_script)
 
 #######################################
-# GLOBAL SYMBOL TABLE
+# DEFAULT RUNTIME
 #######################################
 
-global_symbol_table = SymbolTable()
-global_symbol_table.set("nil", constants.Number.null)
-global_symbol_table.set("pi", constants.Number.math_PI)
-global_symbol_table.set("scribe", constants.BuiltInFunction.print)
-global_symbol_table.set("initus", constants.BuiltInFunction.input)
-global_symbol_table.set("purgo", constants.BuiltInFunction.clear)
-global_symbol_table.set("est_numerus", constants.BuiltInFunction.is_number)
-global_symbol_table.set("est_filum", constants.BuiltInFunction.is_string)
-global_symbol_table.set("est_album", constants.BuiltInFunction.is_list)
-global_symbol_table.set("est_opus", constants.BuiltInFunction.is_function)
-global_symbol_table.set("adde", constants.BuiltInFunction.append)
-global_symbol_table.set("remove", constants.BuiltInFunction.pop)
-global_symbol_table.set("extende", constants.BuiltInFunction.extend)
-global_symbol_table.set("longitudo", constants.BuiltInFunction.len)
-global_symbol_table.set("finde", constants.BuiltInFunction.split)
-global_symbol_table.set("curre", constants.BuiltInFunction.run)
-#######################################
-# RUN SCRIPT FUNCTION
-#######################################
+# The runtime behind the functions below, for callers that only ever run one program at a time
+default_runtime = Runtime()
+global_symbol_table = default_runtime.global_symbol_table
 
-# Function Out of class because curre() needs to access it
 
+def run_script(fn, text, backend="interpreter", lexer="scanner", cached=False):
+    return default_runtime.run_script(fn, text, backend, lexer, cached)
 
-def run_script(fn, text):
-    # Generate tokens
-    lexer = Lexer(fn, text)
-    tokens, error = lexer.make_tokens()
-    if error:
-        return None, error
 
-    # Generate AST
-    parser = Parser(tokens)
-    ast = parser.parse()
-    if ast.error:
-        return None, ast.error
+def stream_script(fn, text, backend="interpreter", lexer="scanner"):
+    return default_runtime.stream_script(fn, text, backend, lexer)
 
-    # Run program
-    interpreter = Interpreter(recursion_depth=0)
-    context = Context('<program>')
-    context.symbol_table = global_symbol_table
-    result = interpreter.visit(ast.node, context)
+#######################################
+# COMMAND LINE ARGUMENTS
+#######################################
 
-    return result.value, result.error
+
+def parse_args(argv):
+    arg_parser = argparse.ArgumentParser(prog="celer", description="The Latin Programming Language")
+    arg_parser.add_argument("--backend", choices=BACKENDS, default="interpreter",
+                            help="how programs are executed (default: interpreter)")
+    arg_parser.add_argument("--lexer", choices=LEXERS, default="scanner",
+                            help="how scripts are split into tokens (default: scanner)")
+    arg_parser.add_argument("--stream", action="store_true",
+                            help="run each statement of the script as soon as it is parsed, for scripts too big to hold in memory")
+    arg_parser.add_argument("--no-cache", action="store_true",
+                            help=f"parse every script from scratch instead of keeping its tree in {cache.CACHE_DIR}")
+    arg_parser.add_argument("-O", "--optimize", type=int, choices=OPTIMIZE_LEVELS, default=DEFAULT_OPTIMIZE,
+                            help=f"0 runs scripts as they are written, 1 works out expressions of literals once and doesn't keep the values of loops nobody uses (default: {DEFAULT_OPTIMIZE})")
+    arg_parser.add_argument("--disassemble", action="store_true", help="print the bytecode of the script instead of running it")
+    arg_parser.add_argument("file", nargs="?", help="script to run, the interactive shell is opened if it is left out")
+    arg_parser.add_argument("args", nargs=argparse.REMAINDER, help="arguments passed to the script as __args__")
+    return arg_parser.parse_args(argv)
 
 
 class Shell:
-    def __init__(self):
+    def __init__(self, argv=None):
+        argv = sys.argv[1:] if argv is None else argv
+        if argv[:1] == ["batch"]:
+            # celer batch runs many scripts at once instead of one (see batch.py)
+            from . import batch
+            sys.exit(batch.main(argv[1:]))
+
+        self.options = parse_args(argv)
+        self.runtime = Runtime(cache=not self.options.no_cache, optimize=self.options.optimize)
         self.start()
 
     #######################################
@@ -91,6 +83,9 @@ class Shell:
     #######################################
 
     def help_menu(self):
+        # Only needed for the help menu, and slow to import
+        import inquirer
+
         while True:
             num_prompt = [
                 inquirer.List('num',
@@ -117,7 +112,7 @@ class Shell:
                 print('\nscribe(value_to_print) -> print\ninitus(message_to_print) -> input\npurgo() -> clear\nest_numerus(value_to_check) -> is_number')
                 print('est_filum(value_to_check) -> is_string\nest_album(value_to_check) -> is_list\nest_opus(value_to_check) -> is_function')
                 print('adde(value_to_add) -> append\nremove(value_to_remove) -> pop\nextende(list_to_extend) -> extend\nlongitudo(value_to_check) -> length')
-                print('finde(string_to_split, seperator) -> split\ncurre(file_to_run) -> run\n')
+                print('finde(string_to_split, seperator) -> split\ncurre(file_to_run) -> run\nimporta(file_to_import) -> import\n')
             else:
                 break
 
@@ -144,7 +139,11 @@ class Shell:
     #######################################
 
     def get_result(self, fn, script, interactive):
-        result, error = run_script(fn, script)
+        if self.options.stream and not interactive:
+            result, error = self.runtime.stream_script(fn, script, self.options.backend, self.options.lexer)
+        else:
+            # Only a script that was read from a file can be cached
+            result, error = self.runtime.run_script(fn, script, self.options.backend, self.options.lexer, cached=not interactive)
         result = [x for x in result.elements if x is not None] if result else None
 
         if error:
@@ -166,21 +165,28 @@ class Shell:
     #######################################
 
     def start(self):
-        global_symbol_table.set("__args__", List(sys.argv[2:]) if len(sys.argv) > 2 else List([]))
+        self.runtime.global_symbol_table.set("__args__", List(self.options.args))
         try:
             # Read file from CLI args
-            if len(sys.argv) > 1:
+            if self.options.file:
                 try:
-                    fn = sys.argv[1]
+                    fn = self.options.file
                     with open(fn, "r") as f:
                         script = f.read()
-                    self.get_result(fn, script, interactive=False)
+                    if self.options.disassemble:
+                        listing, error = disassemble_script(fn, script, self.options.lexer, not self.options.no_cache, self.options.optimize)
+                        print(error.as_string() if error else listing)
+                    else:
+                        self.get_result(fn, script, interactive=False)
                 except FileNotFoundError:
                     print(f"Can't open file {fn}: No such file")
                 except UnicodeDecodeError:
                     print(f"Can't open file {fn}: Invalid file format")
             else:
                 # Interactive Mode
+                # Readline will make the up and down arrows cycle through history
+                import readline
+
                 time = self.get_time()
                 print(
                     f"Celeratas versio unus.tres.unus (defalta, {time})\nScribe 'auxilium' auxilio")
@@ -0,0 +1,47 @@
+#####################################
+# IMPORTS
+#####################################
+
+from Celeratas.interpreter.signals import Failure, TailCall, capture
+from Celeratas.interpreter.values import Function
+
+#####################################
+# TRANSPILED FUNCTION
+#####################################
+
+
+class TranspiledFunction(Function):
+    # A function whose body was transpiled to a python function taking (context, slots, recursion_depth)
+    __slots__ = ('python_function',)
+
+    def __init__(self, name, body_node, arg_names, should_auto_return, python_function, slot_names):
+        super().__init__(name, body_node, arg_names, should_auto_return, slot_names)
+        self.python_function = python_function
+
+    def execute(self, args, recursion_depth):
+        # Only used when the function is called from outside of transpiled code, which expects an RTResult
+        return capture(self.call, args, recursion_depth)
+
+    def call(self, args, recursion_depth):
+        function = self
+
+        # A call in tail position gives back the function to run next instead of running it inside of this one
+        while True:
+            exec_ctx = function.generate_new_context()
+
+            res = function.check_and_populate_args(function.arg_names, args, exec_ctx)
+            if res.error:
+                raise Failure(res.error)
+
+            value = function.python_function(exec_ctx, exec_ctx.symbol_table.slots, recursion_depth + 1)
+            if type(value) is not TailCall:
+                return value
+            function, args = value.function, value.args
+
+    def copy(self):
+        copy = TranspiledFunction(self.name, self.body_node, self.arg_names, self.should_auto_return,
+                                  self.python_function, self.slot_names)
+        copy.module_table = self.module_table
+        copy.set_context(self.context)
+        copy.set_pos(self.pos_start, self.pos_end)
+        return copy
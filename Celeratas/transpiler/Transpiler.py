@@ -0,0 +1,528 @@
+#######################################
+# IMPORTS
+#######################################
+
+import ast
+
+import Celeratas.helper.tokens as toks
+import Celeratas.interpreter.operations as operations
+import Celeratas.parser.nodes as nodes
+from Celeratas.helper.errors import RTError, TypingError
+from Celeratas.interpreter.signals import capture
+from Celeratas.interpreter.values import Bool, Number, Numeral, String
+from Celeratas.parser.analysis import child_nodes
+from Celeratas.parser.Resolver import GLOBAL
+
+from . import runtime
+
+#######################################
+# TRANSPILER
+#######################################
+
+# Nodes that can't be written as a python expression
+STATEMENT_NODES = (nodes.VarAssignNode, nodes.TryNode, nodes.ForNode, nodes.WhileNode,
+                   nodes.ReturnNode, nodes.BreakNode, nodes.ContinueNode)
+
+
+class Transpiler:
+    # Turns an AST into a python ast.Module, which CPython compiles and runs - The values still follow Celeratas semantics
+    # because every operation goes through the helpers in runtime.py
+    # Every python statement gets the line of the node it came from and the module is compiled with the Celeratas file name
+    def __init__(self, fn="<program>"):
+        self.fn = fn
+        self.namespace = dict(runtime.NAMESPACE)
+        # Read when the program is transpiled, it can be set for the whole process, see operations.set_max_recursion_depth
+        self.namespace["MAX_RECURSION_DEPTH"] = operations.MAX_RECURSION_DEPTH
+        self.functions = []
+        self.body = None
+        self.slot_names = {}
+        self.loop_depth = 0
+        self.in_function = False
+        self.name_count = 0
+        self.statement_cache = {}
+
+    def run(self, node, context, recursion_depth=0):
+        return capture(self.transpile(node), context, recursion_depth)
+
+    def transpile(self, node):
+        # Returns the python function that runs the program, it takes (context, recursion_depth)
+        code = compile(self.to_module(node), self.fn, "exec")
+        exec(code, self.namespace)
+        return self.namespace["_program"]
+
+    def to_module(self, node):
+        program = self.function_def("_program", ["context", "recursion_depth"], node, None)
+        module = ast.Module(body=self.functions + [program], type_ignores=[])
+        return ast.fix_missing_locations(module)
+
+    def expr(self, node):
+        method_name = f'expr_{type(node).__name__}'
+        method = getattr(self, method_name, self.no_expr_method)
+        return method(node)
+
+    def no_expr_method(self, node):
+        raise Exception(f'No expr_{type(node).__name__} method defined')
+
+    ###################################
+    # PYTHON AST HELPERS
+    ###################################
+
+    def new_name(self, prefix):
+        self.name_count += 1
+        return f"{prefix}{self.name_count}"
+
+    def load(self, name):
+        return ast.Name(id=name, ctx=ast.Load())
+
+    def store_target(self, name):
+        return ast.Name(id=name, ctx=ast.Store())
+
+    def ref(self, value):
+        # Objects that can't be written as a python literal are put in the namespace of the module
+        name = self.new_name("_k")
+        self.namespace[name] = value
+        return self.load(name)
+
+    def call(self, func_name, *args):
+        return ast.Call(func=self.load(func_name), args=list(args), keywords=[])
+
+    def method(self, value, method_name, *args):
+        return ast.Call(func=ast.Attribute(value=value, attr=method_name, ctx=ast.Load()), args=list(args), keywords=[])
+
+    def locate(self, py_node, node):
+        py_node.lineno = py_node.end_lineno = node.pos_start.ln + 1
+        py_node.col_offset = py_node.end_col_offset = node.pos_start.col
+        return py_node
+
+    def emit(self, statement, node):
+        self.body.append(self.locate(statement, node))
+
+    def assign(self, name, value, node):
+        self.emit(ast.Assign(targets=[self.store_target(name)], value=value), node)
+
+    def block(self, compile_block):
+        outer_body = self.body
+        self.body = []
+        compile_block()
+        statements, self.body = self.body, outer_body
+        return statements or [ast.Pass()]
+
+    def spill(self, value, node):
+        # Keeps the result of an expression in a temporary so statements emitted after it can't run before it
+        if isinstance(value, (ast.Constant, ast.Name)):
+            return value
+        name = self.new_name("_t")
+        self.assign(name, value, node)
+        return self.load(name)
+
+    def value(self, node, should_spill):
+        value = self.expr(node)
+        return self.spill(value, node) if should_spill else value
+
+    def needs_statements(self, node):
+        if id(node) not in self.statement_cache:
+            if isinstance(node, STATEMENT_NODES):
+                needs_statements = True
+            elif isinstance(node, nodes.FuncDefNode):
+                needs_statements = any(self.needs_statements(value) for _, value in node.args if value is not None)
+            else:
+                needs_statements = any(self.needs_statements(child) for child in child_nodes(node))
+            self.statement_cache[id(node)] = needs_statements
+        return self.statement_cache[id(node)]
+
+    def discard(self, node):
+        # Runs a node for its side effects only - The values of a list of statements don't have to be collected then
+        if isinstance(node, nodes.ListNode):
+            for element_node in node.element_nodes:
+                self.discard(element_node)
+            return
+
+        value = self.expr(node)
+        if not isinstance(value, (ast.Constant, ast.Name)):
+            self.emit(ast.Expr(value=value), node)
+
+    def context(self):
+        return self.load("context")
+
+    ###################################
+    # VARIABLES
+    ###################################
+
+    def load_var(self, var_name, node):
+        if node.scope == GLOBAL:
+            lookup = self.call("load_global", ast.Constant(var_name), self.load("symbol_table"))
+        else:
+            lookup = self.method(self.load("symbol_table"), "get", ast.Constant(var_name))
+        slot = self.slot_names.get(var_name)
+        if slot is not None:
+            # An unset local falls back to the caller, just like a missing name would
+            local = ast.Subscript(value=self.load("slots"), slice=ast.Constant(slot), ctx=ast.Load())
+            lookup = ast.BoolOp(op=ast.Or(), values=[local, lookup])
+        return self.call("load_name", lookup, ast.Constant(var_name), self.ref(node), self.context())
+
+    def store_var(self, var_name, value, node):
+        slot = self.slot_names.get(var_name)
+        if slot is None:
+            self.emit(ast.Expr(value=self.method(self.load("symbol_table"), "set", ast.Constant(var_name), value)), node)
+        else:
+            target = ast.Subscript(value=self.load("slots"), slice=ast.Constant(slot), ctx=ast.Store())
+            self.emit(ast.Assign(targets=[target], value=value), node)
+
+    def remove_var(self, var_name, node):
+        slot = self.slot_names.get(var_name)
+        if slot is None:
+            self.emit(ast.Expr(value=self.method(self.load("symbol_table"), "remove", ast.Constant(var_name))), node)
+        else:
+            self.store_var(var_name, ast.Constant(None), node)
+
+    def assigned_value(self, var_name):
+        # The value an indexed assignment changes - It has to be set in the current symbol table, not in a parent
+        slot = self.slot_names.get(var_name)
+        if slot is None:
+            symbols = ast.Attribute(value=self.load("symbol_table"), attr="symbols", ctx=ast.Load())
+            return self.method(symbols, "get", ast.Constant(var_name))
+        return ast.Subscript(value=self.load("slots"), slice=ast.Constant(slot), ctx=ast.Load())
+
+    ###################################
+    # FUNCTIONS
+    ###################################
+
+    def function_def(self, name, params, body_node, func_node):
+        outer_state = (self.body, self.slot_names, self.loop_depth, self.in_function)
+        self.body = []
+        self.loop_depth = 0
+        # Inside of a function every local the Resolver found gets a slot, the program keeps using the symbol table
+        self.slot_names = func_node.slot_names if func_node else {}
+        self.in_function = func_node is not None
+
+        symbol_table = ast.Attribute(value=self.context(), attr="symbol_table", ctx=ast.Load())
+        self.assign("symbol_table", symbol_table, body_node)
+
+        if func_node and not func_node.should_auto_return:
+            self.discard(body_node)
+            self.emit(ast.Return(value=ast.Constant(None)), body_node)
+        else:
+            self.emit(ast.Return(value=self.expr(body_node)), body_node)
+
+        function = ast.FunctionDef(
+            name=name,
+            args=ast.arguments(posonlyargs=[], args=[ast.arg(arg=param) for param in params],
+                               kwonlyargs=[], kw_defaults=[], defaults=[]),
+            body=self.body,
+            decorator_list=[],
+            returns=None,
+        )
+        self.locate(function, func_node or body_node)
+
+        self.body, self.slot_names, self.loop_depth, self.in_function = outer_state
+        return function
+
+    ###################################
+    # NODES
+    ###################################
+
+    def expr_NumberNode(self, node):
+        number = Number(node.value).set_pos(node.pos_start, node.pos_end)
+        return self.method(self.ref(number), "set_context", self.context())
+
+    def expr_NumeralNode(self, node):
+        numeral = Numeral(node.value).set_pos(node.pos_start, node.pos_end)
+        return self.method(self.ref(numeral), "set_context", self.context())
+
+    def expr_StringNode(self, node):
+        if all(isinstance(component, str) for component in node.str_components):
+            string = String("".join(node.str_components)).set_pos(node.pos_start, node.pos_end)
+            return self.method(self.ref(string), "set_context", self.context())
+
+        should_spill = self.needs_statements(node)
+        parts = tuple(component if isinstance(component, str) else None for component in node.str_components)
+        values = [
+            self.value(component, should_spill)
+            for component in node.str_components if not isinstance(component, str)
+        ]
+        return self.call("make_string", ast.Constant(parts), ast.List(elts=values, ctx=ast.Load()),
+                         self.ref(node), self.context())
+
+    def expr_BoolNode(self, node):
+        boolean = Bool(node.value == "Verus").set_pos(node.pos_start, node.pos_end)
+        return self.method(self.ref(boolean), "set_context", self.context())
+
+    def expr_ListNode(self, node):
+        should_spill = self.needs_statements(node)
+        elements = [self.value(element_node, should_spill) for element_node in node.element_nodes]
+        return self.call("make_list", ast.List(elts=elements, ctx=ast.Load()), self.ref(node), self.context())
+
+    def expr_DictNode(self, node):
+        should_spill = self.needs_statements(node)
+        items = []
+        for key, value in node.key_pairs.items():
+            items.append(self.value(key, should_spill))
+            items.append(self.value(value, should_spill))
+        return self.call("make_dict", ast.List(elts=items, ctx=ast.Load()), self.ref(node), self.context())
+
+    def expr_VarAccessNode(self, node):
+        should_spill = self.needs_statements(node)
+        value = self.load_var(node.var_name_to_get, node)
+
+        if node.idxes_to_get:
+            value = self.call("check_indexable", value, self.ref(node), self.context())
+        for idx_to_get in node.idxes_to_get:
+            if should_spill:
+                value = self.spill(value, node)
+            value = self.call("get_index", value, self.expr(idx_to_get), self.ref(node), self.context())
+
+        for attr_to_get in node.attrs_to_get:
+            value = self.call("get_attribute", value, ast.Constant(attr_to_get), self.ref(node), self.context())
+
+        return value
+
+    def expr_VarAssignNode(self, node):
+        if len(node.vars_to_set) != len(node.values_to_set):
+            error = self.call("fail", self.ref(TypingError), ast.Constant('Must have the same number of variables and values'),
+                              self.ref(node), self.context())
+            self.emit(ast.Expr(value=error), node)
+            return ast.Constant(None)
+
+        for (var_name, idxes_to_change), value_node in zip(node.vars_to_set, node.values_to_set):
+            should_spill = any(self.needs_statements(idx_to_change) for idx_to_change in idxes_to_change)
+            value = self.value(value_node, should_spill)
+
+            if idxes_to_change:
+                var_to_change = self.call("assign_target", self.assigned_value(var_name), ast.Constant(var_name),
+                                          self.ref(node), self.context())
+                if should_spill:
+                    var_to_change = self.spill(var_to_change, node)
+                idx_values = [self.value(idx_to_change, should_spill) for idx_to_change in idxes_to_change]
+                value = self.call("set_index", value, var_to_change, ast.List(elts=idx_values, ctx=ast.Load()),
+                                  self.ref(node), self.context())
+
+            if node.assign_type.type != toks.TT_EQ:
+                operation = operations.AUGMENTED_OPERATIONS[node.assign_type.type]
+                old_value = self.method(self.load("symbol_table"), "get", ast.Constant(var_name))
+                value = self.call("augmented", self.ref(operation), value, old_value, ast.Constant(var_name),
+                                  self.ref(node), self.context())
+
+            self.store_var(var_name, value, node)
+
+        return ast.Constant(None)
+
+    def expr_BinOpNode(self, node):
+        operation = operations.BINARY_OPERATIONS[operations.operator_key(node.op_tok)]
+        left = self.value(node.left_node, self.needs_statements(node.right_node))
+        right = self.expr(node.right_node)
+        return self.call("binary", self.ref(operation), left, right, self.ref(node), self.context())
+
+    def expr_UnaryOpNode(self, node):
+        operation = operations.UNARY_OPERATIONS[operations.operator_key(node.op_tok)]
+        return self.call("unary", self.ref(operation), self.expr(node.node), self.ref(node), self.context())
+
+    def expr_IfNode(self, node):
+        if not self.needs_statements(node):
+            if node.else_case:
+                else_expr, should_return_null = node.else_case
+                result = self.branch_value(self.expr(else_expr), should_return_null)
+            else:
+                result = ast.Constant(None)
+
+            for condition, expr, should_return_null in reversed(node.cases):
+                test = self.call("truth", self.expr(condition), self.ref(node), self.context())
+                result = ast.IfExp(test=test, body=self.branch_value(self.expr(expr), should_return_null), orelse=result)
+            return result
+
+        result = self.new_name("_t")
+
+        def branch(expr, should_return_null):
+            if should_return_null:
+                self.discard(expr)
+                self.assign(result, ast.Constant(None), node)
+            else:
+                self.assign(result, self.expr(expr), node)
+
+        def case(idx):
+            if idx == len(node.cases):
+                if node.else_case:
+                    branch(*node.else_case)
+                else:
+                    self.assign(result, ast.Constant(None), node)
+                return
+
+            condition, expr, should_return_null = node.cases[idx]
+            test = self.call("truth", self.expr(condition), self.ref(node), self.context())
+            body = self.block(lambda: branch(expr, should_return_null))
+            orelse = self.block(lambda: case(idx + 1))
+            self.emit(ast.If(test=test, body=body, orelse=orelse), node)
+
+        case(0)
+        return self.load(result)
+
+    def branch_value(self, value, should_return_null):
+        # (value, None)[1] still runs the expression, but gives None
+        if not should_return_null:
+            return value
+        return ast.Subscript(value=ast.Tuple(elts=[value, ast.Constant(None)], ctx=ast.Load()),
+                             slice=ast.Constant(1), ctx=ast.Load())
+
+    def expr_TryNode(self, node):
+        result = self.new_name("_t")
+        caught = self.new_name("_e")
+        check_except_name = ast.Expr(value=self.call("check_except_name", self.ref(node), self.context()))
+
+        try_body = self.block(lambda: self.assign(result, self.expr(node.try_body), node))
+
+        def handler():
+            self.emit(check_except_name, node)
+            error = ast.Attribute(value=self.load(caught), attr="error", ctx=ast.Load())
+
+            def except_body():
+                if node.except_as:
+                    self.store_var(node.except_as.value, self.call("caught_error", error), node)
+                self.discard(node.except_body)
+                if node.except_as:
+                    self.remove_var(node.except_as.value, node)
+
+            if node.except_body:
+                test = self.call("should_except", self.ref(node), error)
+                self.emit(ast.If(test=test, body=self.block(except_body), orelse=[]), node)
+            # An error that does not match the praeter is swallowed, just like in the interpreter
+            self.assign(result, ast.Constant(None), node)
+
+        def no_error():
+            self.emit(check_except_name, node)
+            if node.should_return_null:
+                self.assign(result, ast.Constant(None), node)
+
+        handlers = [ast.ExceptHandler(type=self.load("Failure"), name=caught, body=self.block(handler))]
+        self.emit(ast.Try(body=try_body, handlers=handlers, orelse=self.block(no_error), finalbody=[]), node)
+        return self.load(result)
+
+    def loop_body(self, node, elements):
+        # confringe and continua raised by a function called in the body still have to stop this loop
+        def body():
+            self.loop_depth += 1
+            if elements:
+                self.emit(ast.Expr(value=self.method(self.load(elements), "append", self.expr(node.body_node))), node)
+            else:
+                self.discard(node.body_node)
+            self.loop_depth -= 1
+
+        handlers = [
+            ast.ExceptHandler(type=self.load("LoopBreak"), name=None, body=[ast.Break()]),
+            ast.ExceptHandler(type=self.load("LoopContinue"), name=None, body=[ast.Continue()]),
+        ]
+        self.emit(ast.Try(body=self.block(body), handlers=handlers, orelse=[], finalbody=[]), node)
+
+    def loop_result(self, node, elements):
+        if not elements:
+            return ast.Constant(None)
+        return self.call("make_list", self.load(elements), self.ref(node), self.context())
+
+    def expr_ForNode(self, node):
+        start_value = self.value(node.start_value_node, True)
+        end_value = self.value(node.end_value_node, True)
+        if node.step_value_node:
+            step_value = self.value(node.step_value_node, True)
+        else:
+            step_value = self.ref(Number(1))
+
+        number = self.new_name("_i")
+        for_range = self.call("for_range", start_value, end_value, step_value, self.ref(node.start_value_node), self.context())
+
+        elements = None if node.should_return_null else self.new_name("_l")
+        if elements:
+            self.assign(elements, ast.List(elts=[], ctx=ast.Load()), node)
+
+        def body():
+            self.store_var(node.var_name, self.load(number), node)
+            self.loop_body(node, elements)
+
+        self.emit(ast.For(target=self.store_target(number), iter=for_range, body=self.block(body), orelse=[]), node)
+        return self.loop_result(node, elements)
+
+    def expr_WhileNode(self, node):
+        elements = None if node.should_return_null else self.new_name("_l")
+        if elements:
+            self.assign(elements, ast.List(elts=[], ctx=ast.Load()), node)
+
+        def body():
+            condition = self.call("truth", self.expr(node.condition_node), self.ref(node.condition_node), self.context())
+            self.emit(ast.If(test=ast.UnaryOp(op=ast.Not(), operand=condition), body=[ast.Break()], orelse=[]), node)
+            self.loop_body(node, elements)
+
+        self.emit(ast.While(test=ast.Constant(True), body=self.block(body), orelse=[]), node)
+        return self.loop_result(node, elements)
+
+    def expr_RaiseNode(self, node):
+        error_to_raise = node.error_to_raise
+        messages = []
+
+        for value in error_to_raise.arg_nodes.values():
+            if not isinstance(value, nodes.StringNode):
+                for message in messages:
+                    if not isinstance(message, (ast.Constant, ast.Name)):
+                        self.emit(ast.Expr(value=message), node)
+                return self.call("fail", self.ref(RTError), ast.Constant('Argument to Exception must be a string'),
+                                 self.ref(error_to_raise), self.context())
+            messages.append(self.expr(value))
+
+        return self.call("raise_error", ast.List(elts=messages, ctx=ast.Load()), self.ref(node), self.context())
+
+    def expr_FuncDefNode(self, node):
+        should_spill = self.needs_statements(node)
+        defaults = [self.value(arg_value, should_spill) for _, arg_value in node.args if arg_value is not None]
+
+        name = self.new_name("_f")
+        if node.func_name and node.func_name.isidentifier():
+            name += f"_{node.func_name}"
+        function = self.function_def(name, ["context", "slots", "recursion_depth"], node.body_node, node)
+        self.functions.append(function)
+
+        return self.call("make_function", self.load(name), self.ref(node.slot_names), ast.List(elts=defaults, ctx=ast.Load()),
+                         self.ref(node), self.context())
+
+    def expr_CallNode(self, node):
+        should_spill = self.needs_statements(node)
+
+        # The recursion depth is checked before anything of the call is run
+        too_deep = ast.Compare(left=self.load("recursion_depth"), ops=[ast.Gt()], comparators=[self.load("MAX_RECURSION_DEPTH")])
+        recursion_error = self.call("recursion_error", self.ref(node), self.context())
+        if should_spill:
+            self.emit(ast.If(test=too_deep, body=[ast.Expr(value=recursion_error)], orelse=[]), node)
+            callee = self.value(node.node_to_call, True)
+        else:
+            depth_check = ast.BoolOp(op=ast.And(), values=[too_deep, recursion_error])
+            callee = ast.BoolOp(op=ast.Or(), values=[depth_check, self.expr(node.node_to_call)])
+
+        args = [self.value(arg_value, should_spill) for arg_value in node.arg_nodes.values()]
+        return self.call("tail_call" if node.is_tail_call else "call", callee, ast.Constant(tuple(node.arg_nodes)), ast.List(elts=args, ctx=ast.Load()),
+                         self.ref(node), self.context(), self.load("recursion_depth"))
+
+    def expr_ReturnNode(self, node):
+        # A redi without a value does not leave the function in the interpreter, so it only gives None
+        if not node.node_to_return:
+            return ast.Constant(None)
+
+        value = self.spill(self.expr(node.node_to_return), node)
+        if self.in_function:
+            leave = ast.Return(value=value)
+        else:
+            leave = ast.Raise(exc=self.call("FunctionReturn", value), cause=None)
+        test = ast.Compare(left=value, ops=[ast.IsNot()], comparators=[ast.Constant(None)])
+        self.emit(ast.If(test=test, body=[leave], orelse=[]), node)
+        return ast.Constant(None)
+
+    def expr_ContinueNode(self, node):
+        if self.loop_depth:
+            self.emit(ast.Continue(), node)
+        else:
+            self.emit(ast.Raise(exc=self.call("LoopContinue"), cause=None), node)
+        return ast.Constant(None)
+
+    def expr_BreakNode(self, node):
+        if self.loop_depth:
+            self.emit(ast.Break(), node)
+        else:
+            self.emit(ast.Raise(exc=self.call("LoopBreak"), cause=None), node)
+        return ast.Constant(None)
+
+    def expr_PassNode(self, node):
+        return ast.Constant(None)
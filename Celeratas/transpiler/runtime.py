@@ -0,0 +1,181 @@
+#######################################
+# IMPORTS
+#######################################
+
+import Celeratas.interpreter.operations as operations
+from Celeratas.helper.errors import RTError
+from Celeratas.interpreter.signals import (Failure, FunctionReturn, LoopBreak,
+                                           LoopContinue, TailCall, unwrap)
+from Celeratas.interpreter.values import Dict, List, String
+
+from .TranspiledFunction import TranspiledFunction
+
+#######################################
+# HELPERS
+#######################################
+
+# Called by the transpiled code - The node passed in is the Celeratas node the call came from, errors take its position
+
+
+def load_name(value, name, node, context):
+    if value is None:
+        raise Failure(operations.undefined_variable(name, node, context))
+    return value
+
+
+def check_indexable(value, node, context):
+    error = operations.check_indexable(value, node, context)
+    if error:
+        raise Failure(error)
+    return value
+
+
+def get_index(value, idx_to_get, node, context):
+    value, error = operations.get_index(value, idx_to_get, node, context)
+    if error:
+        raise Failure(error)
+    return value
+
+
+def get_attribute(value, attr_to_get, node, context):
+    value, error = operations.get_attribute(value, attr_to_get, node, context)
+    if error:
+        raise Failure(error)
+    return value
+
+
+def assign_target(var_to_change, var_name, node, context):
+    if var_to_change is None:
+        raise Failure(operations.undefined_variable(var_name, node, context))
+    return var_to_change
+
+
+def set_index(value, var_to_change, idxes_to_change, node, context):
+    error = operations.set_index(var_to_change, idxes_to_change, value, node, context)
+    if error:
+        raise Failure(error)
+    return var_to_change
+
+
+def augmented(operation, value, old_value, var_name, node, context):
+    if old_value is None:
+        raise Failure(operations.undefined_variable(var_name, node, context))
+    result, error = operation(old_value, value)
+    if error:
+        raise Failure(operations.augmented_error(node.assign_type, old_value, value, node, context))
+    return result
+
+
+def binary(operation, left, right, node, context):
+    result, error = operation(left, right)
+    if error:
+        raise Failure(operations.binary_error(operation, left, right, node, context))
+    return result.set_pos(node.pos_start, node.pos_end)
+
+
+def unary(operation, value, node, context):
+    result, error = operation(value)
+    if error:
+        raise Failure(operations.unary_error(operation, value, node, context))
+    # Constants are shared between runs, so they can't have their position changed in place
+    if result is value:
+        result = value.copy()
+    return result.set_pos(node.pos_start, node.pos_end)
+
+
+def truth(condition, node, context):
+    if condition is None:
+        raise Failure(operations.empty_condition(node, context))
+    return condition.is_true()
+
+
+def for_range(start_value, end_value, step_value, node, context):
+    if start_value is None:
+        raise Failure(RTError(
+            node.pos_start, node.pos_end,
+            'Expression does not have a value',
+            context
+        ))
+    return operations.loop_numbers(start_value.value, end_value.value, step_value.value)
+
+
+def make_list(elements, node, context):
+    return List(elements).set_context(context).set_pos(node.pos_start, node.pos_end)
+
+
+def make_dict(items, node, context):
+    keypairs = {items[idx].value: items[idx + 1] for idx in range(0, len(items), 2)}
+    return Dict(keypairs).set_context(context).set_pos(node.pos_start, node.pos_end)
+
+
+def make_string(parts, values, node, context):
+    values = iter(values)
+    string = "".join(str(next(values)) if part is None else part for part in parts)
+    return String(string).set_context(context).set_pos(node.pos_start, node.pos_end)
+
+
+def fail(error_class, message, node, context):
+    raise Failure(error_class(node.pos_start, node.pos_end, message, context))
+
+
+def raise_error(messages, node, context):
+    raise Failure(operations.raised_error(node, ", ".join(message.value for message in messages), context))
+
+
+def check_except_name(node, context):
+    error = operations.check_except_name(node.except_name, context)
+    if error:
+        raise Failure(error)
+
+
+def should_except(node, error):
+    return node.except_body is not None and operations.should_except(node.except_name, error)
+
+
+def caught_error(error):
+    return String(error.details)
+
+
+def recursion_error(node, context):
+    raise Failure(operations.recursion_error(node, context))
+
+
+def make_function(python_function, slot_names, defaults, node, context):
+    defaults = iter(defaults)
+    args = [(arg_name, None if arg_value is None else next(defaults)) for arg_name, arg_value in node.args]
+
+    func_value = TranspiledFunction(node.func_name, node.body_node, args, node.should_auto_return,
+                                    python_function, slot_names).set_context(context).set_module(context).set_pos(node.pos_start, node.pos_end)
+    if node.func_name:
+        context.symbol_table.set(node.func_name, func_value)
+    return func_value
+
+
+def call(callee, keys, values, node, context, recursion_depth):
+    # A function runs in the context it is called from, so the callee is the one value that is always positioned
+    value_to_call = operations.positioned(callee, node, context)
+    args = dict(zip(keys, values))
+
+    # Transpiled functions are called directly so that their signals keep going up the python stack
+    if type(value_to_call) is TranspiledFunction:
+        return value_to_call.call(args, recursion_depth)
+    return unwrap(value_to_call.execute(args, recursion_depth))
+
+
+def tail_call(callee, keys, values, node, context, recursion_depth):
+    # A call in tail position, a transpiled function is run by the function this call is in once it has returned
+    value_to_call = operations.positioned(callee, node, context)
+    args = dict(zip(keys, values))
+
+    if type(value_to_call) is TranspiledFunction:
+        return TailCall(value_to_call, args)
+    return unwrap(value_to_call.execute(args, recursion_depth))
+
+
+# Everything the transpiled code can reference by name
+NAMESPACE = {
+    name: value for name, value in list(globals().items())
+    if callable(value) and getattr(value, "__module__", None) == __name__
+}
+NAMESPACE.update(Failure=Failure, LoopBreak=LoopBreak, LoopContinue=LoopContinue, FunctionReturn=FunctionReturn)
+NAMESPACE["load_global"] = operations.load_global
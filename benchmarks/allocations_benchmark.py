@@ -0,0 +1,84 @@
+#######################################
+# IMPORTS
+#######################################
+
+from common import new_context, parse
+
+from Celeratas.interpreter.RTResult import RTResult
+from Celeratas.interpreter.values.Value import Value
+from Celeratas.shell import BACKENDS, global_symbol_table
+
+#######################################
+# SCRIPTS
+#######################################
+
+# Each script is run with two loop counts, the difference between them is the cost of the extra iterations alone
+SCRIPTS = {
+    "pro loop": "x = 0\npro i = 0 ad {n}:\n    x += i * 2 - 1\n",
+    "dum loop": "i = 0\ndum i < {n}:\n    i += 1\n",
+    "calls": "opus add(a, b):\n    redi a + b\nx = 0\npro i = 0 ad {n}:\n    x = add(x, i)\n",
+    "if chain": "x = 0\npro i = 0 ad {n}:\n    si i % 2 == 0: x += 1 alioquin: x -= 1\n",
+    "variable reads": "x = \"abc\"\ny = 0\npro i = 0 ad {n}:\n    y = x\n",
+}
+
+ITERATIONS = 1000
+
+#######################################
+# COUNTING
+#######################################
+
+
+class AllocationCounter:
+    # Counts the RTResults and Values created while it is active by wrapping their constructors
+    def __init__(self):
+        self.results = 0
+        self.values = 0
+
+    def __enter__(self):
+        self.result_init = RTResult.__init__
+        self.value_init = Value.__init__
+
+        def result_init(result):
+            self.results += 1
+            self.result_init(result)
+
+        def value_init(value):
+            self.values += 1
+            self.value_init(value)
+
+        RTResult.__init__ = result_init
+        Value.__init__ = value_init
+        return self
+
+    def __exit__(self, *exc_info):
+        RTResult.__init__ = self.result_init
+        Value.__init__ = self.value_init
+
+
+def count(backend, script, iterations):
+    ast = parse(script.format(n=iterations))
+    context = new_context()
+    context.symbol_table.symbols.update(global_symbol_table.symbols)
+
+    with AllocationCounter() as counter:
+        result = BACKENDS[backend](ast, context)
+    assert result.error is None, result.error.as_string()
+    return counter.results, counter.values
+
+#######################################
+# MAIN
+#######################################
+
+
+def main():
+    print(f"{'':<28} {'RTResults':>10} {'Values':>10}   (per iteration)")
+    for name, script in SCRIPTS.items():
+        print(name)
+        for backend in BACKENDS:
+            results, values = count(backend, script, ITERATIONS)
+            more_results, more_values = count(backend, script, ITERATIONS * 2)
+            print(f"  {backend:<26} {(more_results - results) / ITERATIONS:>10.1f} {(more_values - values) / ITERATIONS:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
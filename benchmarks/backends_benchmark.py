@@ -0,0 +1,46 @@
+#######################################
+# IMPORTS
+#######################################
+
+from common import best_of, new_context, parse, report
+
+from Celeratas.shell import BACKENDS, global_symbol_table
+
+#######################################
+# SCRIPTS
+#######################################
+
+SCRIPTS = {
+    "pro loop": "x = 0\npro i = 0 ad 20000:\n    x += i * 2 - 1\n",
+    "dum loop": "i = 0\ndum i < 20000:\n    i += 1\n",
+    "nested pro": "x = 0\npro i = 0 ad 100:\n    pro j = 0 ad 100:\n        x += i * j\n",
+    "fib(15)": "opus fib(n):\n    si n < 2: redi n\n    redi fib(n - 1) + fib(n - 2)\nfib(15)\n",
+    "list building": "l = []\npro i = 0 ad 5000:\n    l = [i, l]\n",
+}
+
+#######################################
+# MAIN
+#######################################
+
+
+def run(backend, ast):
+    context = new_context()
+    context.symbol_table.symbols.update(global_symbol_table.symbols)
+    result = BACKENDS[backend](ast, context)
+    assert result.error is None, result.error.as_string()
+
+
+def main():
+    for name, script in SCRIPTS.items():
+        ast = parse(script)
+        print(name)
+
+        baseline = best_of(lambda: run("interpreter", ast))
+        report("  interpreter", baseline)
+        for backend in BACKENDS:
+            if backend != "interpreter":
+                report(f"  {backend}", best_of(lambda: run(backend, ast)), baseline)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+#######################################
+# IMPORTS
+#######################################
+
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+import common  # noqa: F401 - Puts the source checkout on the path
+
+from Celeratas.batch import run_batch
+
+#######################################
+# SCRIPTS
+#######################################
+
+# Small scripts like the ones a deployment runs by the thousand
+SCRIPT = "opus f(n):\n    redi n * {i}\ntotal = 0\npro i = 0 ad 50:\n    total = total + f(i)\nscribe(total)\n"
+
+COUNT = 200
+
+# Starting a process for every script is slow, so only this many are timed and the rest is estimated from them
+PROCESS_COUNT = 20
+
+#######################################
+# MAIN
+#######################################
+
+
+def one_process_each(scripts):
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    start = time.perf_counter()
+    for fn in scripts:
+        subprocess.run([sys.executable, "-m", "Celeratas", fn], check=True, stdout=subprocess.DEVNULL, env=env)
+    return time.perf_counter() - start
+
+
+def batch(scripts, workers):
+    start = time.perf_counter()
+    for _, _, error, _ in run_batch(scripts, workers):
+        if error:
+            raise RuntimeError(error)
+    return time.perf_counter() - start
+
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        scripts = []
+        for i in range(COUNT):
+            fn = os.path.join(directory, f"script{i}.cel")
+            with open(fn, "w") as f:
+                f.write(SCRIPT.format(i=i))
+            scripts.append(fn)
+
+        print(f"{COUNT} scripts")
+        seconds = one_process_each(scripts[:PROCESS_COUNT]) * COUNT / PROCESS_COUNT
+        print(f"{'one celer process each (estimated)':<40} {seconds:10.2f} s {COUNT / seconds:10.1f} scripts/s")
+        for workers in sorted({1, os.cpu_count() or 1}):
+            seconds = batch(scripts, workers)
+            print(f"{f'celer batch, {workers} workers':<40} {seconds:10.2f} s {COUNT / seconds:10.1f} scripts/s")
+
+
+if __name__ == "__main__":
+    main()
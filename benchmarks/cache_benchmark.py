@@ -0,0 +1,74 @@
+#######################################
+# IMPORTS
+#######################################
+
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+from common import best_of, report
+
+from Celeratas.parser import cache
+from Celeratas.shell import parse_script
+
+#######################################
+# SCRIPTS
+#######################################
+
+# A library of functions - Defining them takes almost no time, so starting the script is mostly lexing and parsing it
+FUNCTION = "opus f{i}(a, b=2):\n    x = a * b - a / 3\n    l = [x, \"big\", b]\n    si x > 3:\n        redi \"big\"\n    redi f\"{{x}}\"\n"
+
+SIZES = [100, 1000, 5000]
+
+#######################################
+# MEASURING
+#######################################
+
+
+def start(fn, *options):
+    # The whole of starting celer, from a new Python process until the script has run
+    start_time = time.perf_counter()
+    subprocess.run([sys.executable, "-m", "Celeratas", *options, fn], check=True, env=dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path)))
+    return time.perf_counter() - start_time
+
+
+def parse(fn, script, cached):
+    node, error = parse_script(fn, script, cached=cached)
+    if error:
+        raise RuntimeError(error.as_string())
+    return node
+
+
+def cold(fn, script):
+    shutil.rmtree(os.path.join(os.path.dirname(fn), cache.CACHE_DIR), ignore_errors=True)
+    parse(fn, script, True)
+
+#######################################
+# MAIN
+#######################################
+
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        for size in SIZES:
+            fn = os.path.join(directory, f"lib{size}.cel")
+            script = "".join(FUNCTION.format(i=i) for i in range(size))
+            with open(fn, "w") as f:
+                f.write(script)
+
+            print(f"{size} functions, {len(script) / 1000:.0f} kB")
+            uncached = best_of(lambda: parse(fn, script, False))
+            report("  parse, no cache", uncached)
+            report("  parse, cold cache (writes the entry)", best_of(lambda: cold(fn, script)), uncached)
+            report("  parse, warm cache", best_of(lambda: parse(fn, script, True)), uncached)
+
+            uncached = min(start(fn, "--no-cache") for _ in range(3))
+            report("  celer, no cache", uncached)
+            report("  celer, warm cache", min(start(fn) for _ in range(3)), uncached)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+#######################################
+# IMPORTS
+#######################################
+
+import os
+import sys
+import timeit
+
+# Allow running the benchmarks from a source checkout without installing the package
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Celeratas.interpreter.Context import Context  # noqa: E402
+from Celeratas.interpreter.SymbolTable import SymbolTable  # noqa: E402
+from Celeratas.lexer.Lexer import Lexer  # noqa: E402
+from Celeratas.parser.Parser import Parser  # noqa: E402
+
+#######################################
+# HELPERS
+#######################################
+
+
+def parse(script, fn="<bench>"):
+    tokens, error = Lexer(fn, script).make_tokens()
+    if error:
+        raise RuntimeError(error.as_string())
+
+    ast = Parser(tokens).parse()
+    if ast.error:
+        raise RuntimeError(ast.error.as_string())
+    return ast.node
+
+
+def new_context():
+    context = Context('<program>')
+    context.symbol_table = SymbolTable()
+    return context
+
+
+def best_of(func, repeat=5, number=1):
+    # The minimum is the least noisy estimate of how fast the code can run
+    return min(timeit.repeat(func, repeat=repeat, number=number))
+
+
+def report(name, seconds, baseline=None):
+    line = f"{name:<40} {seconds * 1000:10.2f} ms"
+    if baseline:
+        line += f"  ({baseline / seconds:.2f}x)"
+    print(line)
@@ -0,0 +1,58 @@
+#######################################
+# IMPORTS
+#######################################
+
+import time
+
+from common import best_of, parse, report
+
+from Celeratas.Runtime import BACKENDS, Runtime
+
+#######################################
+# SCRIPTS
+#######################################
+
+# Fills a dict with size entries, the lookups are timed on its own so that filling it doesn't hide how long they take
+FILL = "d = {{}}\npro i = 0 ad {size}:\n    d[i] = i\n    d[f\"k{{i}}\"] = i\n"
+
+# Looks up keys from all over the dict - The number of lookups stays the same as the dict grows
+LOOKUPS = 2000
+SCRIPTS = {
+    "number keys": "total = 0\npro i = 0 ad {lookups}:\n    total += d[i * {step}]\n",
+    "string keys": "total = 0\npro i = 0 ad {lookups}:\n    total += d[f\"k{{i * {step}}}\"]\n",
+    "assign existing keys": "pro i = 0 ad {lookups}:\n    d[i * {step}] = i\n",
+}
+
+SIZES = [1000, 10000, 100000]
+
+# A dict literal this big is parsed without running anything
+LITERAL_SIZE = 10000
+
+#######################################
+# MAIN
+#######################################
+
+
+def run(runtime, backend, ast):
+    result = BACKENDS[backend](ast, runtime.new_context("<program>", runtime.global_symbol_table))
+    assert result.error is None, result.error.as_string()
+
+
+def main():
+    for size in SIZES:
+        runtime = Runtime(cache=False)
+        start = time.perf_counter()
+        run(runtime, "interpreter", parse(FILL.format(size=size)))
+        report(f"fill a dict of {size} entries", time.perf_counter() - start)
+
+        for name, script in SCRIPTS.items():
+            ast = parse(script.format(lookups=LOOKUPS, step=size // LOOKUPS))
+            for backend in ["interpreter", "vm"]:
+                report(f"  {LOOKUPS} x {name}, {backend}", best_of(lambda: run(runtime, backend, ast), repeat=3))
+
+    literal = "{" + ", ".join(f"{i}: \"v{i}\"" for i in range(LITERAL_SIZE)) + "}\n"
+    report(f"parse a dict literal of {LITERAL_SIZE} entries", best_of(lambda: parse(literal), repeat=3))
+
+
+if __name__ == "__main__":
+    main()
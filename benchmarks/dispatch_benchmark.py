@@ -0,0 +1,82 @@
+#######################################
+# IMPORTS
+#######################################
+
+from common import best_of, new_context, parse, report
+
+from Celeratas.interpreter.Interpreter import Interpreter
+from Celeratas.parser.nodes import PassNode
+
+#######################################
+# SCRIPTS
+#######################################
+
+SCRIPTS = {
+    "pro loop": "x = 0\npro i = 0 ad 20000:\n    x += i * 2 - 1\n",
+    "dum loop": "i = 0\ndum i < 20000:\n    i += 1\n",
+    "nested arithmetic": "x = 0\npro i = 0 ad 5000:\n    x = (i + 1) * (i - 1) / (i + 2) + x % 7\n",
+}
+
+#######################################
+# BASELINE
+#######################################
+
+
+class GetattrInterpreter(Interpreter):
+    # The old dispatch: build the method name and look it up on every node
+    def visit(self, node, context):
+        method_name = f'visit_{type(node).__name__}'
+        method = getattr(self, method_name, self.no_visit_method)
+        return method(node, context)
+
+
+class CountingInterpreter(Interpreter):
+    def __init__(self, recursion_depth):
+        super().__init__(recursion_depth)
+        self.visits = 0
+
+    def visit(self, node, context):
+        self.visits += 1
+        return super().visit(node, context)
+
+#######################################
+# MAIN
+#######################################
+
+
+def dispatch_only(visits=200000):
+    # Visiting a PassNode does almost no work, so this isolates the cost of finding the visit method
+    node = PassNode(None, None)
+    context = new_context()
+    old_interpreter = GetattrInterpreter(0)
+    new_interpreter = Interpreter(0)
+
+    old = best_of(lambda: [old_interpreter.visit(node, context) for _ in range(visits)], repeat=7)
+    new = best_of(lambda: [new_interpreter.visit(node, context) for _ in range(visits)], repeat=7)
+
+    print(f"dispatch only ({visits} PassNode visits)")
+    report("  getattr dispatch", old)
+    report("  dispatch table", new, old)
+    print(f"  per-node overhead saved: {(old - new) / visits * 1e9:.1f} ns")
+
+
+def main():
+    dispatch_only()
+
+    for name, script in SCRIPTS.items():
+        ast = parse(script)
+
+        counter = CountingInterpreter(0)
+        counter.visit(ast, new_context())
+
+        old = best_of(lambda: GetattrInterpreter(0).visit(ast, new_context()), repeat=7)
+        new = best_of(lambda: Interpreter(0).visit(ast, new_context()), repeat=7)
+
+        print(f"{name} ({counter.visits} node visits)")
+        report("  getattr dispatch", old)
+        report("  dispatch table", new, old)
+        print(f"  per-node overhead saved: {(old - new) / counter.visits * 1e9:.1f} ns")
+
+
+if __name__ == "__main__":
+    main()
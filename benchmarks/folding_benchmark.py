@@ -0,0 +1,49 @@
+#######################################
+# IMPORTS
+#######################################
+
+from common import best_of, parse, report
+
+from Celeratas.parser.Folder import Folder
+from Celeratas.Runtime import BACKENDS, Runtime
+
+#######################################
+# SCRIPTS
+#######################################
+
+# Loops that work out the same expressions of literals every time around
+SCRIPTS = {
+    "arithmetic": "r = 0\npro i = 0 ad 20000:\n    r += 2 * 3.14159 * 10 - 60 * 60 / 4\n",
+    "numerals": "r = 0\npro i = 0 ad 20000:\n    r += X + V * II - -I\n",
+    "strings": "s = \"\"\npro i = 0 ad 20000:\n    s = \"ab\" * 3 + f\"{1 + 1}\"\n",
+    "nothing to fold": "r = 0\npro i = 0 ad 20000:\n    r += i * i - r / 4\n",
+}
+
+#######################################
+# MAIN
+#######################################
+
+
+def run(backend, ast):
+    runtime = Runtime(cache=False)
+    result = BACKENDS[backend](ast, runtime.new_context("<program>", runtime.global_symbol_table))
+    assert result.error is None, result.error.as_string()
+
+
+def main():
+    for name, script in SCRIPTS.items():
+        print(name)
+        ast, folded = parse(script), Folder().fold(parse(script))
+        for backend in BACKENDS:
+            baseline = best_of(lambda: run(backend, ast), repeat=3)
+            report(f"  {backend}, -O 0", baseline)
+            report(f"  {backend}, -O 1", best_of(lambda: run(backend, folded), repeat=3), baseline)
+
+    # Folding happens once when a script is parsed, so it has to be cheap next to parsing
+    script = "".join(f"x{i} = {i} * 2 + f\"{{{i}}}\"\nopus f{i}(a):\n    redi a * (60 * 60) + x{i}\n" for i in range(2000))
+    report("parse 2000 functions", best_of(lambda: parse(script), repeat=3))
+    report("parse and fold 2000 functions", best_of(lambda: Folder().fold(parse(script)), repeat=3))
+
+
+if __name__ == "__main__":
+    main()
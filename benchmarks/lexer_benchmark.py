@@ -0,0 +1,45 @@
+#######################################
+# IMPORTS
+#######################################
+
+from common import best_of
+
+from Celeratas.shell import LEXERS
+
+#######################################
+# SCRIPTS
+#######################################
+
+# Each script is repeated until it is about 1 MB
+SCRIPTS = {
+    "statements": "x = a * b + [1, 2][0]\nsi x > 3: y = \"big\" alioquin: y = f(x, b=2)\nopus g(a, b=2):\n    redi a + b\n",
+    "identifiers": "longitudo_primus = valor_secundus + alius_nomen_tertius\n",
+    "numbers": "x = 12345 + 6.789 * XLII - 1000000 / 3.5\n",
+    "strings": "s = \"Lorem ipsum dolor sit amet, consectetur adipiscing\" + f\"elit {x + 1} sed\"\n",
+    "comments": "# Lorem ipsum dolor sit amet, consectetur adipiscing elit\nx = 1\n",
+}
+
+SIZE = 1000000
+
+#######################################
+# MAIN
+#######################################
+
+
+def main():
+    print(f"{'':<28}" + "".join(f"{name:>12}" for name in LEXERS) + "     speedup")
+    for script_name, script in SCRIPTS.items():
+        source = script * (SIZE // len(script))
+        megabytes = len(source.encode()) / 1e6
+
+        throughputs = []
+        for lexer in LEXERS.values():
+            seconds = best_of(lambda: lexer("<bench>", source).make_tokens(), repeat=3)
+            throughputs.append(megabytes / seconds)
+
+        speedup = throughputs[0] / throughputs[-1]
+        print(f"{script_name:<28}" + "".join(f"{mbs:>7.2f} MB/s" for mbs in throughputs) + f"  {speedup:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+#######################################
+# IMPORTS
+#######################################
+
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+import common  # noqa: F401 - Puts the source checkout on the path
+
+from Celeratas.Runtime import BACKENDS
+
+#######################################
+# SCRIPTS
+#######################################
+
+# Loops whose results are never used - Before they were marked, every one kept the value of every time around until it ended
+SCRIPTS = {
+    "pro block": "x = 0\npro i = 0 ad {iterations}:\n    x += i\n",
+    "dum block": "i = 0\ndum i < {iterations}:\n    i += 1\n",
+    "one-line pro in a function": "opus f():\n    pro i = 0 ad {iterations}: x = i\nf()\n",
+    "one-line pro in a block": "si Verus:\n    pro i = 0 ad {iterations}: x = i\n",
+}
+
+# Give a smaller number as the first argument for a quicker run, the memory a loop keeps grows with it
+ITERATIONS = 10 ** 7
+
+#######################################
+# MEASURING
+#######################################
+
+
+def run(fn, backend):
+    # Runs celer in a new process, so its peak memory is only this script - Returns how long it took and its peak in MB
+    start_time = time.perf_counter()
+    process = subprocess.Popen([sys.executable, "-m", "Celeratas", "--no-cache", "--backend", backend, fn],
+                               env=dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path)))
+    _, status, usage = os.wait4(process.pid, 0)
+    if status:
+        raise RuntimeError(f"{fn} failed with {backend}")
+    # ru_maxrss is in kB on linux
+    return time.perf_counter() - start_time, usage.ru_maxrss / 1024
+
+#######################################
+# MAIN
+#######################################
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else ITERATIONS
+    print(f"{iterations} iterations")
+
+    with tempfile.TemporaryDirectory() as directory:
+        for name, script in SCRIPTS.items():
+            fn = os.path.join(directory, "loop.cel")
+            with open(fn, "w") as f:
+                f.write(script.format(iterations=iterations))
+
+            print(name)
+            for backend in BACKENDS:
+                seconds, peak = run(fn, backend)
+                print(f"  {backend:<12} {peak:10.1f} MB peak {seconds:10.2f} s")
+
+
+if __name__ == "__main__":
+    main()
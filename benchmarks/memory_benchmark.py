@@ -0,0 +1,88 @@
+#######################################
+# IMPORTS
+#######################################
+
+import tracemalloc
+
+import common  # noqa: F401 - Puts the source checkout on the path
+
+from Celeratas.interpreter.values import Bool, Dict, List, Number, String
+from Celeratas.lexer.Lexer import Lexer
+from Celeratas.lexer.Scanner import Scanner
+from Celeratas.lexer.TokenStream import TokenStream
+from Celeratas.parser.analysis import child_nodes
+from Celeratas.parser.Parser import Parser
+
+#######################################
+# SCRIPTS
+#######################################
+
+# About 100k tokens of ordinary statements
+SOURCE = "x = a * b + [1, 2][0]\nsi x > 3: y = \"big\" alioquin: y = f(x, b=2)\nopus g(a, b=2):\n    redi a + b\n" * 1900
+
+# Each value is made COUNT times, floats and long strings so that none of them come from a cache
+VALUES = {
+    "Number": lambda i: Number(i + 0.5),
+    "String": lambda i: String("value " * 3),
+    "Bool": lambda i: Bool(i),
+    "List": lambda i: List([]),
+    "Dict": lambda i: Dict({}),
+}
+
+COUNT = 10000
+
+#######################################
+# MEASURING
+#######################################
+
+
+def measure(func):
+    # The bytes still allocated once func is done, so only what its result keeps alive is counted
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = func()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, after - before
+
+
+def measure_peak(func):
+    # The most that was allocated at once while func ran, including what was freed before it returned
+    tracemalloc.start()
+    func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+
+def count_nodes(node):
+    return 1 + sum(count_nodes(child) for child in child_nodes(node))
+
+#######################################
+# MAIN
+#######################################
+
+
+def main():
+    tokens, size = measure(lambda: Lexer("<bench>", SOURCE).make_tokens()[0])
+    print(f"{'tokens':<28} {len(tokens):>10} {size / len(tokens):>10.1f} bytes each")
+
+    # The tokens already exist, so this only counts the nodes (and the lists that hold them)
+    ast, size = measure(lambda: Parser(tokens).parse().node)
+    nodes = count_nodes(ast)
+    print(f"{'nodes':<28} {nodes:>10} {size / nodes:>10.1f} bytes each")
+
+    # Both keep the whole tree, the stream only keeps the tokens of the statement that is being parsed
+    all_tokens = measure_peak(lambda: Parser(Scanner("<bench>", SOURCE).make_tokens()[0]).parse())
+    streamed = measure_peak(lambda: Parser(TokenStream(Scanner("<bench>", SOURCE))).parse())
+    print(f"{'peak, all tokens then parse':<28} {all_tokens / 1e6:>10.1f} MB")
+    print(f"{'peak, streamed tokens':<28} {streamed / 1e6:>10.1f} MB")
+
+    for name, make in VALUES.items():
+        _, size = measure(lambda: [make(i) for i in range(COUNT)])
+        # The list holding the values takes 8 bytes per value
+        print(f"{name:<28} {COUNT:>10} {size / COUNT - 8:>10.1f} bytes each")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+#######################################
+# IMPORTS
+#######################################
+
+from common import best_of, parse, report
+
+from Celeratas.Runtime import BACKENDS, Runtime
+
+#######################################
+# SCRIPTS
+#######################################
+
+# Nested pro loops, where the inner loop is started again every time around the outer one
+SCRIPTS = {
+    "2 deep, empty body": "pro i = 0 ad 300:\n    pro j = 0 ad 300: transiet\n",
+    "2 deep": "x = 0\npro i = 0 ad 300:\n    pro j = 0 ad 300:\n        x += j\n",
+    "3 deep": "x = 0\npro i = 0 ad 40:\n    pro j = 0 ad 40:\n        pro k = 0 ad 40:\n            x += k\n",
+    "3 deep in a function": "opus f():\n    x = 0\n    pro i = 0 ad 40:\n        pro j = 0 ad 40:\n            pro k = 0 ad 40:\n"
+                            "                x += k\n    redi x\nf()\n",
+    "short inner loop": "x = 0\npro i = 0 ad 30000:\n    pro j = 0 ad 3:\n        x += j\n",
+    "float step": "x = 0\npro i = 0 ad 300:\n    pro j = 0 ad 150 gradus 0.5:\n        x += j\n",
+}
+
+#######################################
+# MAIN
+#######################################
+
+
+def run(backend, ast):
+    runtime = Runtime(cache=False)
+    result = BACKENDS[backend](ast, runtime.new_context("<program>", runtime.global_symbol_table))
+    assert result.error is None, result.error.as_string()
+
+
+def main():
+    for name, script in SCRIPTS.items():
+        print(name)
+        ast = parse(script)
+        for backend in BACKENDS:
+            report(f"  {backend}", best_of(lambda: run(backend, ast), repeat=3))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+#######################################
+# IMPORTS
+#######################################
+
+import sys
+
+from common import best_of, report
+
+from Celeratas.lexer.Scanner import Scanner
+from Celeratas.parser.Parser import Parser
+
+#######################################
+# SCRIPTS
+#######################################
+
+# Only the parser is timed, the tokens are made once beforehand
+SCRIPTS = {
+    "statements": "x = a * b + [1, 2][0]\nsi x > 3: y = \"big\" alioquin: y = f(x, b=2)\nopus g(a, b=2):\n    redi a + b\n" * 1000,
+    "long expressions": ("x = " + " + ".join(["a * 2 - b / 3 % c"] * 200) + " == 1 et non y\n") * 50,
+    "nested parentheses": ("x = " + "(" * 50 + "1 + a" + ")" * 50 + "\n") * 400,
+    "nested powers": ("x = " + "2 ^ -" * 100 + "2\n") * 200,
+}
+
+# How deeply the expressions of each kind can be nested before Python runs out of recursion
+NESTING = {
+    "parentheses": lambda depth: "(" * depth + "1" + ")" * depth,
+    "unary minus": lambda depth: "-" * depth + "1",
+    "powers": lambda depth: "2 ^ " * depth + "2",
+    "calls": lambda depth: "f(" * depth + "1" + ")" * depth,
+}
+
+#######################################
+# MEASURING
+#######################################
+
+
+def parses(source):
+    try:
+        return not Parser(Scanner("<bench>", source).make_tokens()[0]).parse().error
+    except RecursionError:
+        return False
+
+
+def deepest(nest):
+    # Binary search for the deepest nesting that still parses under the default recursion limit
+    low, high = 0, sys.getrecursionlimit()
+    while low < high:
+        depth = (low + high + 1) // 2
+        if parses(nest(depth)):
+            low = depth
+        else:
+            high = depth - 1
+    return low
+
+#######################################
+# MAIN
+#######################################
+
+
+def main():
+    for name, source in SCRIPTS.items():
+        tokens, error = Scanner("<bench>", source).make_tokens()
+        assert not error
+        seconds = best_of(lambda: Parser(tokens).parse(), repeat=3)
+        report(f"{name} ({len(tokens)} tokens)", seconds)
+
+    for name, nest in NESTING.items():
+        print(f"{'deepest ' + name:<40} {deepest(nest):>10}")
+
+
+if __name__ == "__main__":
+    main()
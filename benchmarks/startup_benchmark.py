@@ -0,0 +1,83 @@
+#######################################
+# IMPORTS
+#######################################
+
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from common import report
+
+#######################################
+# SCRIPTS
+#######################################
+
+# Starting celer is most of the time a small script takes
+SCRIPT = "x = 1\nscribe(x)\n"
+
+# How many of the slowest imports are printed
+SLOWEST = 10
+
+RUNS = 5
+
+#######################################
+# MEASURING
+#######################################
+
+
+def run(fn, *options):
+    # Runs celer on fn in a new Python process - Returns how long it took and what python -X importtime printed
+    start_time = time.perf_counter()
+    process = subprocess.run([sys.executable, *options, "-m", "Celeratas", fn], check=True, capture_output=True, text=True,
+                             env=dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path)))
+    return time.perf_counter() - start_time, process.stderr
+
+
+def time_python():
+    # Starting the interpreter alone, what no change to celer can take away
+    start_time = time.perf_counter()
+    subprocess.run([sys.executable, "-c", "pass"], check=True)
+    return time.perf_counter() - start_time
+
+
+def import_times(stderr):
+    # Every line of python -X importtime is "import time: self | cumulative | module", in microseconds
+    # The module is indented by how deep it was imported, the top level imports add up to the whole import time
+    times = {}
+    total = 0
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        _, cumulative, module = line[len("import time:"):].split("|")
+        times[module.strip()] = int(cumulative) / 1e6
+        if not module.startswith("  "):
+            total += int(cumulative) / 1e6
+    return total, times
+
+#######################################
+# MAIN
+#######################################
+
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        fn = os.path.join(directory, "small.cel")
+        with open(fn, "w") as f:
+            f.write(SCRIPT)
+
+        # The first run writes the cache entry, so every run after it loads the script the same way
+        run(fn)
+        report("python, no celer", min(time_python() for _ in range(RUNS)))
+        report("celer small.cel", min(run(fn)[0] for _ in range(RUNS)))
+
+        total, times = min((import_times(run(fn, "-X", "importtime")[1]) for _ in range(RUNS)), key=lambda result: result[0])
+        report("imports", total)
+        print("slowest imports (cumulative):")
+        for module in sorted(times, key=times.get, reverse=True)[:SLOWEST]:
+            report(f"  {module}", times[module])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+#######################################
+# IMPORTS
+#######################################
+
+import time
+import tracemalloc
+
+import common  # noqa: F401 - Puts the source checkout on the path
+
+from Celeratas.shell import run_script, stream_script
+
+#######################################
+# SCRIPTS
+#######################################
+
+# A machine generated script - Nothing in it is a loop, so every statement is in the file
+STATEMENT = "x = {i} * 2 + 1\ny = x / 3 - x % 7\nl = [\"{i}\", x + 1, y]\n"
+
+SIZES = [1000, 4000, 10000]
+
+#######################################
+# MAIN
+#######################################
+
+
+def measure(run, script):
+    tracemalloc.start()
+    start = time.perf_counter()
+    _, error = run("<bench>", script)
+    seconds = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    if error:
+        raise RuntimeError(error.as_string())
+    return seconds, peak
+
+
+def main():
+    print(f"{'statements':>10} {'script':>10} {'run_script':>22} {'stream_script':>22}")
+    for size in SIZES:
+        script = "".join(STATEMENT.format(i=i) for i in range(size))
+        results = [measure(run, script) for run in (run_script, stream_script)]
+        print(f"{size * 3:>10} {len(script) / 1e6:>7.1f} MB" +
+              "".join(f"{peak / 1e6:>10.1f} MB {seconds:>7.2f} s" for seconds, peak in results))
+
+
+if __name__ == "__main__":
+    main()
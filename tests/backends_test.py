@@ -0,0 +1,199 @@
+#######################################
+# IMPORTS
+#######################################
+
+import pytest
+from Celeratas.interpreter.Context import Context
+from Celeratas.interpreter.SymbolTable import SymbolTable
+from Celeratas.lexer.Lexer import Lexer
+from Celeratas.parser.Parser import Parser
+from Celeratas.shell import (BACKENDS, global_symbol_table, run_script,
+                             stream_script)
+
+#######################################
+# TESTS
+#######################################
+
+# Every backend is checked against the interpreter, which is the reference implementation
+
+PROGRAMS = [
+    # Datatypes and operators
+    "1 + 2 * 3 - 4 / 2",
+    "2 ^ 3 % 5",
+    "X + V",
+    "IV * 2",
+    "-3 + +2",
+    "\"ab\" * 2",
+    "\"ab\" + \"cd\"",
+    "f\"x{1 + 1}y{2 * 3}\"",
+    "Verus et Falsus",
+    "Verus aut Falsus",
+    "non Verus",
+    "1 == 1",
+    "1 != 2",
+    "1 < 2",
+    "3 >= 2",
+    "[1, [2, 3], \"a\"]",
+    "{1: \"a\", \"b\": 2}",
+    # Variables
+    "a = 1;a",
+    "a, b = 1, 2;b",
+    "a = 1;a += 2;a -= 1;a *= 6;a /= 3;a",
+    "a = 7;a %= 4;a",
+    "a = [1, [2, 3]];a[1][0]",
+    "a = [1, 2];a[0] = 5;a",
+    "a = [[1, 2]];a[0][1] = 5;a",
+    "a = {1: 2};a[1] = 3;a",
+    "a = {\"b\": 2};a[\"b\"]",
+    "a = {1: {2: 3}, \"b\": 4};a[I][2.0] = 5;a[1][2] + a[\"b\"]",
+    "s = \"abc\";s[1]",
+    "s = \"abc\";s.length",
+    # Conditionals
+    "si 1 < 2: 1 alioquin: 2",
+    "si 1 > 2: 1 alioquinsi 2 > 1: 2 alioquin: 3",
+    "x = 5\nsi x > 2:\n    y = 1\nalioquin:\n    y = 2\ny",
+    # Loops
+    "pro i = 0 ad 5: i * 2",
+    "pro i = 10 ad 0 gradus -2: i",
+    "x = 0\npro i = 0 ad 10:\n    x += i\nx",
+    "pro i = 0 ad 6:\n    si i == 2: continua\n    si i == 4: confringe\n    scribe(i)",
+    "i = 0\ndum i < 5: i += 1\ni",
+    "i = 0\ndum i < 5:\n    i += 1\n    si i == 3: continua\n    scribe(i)",
+    "pro i = 0 ad 2: pro j = 0 ad 2: i * 10 + j",
+    "pro i = 0 ad 1 gradus 0.25: i",
+    "pro i = 0.5 ad 3: i",
+    "pro i = II ad X gradus III: i",
+    "pro i = 1000 ad 1003: i",
+    "pro i = 0 ad 5:\n    i = 10\n    scribe(i)",
+    "n = 0\npro i = 0 ad 3 gradus 0:\n    n += 1\n    si n == 4: confringe\nn",
+    "pro i = 0 ad -3: i",
+    # Functions
+    "opus f(a, b=2):\n    redi a * b\nf(3)",
+    "opus f(a, b=2):\n    redi a * b\nf(3, b=4)",
+    "f = (x) => x + 1\nf(1)",
+    "f = (x, y=3) => x * y\n[f(2), f(2, y=5), f(y=1, x=4)]",
+    "opus outer():\n    x = 5\n    redi inner()\nopus inner():\n    redi x + 1\nouter()",
+    "opus f(n):\n    g = (m) => m * n\n    redi g(2)\nf(4)",
+    "opus f():\n    x = 1 / 0\ntempta:\n    f()\npraeter:\n    scribe(\"caught\")",
+    "opus f():\n    redi\n    redi 2\nf()",
+    "f\"{[1, 2]} and {scribe}\"",
+    "opus fib(n):\n    si n < 2: redi n\n    redi fib(n - 1) + fib(n - 2)\nfib(12)",
+    "opus f():\n    dum Verus: redi 3\nf()",
+    "opus f():\n    pro i = 0 ad 5: si i == 2: redi i\n    redi 9\nf()",
+    "opus f(n):\n    pro i = 0 ad n: si i == 3: redi i * 10\nf(2)",
+    "opus f():\n    tempta:\n        redi 1\n    praeter:\n        redi 2\nf()",
+    "opus f(n):\n    redi f(n + 1)\nf(0)",
+    "opus f():\n    x = 2\n    redi g\nopus g():\n    redi x\nx = 1\nh = f()\nh()",
+    "opus f(g):\n    redi g()\nopus h():\n    redi y\nopus k():\n    y = 3\n    redi f(h)\nk()",
+    "fs = [longitudo]\nfs[0]([1, 2])",
+    "est_numerus(1)",
+    "est_filum(\"a\")",
+    "longitudo([1, 2, 3])",
+    "finde(\"a b c\", \" \")",
+    "x = [1]\nextende(x, [2, 3])\nx",
+    # Exceptions
+    "tempta:\n    x = 1 / 0\npraeter ZeroDivisionError tam e:\n    scribe(e)",
+    "tempta:\n    x = y\npraeter:\n    scribe(\"caught\")",
+    "tempta:\n    x = 1\npraeter NameError:\n    scribe(\"caught\")\nx",
+    "tempta:\n    x = 1 / 0\npraeter NameError:\n    scribe(\"not caught\")",
+    "pro i = 0 ad 4:\n    tempta:\n        si i == 1: continua\n        si i == 3: confringe\n        scribe(i)\n    praeter:\n        transiet",
+    "x = 0\ndum x < 10:\n    x += 1\n    si x == 4: confringe\nx",
+    "tempta:\n    x = 1\npraeter Oops:\n    scribe(\"bad\")",
+    "attolle TypeError(\"bad\")",
+    "attolle Oops(\"bad\")",
+    # Runtime errors
+    "1 / 0",
+    "y",
+    "1 + \"a\"",
+    "a = [1];a[5]",
+    "a = {1: 2};a[3]",
+    "a = {1: 2};a[[1]]",
+    "a = {1: {2: 3}};a[5][1] = 4",
+    "a = {1: 2};a[[1]] = 4",
+    "a = [1];a[\"x\"] = 2",
+    "a = 1;a[0]",
+    "a = \"x\";a.size",
+    "pro i = 0 ad 3: scribe(z)",
+    "a, b = 1",
+    "a = 1\nb = \"x\"\na + b",
+    "x = 1\nx += \"a\"",
+    "l = [1, \"a\"]\nl[1] + 1",
+    "s = \"ab\"\ns.length + \"a\"",
+    "opus f(a):\n    redi a + 1\nf(\"x\")",
+]
+
+
+def run(backend, script):
+    tokens, error = Lexer("<stdin>", script).make_tokens()
+    assert not error
+
+    ast = Parser(tokens).parse()
+    assert not ast.error
+
+    context = Context('<program>')
+    context.symbol_table = SymbolTable()
+    context.symbol_table.symbols.update(global_symbol_table.symbols)
+    return BACKENDS[backend](ast.node, context)
+
+
+def describe(result):
+    if result.error:
+        error = result.error
+        return ("error", error.error_name, str(error.details), error.pos_start.idx if error.pos_start else None)
+    return ("value", repr(result.value))
+
+
+@pytest.mark.parametrize("backend", [backend for backend in BACKENDS if backend != "interpreter"])
+@pytest.mark.parametrize("script", PROGRAMS)
+def test_backend_parity(backend, script, capsys):
+    expected = describe(run("interpreter", script))
+    expected_output = capsys.readouterr().out
+
+    result = describe(run(backend, script))
+    output = capsys.readouterr().out
+
+    assert result == expected
+    assert output == expected_output
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_backend_shares_values(backend):
+    # Reading a variable gives the value that is stored instead of a copy of it
+    tokens, error = Lexer("<stdin>", "x = [1]\ny = x\nopus f(a):\n    redi a\nz = f(x)").make_tokens()
+    ast = Parser(tokens).parse()
+
+    context = Context('<program>')
+    context.symbol_table = SymbolTable()
+    result = BACKENDS[backend](ast.node, context)
+    assert result.error is None
+
+    x = context.symbol_table.get("x")
+    assert context.symbol_table.get("y") is x
+    assert context.symbol_table.get("z") is x
+
+
+def run_with_globals(run, backend, script):
+    # Both runners use the global symbol table of the shell, so it is put back the way it was after each run
+    symbols = dict(global_symbol_table.symbols)
+    try:
+        _, error = run("<stdin>", script, backend)
+    finally:
+        global_symbol_table.symbols.clear()
+        global_symbol_table.symbols.update(symbols)
+
+    return error and (error.error_name, str(error.details), error.pos_start.idx)
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("script", PROGRAMS + [
+    "x = 1\ny = ",
+    "scribe(1)\ny = 2 ~",
+    "opus f():\n    redi x\nx = 5\nscribe(f())\nscribe(1 / 0)",
+])
+def test_stream_script(backend, script, capsys):
+    # Running statement by statement prints the same and stops with the same error as running the whole program
+    expected = run_with_globals(run_script, backend, script)
+    expected_output = capsys.readouterr().out
+
+    assert run_with_globals(stream_script, backend, script) == expected
+    assert capsys.readouterr().out == expected_output
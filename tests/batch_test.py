@@ -0,0 +1,69 @@
+#######################################
+# IMPORTS
+#######################################
+
+import pytest
+from Celeratas.batch import find_scripts, main, run_batch, run_file
+
+#######################################
+# TESTS
+#######################################
+
+
+@pytest.fixture
+def scripts(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "sub").mkdir()
+    files = {
+        "a.cel": "x = 1\nscribe(x)\n",
+        "b.clr": "scribe(\"b\")\n",
+        "sub/c.cel": "scribe(\"before\")\nx = 1 / 0\n",
+        # Another script that set x doesn't help this one
+        "sub/d.cel": "scribe(x)\n",
+        "notes.txt": "not a script",
+    }
+    for name, text in files.items():
+        (tmp_path / name).write_text(text)
+
+
+@pytest.mark.parametrize("patterns, expected", [
+    (["."], ["./a.cel", "./b.clr", "./sub/c.cel", "./sub/d.cel"]),
+    (["sub", "a.cel"], ["sub/c.cel", "sub/d.cel", "a.cel"]),
+    (["**/*.cel", "a.cel"], ["a.cel", "sub/c.cel", "sub/d.cel"]),
+    (["notes.txt", "missing.cel"], ["notes.txt"]),
+])
+def test_batch_find_scripts(patterns, expected, scripts):
+    assert find_scripts(patterns) == expected
+
+
+def test_batch_run_file(scripts):
+    fn, output, error, seconds = run_file("sub/c.cel", cached=False)
+    assert (fn, output) == ("sub/c.cel", "before\n")
+    assert "Division by zero" in error
+    assert seconds > 0
+
+    assert run_file("missing.cel")[1:3] == ("", "Can't open file missing.cel")
+
+
+def test_batch_run_batch(scripts):
+    results = list(run_batch(["a.cel", "b.clr", "sub/c.cel", "sub/d.cel", "a.cel"], workers=2, cached=False))
+
+    assert [(fn, output) for fn, output, _, _ in results] == [
+        ("a.cel", "1\n"), ("b.clr", "b\n"), ("sub/c.cel", "before\n"), ("sub/d.cel", ""), ("a.cel", "1\n")
+    ]
+    assert [error is not None for _, _, error, _ in results] == [False, False, True, True, False]
+    assert "'x' is not defined" in results[3][2]
+
+
+@pytest.mark.parametrize("argv, status, printed, not_printed", [
+    (["--workers", "2", "--no-cache", "."], 1, ["==> ./a.cel (ok", "==> ./sub/c.cel (failed", "Division by zero", "4 scripts, 2 failed"], []),
+    (["--quiet", "--no-cache", "a.cel", "b.clr"], 0, ["2 scripts, 0 failed", "latency: mean"], ["==>"]),
+])
+def test_batch_main(argv, status, printed, not_printed, scripts, capsys):
+    assert main(argv) == status
+
+    output = capsys.readouterr().out
+    for text in printed:
+        assert text in output
+    for text in not_printed:
+        assert text not in output
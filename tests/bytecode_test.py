@@ -0,0 +1,113 @@
+#######################################
+# IMPORTS
+#######################################
+
+import pytest
+from Celeratas.bytecode import opcodes as op
+from Celeratas.bytecode.Compiler import Compiler
+from Celeratas.bytecode.disassembler import disassemble
+from Celeratas.bytecode.VM import VM
+from Celeratas.interpreter.Context import Context
+from Celeratas.interpreter.SlotSymbolTable import SlotSymbolTable
+from Celeratas.interpreter.SymbolTable import SymbolTable
+from Celeratas.interpreter.values import Number
+from Celeratas.lexer.Lexer import Lexer
+from Celeratas.parser.Parser import Parser
+
+#######################################
+# TESTS
+#######################################
+
+# Results are compared to the interpreter in backends_test.py, these tests cover the bytecode itself
+
+
+def compile_test_base(test_input):
+    tokens, _ = Lexer("<stdin>", test_input).make_tokens()
+    ast = Parser(tokens).parse()
+    assert ast.error is None
+    return Compiler().compile_program(ast.node)
+
+
+def vm_test_base(test_input):
+    context = Context('<program>')
+    context.symbol_table = SymbolTable()
+    return VM().run(compile_test_base(test_input), context)
+
+
+def find_function(code, name):
+    for constant in code.constants:
+        if getattr(constant, "name", None) == name:
+            return constant.code
+
+
+@pytest.mark.parametrize("test_input, expected", [
+    ("1 + 2", [op.LOAD_CONST, op.LOAD_CONST, op.BINARY_OP, op.BUILD_LIST, op.RETURN_VALUE]),
+    ("a = 1", [op.LOAD_CONST, op.STORE_NAME, op.LOAD_NONE, op.BUILD_LIST, op.RETURN_VALUE]),
+    ("a", [op.LOAD_NAME, op.BUILD_LIST, op.RETURN_VALUE]),
+    ("[1, 2]", [op.LOAD_CONST, op.LOAD_CONST, op.BUILD_LIST, op.BUILD_LIST, op.RETURN_VALUE]),
+])
+def test_compiler_instructions(test_input, expected):
+    code = compile_test_base(test_input)
+    assert [opcode for opcode, _ in code.instructions] == expected
+    assert len(code.nodes) == len(code.instructions)
+
+
+def test_compiler_jumps_are_resolved():
+    code = compile_test_base("i = 0\ndum i < 3: i += 1")
+    for opcode, arg in code.instructions:
+        if opcode in op.HAS_JUMP:
+            target = arg[0] if isinstance(arg, tuple) else arg
+            assert 0 <= target <= len(code.instructions)
+
+
+def test_compiler_function_locals():
+    code = compile_test_base("opus f(a, b=2):\n    c = a + b\n    pro i = 0 ad 3: c += i\n    redi c + d\nf(1)")
+    function_code = find_function(code, "f")
+
+    assert function_code.local_names[:4] == ["a", "b", "c", "i"]
+    opcodes = [opcode for opcode, _ in function_code.instructions]
+    assert op.LOAD_LOCAL in opcodes
+    # d is not assigned in f, so it has to be looked up by name
+    assert (op.LOAD_NAME, function_code.names.index("d")) in function_code.instructions
+
+
+def test_disassembler():
+    listing = disassemble(compile_test_base("opus f(n):\n    redi n * 2\nf(3)"))
+
+    assert "Disassembly of <program>:" in listing
+    assert "Disassembly of f:" in listing
+    assert "LOAD_LOCAL" in listing and "(n)" in listing
+    assert "BINARY_OP" in listing and "(MUL)" in listing
+
+
+@pytest.mark.parametrize("test_input, expected", [
+    ("1 + 2", 3),
+    ("opus f(n):\n    si n < 2: redi n\n    redi f(n - 1) + f(n - 2)\nf(10)", 55),
+    ("x = 0\npro i = 0 ad 5:\n    x += i\nx", 10),
+])
+def test_vm_results(test_input, expected):
+    result = vm_test_base(test_input)
+    assert result.error is None
+    assert result.value.elements[-1].value == expected
+
+
+def test_vm_recursion_limit():
+    result = vm_test_base("opus f(n):\n    redi f(n + 1)\nf(0)")
+    assert result.error.error_name == "RecursionError"
+
+
+def test_slot_symbol_table():
+    parent = SymbolTable()
+    parent.set("x", Number(1))
+    symbol_table = SlotSymbolTable({"x": 0, "y": 1}, [None, None], parent)
+
+    # An unset slot falls back to the parent, just like a missing name would
+    assert symbol_table.get("x").value == 1
+    symbol_table.set("x", Number(2))
+    assert symbol_table.slots[0].value == 2
+    assert symbol_table.get("x").value == 2
+
+    symbol_table.set("z", Number(3))
+    assert symbol_table.symbols["z"].value == 3
+    symbol_table.remove("x")
+    assert symbol_table.get("x").value == 1
@@ -0,0 +1,147 @@
+#######################################
+# IMPORTS
+#######################################
+
+import os
+
+import pytest
+from Celeratas.parser import cache
+from Celeratas.parser.analysis import child_nodes
+from Celeratas.Runtime import DEFAULT_OPTIMIZE, Runtime
+from Celeratas.shell import global_symbol_table, parse_script, run_script
+
+#######################################
+# TESTS
+#######################################
+
+SCRIPT = "opus f(a):\n    redi a * 2\nscribe(f(21))\n"
+
+
+def write(path, text):
+    path.write_text(text)
+    return str(path)
+
+
+def write_text(fn, text):
+    with open(fn, "w") as f:
+        f.write(text)
+
+
+def shape(node):
+    # What the parser and the Resolver made, the scope and slot are only set on variables
+    return (type(node).__name__, node.pos_start.idx, node.pos_end.idx, getattr(node, "scope", None), getattr(node, "slot", None),
+            [shape(child) for child in child_nodes(node)])
+
+
+def load(fn, optimize=DEFAULT_OPTIMIZE):
+    return cache.load(fn, optimize)
+
+
+def run_file(fn, capsys):
+    # The script sets globals in the symbol table of the shell, so they are put back after the run
+    symbols = dict(global_symbol_table.symbols)
+    try:
+        with open(fn) as f:
+            _, error = run_script(fn, f.read(), cached=True)
+    finally:
+        global_symbol_table.symbols.clear()
+        global_symbol_table.symbols.update(symbols)
+
+    assert error is None
+    return capsys.readouterr().out
+
+
+def test_cache_stores_and_loads(tmp_path, capsys):
+    fn = write(tmp_path / "script.cel", SCRIPT)
+
+    assert load(fn) is None
+    assert run_file(fn, capsys) == "42\n"
+    assert os.listdir(tmp_path / cache.CACHE_DIR) == ["script.cel.pickle"]
+
+    # The loaded tree is the one the parser made, and running it prints the same
+    node, error = parse_script(fn, SCRIPT)
+    assert error is None
+    assert shape(load(fn)) == shape(node)
+    assert run_file(fn, capsys) == "42\n"
+
+
+@pytest.mark.parametrize("change", [
+    # A different size
+    lambda fn: write_text(fn, SCRIPT + "scribe(1)\n"),
+    # The same size, only a newer modification time
+    lambda fn: os.utime(fn, ns=(os.stat(fn).st_atime_ns, os.stat(fn).st_mtime_ns + 10 ** 9)),
+])
+def test_cache_invalidated_by_change(tmp_path, change):
+    fn = write(tmp_path / "script.cel", SCRIPT)
+    parse_script(fn, SCRIPT, cached=True)
+    assert load(fn) is not None
+
+    change(fn)
+    assert load(fn) is None
+
+
+def test_cache_invalidated_by_source(tmp_path, monkeypatch):
+    fn = write(tmp_path / "script.cel", SCRIPT)
+    parse_script(fn, SCRIPT, cached=True)
+
+    monkeypatch.setattr(cache, "source_stamp", lambda: "another source")
+    assert load(fn) is None
+
+
+def test_cache_invalidated_by_optimize(tmp_path):
+    # A tree folded for one optimization level isn't the one another level runs
+    fn = write(tmp_path / "script.cel", "x = 1 + 2\n")
+    parse_script(fn, "x = 1 + 2\n", cached=True, optimize=1)
+
+    assert load(fn, 0) is None
+    assert type(load(fn, 1).element_nodes[0].values_to_set[0]).__name__ == "NumberNode"
+    assert type(parse_script(fn, "x = 1 + 2\n", cached=True, optimize=0)[0].element_nodes[0].values_to_set[0]).__name__ == "BinOpNode"
+
+
+def test_cache_entry_rewritten_after_change(tmp_path, capsys):
+    fn = write(tmp_path / "script.cel", SCRIPT)
+    assert run_file(fn, capsys) == "42\n"
+
+    write_text(fn, "scribe(\"changed\")\n")
+    assert run_file(fn, capsys) == "changed\n"
+    assert shape(load(fn)) == shape(parse_script(fn, "scribe(\"changed\")\n")[0])
+
+
+def test_cache_corrupt_entry(tmp_path, capsys):
+    fn = write(tmp_path / "script.cel", SCRIPT)
+    (tmp_path / cache.CACHE_DIR).mkdir()
+    (tmp_path / cache.CACHE_DIR / "script.cel.pickle").write_bytes(b"not a tree")
+
+    assert load(fn) is None
+    assert run_file(fn, capsys) == "42\n"
+    assert load(fn) is not None
+
+
+def test_cache_disabled(tmp_path, capsys):
+    fn = write(tmp_path / "script.cel", SCRIPT)
+
+    _, error = Runtime(cache=False).run_script(fn, SCRIPT, cached=True)
+    assert error is None
+    assert capsys.readouterr().out == "42\n"
+    assert not (tmp_path / cache.CACHE_DIR).exists()
+
+
+def test_cache_not_used_for_text(tmp_path):
+    # Without cached the text doesn't have to be what is in the file, so nothing is read or written
+    fn = write(tmp_path / "script.cel", SCRIPT)
+    node, error = parse_script(fn, "scribe(1)")
+
+    assert error is None
+    assert shape(node) != shape(parse_script(fn, SCRIPT)[0])
+    assert not (tmp_path / cache.CACHE_DIR).exists()
+
+
+def test_cache_curre(tmp_path, capsys, monkeypatch):
+    # Scripts run with curre() are cached too
+    monkeypatch.chdir(tmp_path)
+    write(tmp_path / "lib.cel", SCRIPT)
+    fn = write(tmp_path / "main.cel", "curre(\"lib.cel\")\n")
+
+    assert run_file(fn, capsys) == "42\n"
+    assert sorted(os.listdir(tmp_path / cache.CACHE_DIR)) == ["lib.cel.pickle", "main.cel.pickle"]
+    assert run_file(fn, capsys) == "42\n"
@@ -0,0 +1,79 @@
+#######################################
+# IMPORTS
+#######################################
+
+import pytest
+from Celeratas.lexer.Lexer import Lexer
+from Celeratas.parser.Folder import Folder
+from Celeratas.parser.Parser import Parser
+from Celeratas.Runtime import BACKENDS, Runtime
+
+#######################################
+# TESTS
+#######################################
+
+
+def fold(script):
+    tokens, error = Lexer("<stdin>", script).make_tokens()
+    assert not error
+
+    ast = Parser(tokens).parse()
+    assert not ast.error
+    return Folder().fold(ast.node).element_nodes[0]
+
+
+@pytest.mark.parametrize("script, expected", [
+    ("2 * 3 + 1", ("NumberNode", 7)),
+    ("-5", ("NumberNode", -5)),
+    ("(1 + 2) * (3 - 1) / 4", ("NumberNode", 1.5)),
+    ("X + V", ("NumeralNode", 15)),
+    ("\"abc\" * 3", ("StringNode", ["abcabcabc"])),
+    ("\"a\" + \"b\"", ("StringNode", ["ab"])),
+    ("f\"{1 + 1}-{II}\"", ("StringNode", ["2-II"])),
+    ("1 < 2 et Verus", ("BoolNode", "Verus")),
+    ("non Verus", ("BoolNode", "Falsus")),
+    ("+\"x\"", ("StringNode", ["x"])),
+    # Names are never constants
+    ("2 * pi", ("BinOpNode", None)),
+    # Errors are left to happen when the expression runs
+    ("1 / 0", ("BinOpNode", None)),
+    ("1 + \"a\"", ("BinOpNode", None)),
+    ("-Verus", ("UnaryOpNode", None)),
+    # And so are values too big to keep in the tree
+    ("\"a\" * 100000", ("BinOpNode", None)),
+    ("2 ^ 1000", ("BinOpNode", None)),
+])
+def test_folder_folds(script, expected):
+    node = fold(script)
+    value = getattr(node, "value", getattr(node, "str_components", None)) if expected[1] is not None else None
+    assert (type(node).__name__, value) == expected
+
+
+def test_folder_inside_expressions():
+    # What can be folded is, even when the rest of the expression can't
+    node = fold("x * (60 * 60)")
+    assert type(node.right_node).__name__ == "NumberNode"
+    assert node.right_node.value == 3600
+
+    # The folded literal is where the expression was, so errors about it point at the same place
+    assert (node.right_node.pos_start.idx, node.right_node.pos_end.idx) == (5, 12)
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("script", [
+    "x = 2\npro i = 0 ad 3:\n    scribe(-X + V * 2 + x * (1 + 1))",
+    "scribe(f\"{1 + 1} {Verus et Falsus} {\"ab\" * 2}\")",
+    "scribe(2 ^ 0.5)\nscribe(7 % 3 == 1)",
+    "x = 1\nx + (1 / 0)",
+    "scribe((1 + 2) + \"a\")",
+    "attolle TypeError(\"a\" + \"b\")",
+    "opus f(a=1 + 1):\n    redi a * (2 + 3)\nscribe(f())",
+])
+def test_folder_same_results(backend, script, capsys):
+    # Folding only changes how fast a program runs, not what it prints or where its errors are
+    results = []
+    for optimize in [0, 1]:
+        _, error = Runtime(cache=False, optimize=optimize).run_script("<stdin>", script, backend)
+        results.append((capsys.readouterr().out, error and error.as_string()))
+
+    assert results[0] == results[1]
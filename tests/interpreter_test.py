@@ -9,6 +9,7 @@ from Celeratas.interpreter.SymbolTable import SymbolTable
 from Celeratas.interpreter.values import (Bool, Dict, List, Number, Numeral,
                                           String)
 from Celeratas.lexer.Lexer import Lexer
+from Celeratas.parser.nodes import NumberNode, PassNode
 from Celeratas.parser.Parser import Parser
 
 #######################################
@@ -76,6 +77,11 @@ def test_interpreter_dicts(test_input, expected):
     ("a = [1];a[0]", Number(1)),
     ("a = [[1]];a[0][0", Number(1)),
     ("a = {1:1};a[1]", Number(1)),
+    # Equal numbers, numerals and bools are the same key
+    ("a = {1:1};a[1.0]", Number(1)),
+    ("a = {1:1};a[I]", Number(1)),
+    ("a = {1:1};a[Verus]", Number(1)),
+    ("a = {\"1\":1, 1:2};a[\"1\"]", Number(1)),
 ])
 def test_interpreter_var_assign(test_input, expected):
     res = interpreter_test_base(test_input)[1]
@@ -89,3 +95,26 @@ def test_interpreter_var_assign(test_input, expected):
 
 
 test_interpreter_var_assign("a = 5;a", Number(5))
+
+
+def test_interpreter_dispatch_table():
+    # Every node type the parser can produce should be dispatched without a name lookup
+    assert Interpreter.dispatch_table[NumberNode] is Interpreter.visit_NumberNode
+    assert Interpreter.dispatch_table[PassNode] is Interpreter.visit_PassNode
+
+
+def test_interpreter_dispatch_table_extension():
+    class DoubleNode(NumberNode):
+        pass
+
+    class DoublingInterpreter(Interpreter):
+        def visit_DoubleNode(self, node, context):
+            return self.visit_NumberNode(NumberNode(node.value * 2, node.pos_start, node.pos_end), context)
+
+    context = Context('<program>')
+    context.symbol_table = SymbolTable()
+
+    assert DoublingInterpreter(0).visit(DoubleNode(2, None, None), context).value.value == 4
+    assert DoubleNode in DoublingInterpreter.dispatch_table
+    # Subclasses must not leak new node types into the base table
+    assert DoubleNode not in Interpreter.dispatch_table
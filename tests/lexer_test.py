@@ -5,7 +5,9 @@
 import Celeratas.helper.tokens as toks
 import pytest
 from Celeratas.lexer.Lexer import Lexer
+from Celeratas.lexer.Scanner import Scanner
 from Celeratas.lexer.Token import Token
+from Celeratas.shell import LEXERS
 
 #######################################
 # TESTS
@@ -67,8 +69,9 @@ from Celeratas.lexer.Token import Token
     (",", [toks.TT_COMMA], False),
     ("=>", [toks.TT_ARROW], False)
 ])
-def test_lexer(test_input, expected, should_fail):
-    lexer = Lexer("<std_in>", test_input)
+@pytest.mark.parametrize("lexer_name", LEXERS)
+def test_lexer(lexer_name, test_input, expected, should_fail):
+    lexer = LEXERS[lexer_name]("<std_in>", test_input)
     tokens, error = lexer.make_tokens()
 
     if should_fail:
@@ -91,3 +94,67 @@ def test_lexer(test_input, expected, should_fail):
 
         elif token.value:
             assert token.value == expected[1]
+
+
+@pytest.mark.parametrize("test_input,expected", [
+    ("x = 1", [(0, 0), (0, 2), (0, 4), (0, 5)]),
+    ("x\nyy = 22", [(0, 0), (0, 1), (1, 0), (1, 3), (1, 5), (1, 7)]),
+    ("\n\n\tx", [(0, 0), (1, 0), (2, 1), (2, 1), (2, 2)]),
+])
+@pytest.mark.parametrize("lexer_name", LEXERS)
+def test_lexer_positions(lexer_name, test_input, expected):
+    # Tokens only keep offsets, the line and column of each start come from the line index of the file
+    tokens, error = LEXERS[lexer_name]("<std_in>", test_input).make_tokens()
+    assert not error
+    assert [(token.pos_start.ln, token.pos_start.col) for token in tokens] == expected
+    assert all(token.pos_start.fn == "<std_in>" and token.pos_start.ftxt == test_input for token in tokens)
+
+
+def token_stream(tokens):
+    return [(token.type, [token_stream(c) if isinstance(c, list) else c for c in token.value] if token.type == toks.TT_STRING else token.value,
+             token.pos_start.idx, token.pos_end.idx) for token in tokens]
+
+
+@pytest.mark.parametrize("test_input", [
+    "x = 1 + 2.5 * IV\nsi x >= 3: y = \"big\" alioquin: y = [1, 2][0]",
+    "opus f(a, b=2):\n    redi a % b\n\tx",
+    "2*3/4%5^6",
+    "x *= 2; x /= 2; x %= 2; x -= 1; x += 1",
+    "Verus et non Falsus aut I_x",
+    "X.Y MMXXIII 1.2.3 1.",
+    "f\"a{x + 1}b{}c\" 'd\\ne\\'",
+    "f \"{f\"{1}\"}\"",
+    "a != b == c => d <= e >= f < g > h",
+    "x = 1 # comment\ny # last",
+    "\n\n    \tx",
+    # Errors
+    "  x",
+    "\tx\n    y",
+    "~",
+    "!x",
+    "IIII",
+    "\"abc",
+    "\"a\nb\"",
+    "f\"{1",
+    "f\"{",
+    "f\"{\"a\"}\"",
+    "f\"{~}\"",
+])
+def test_scanner_matches_lexer(test_input):
+    # The Lexer is the reference, the Scanner has to give the same tokens at the same offsets and the same errors
+    expected_tokens, expected_error = Lexer("<std_in>", test_input).make_tokens()
+    tokens, error = Scanner("<std_in>", test_input).make_tokens()
+
+    assert token_stream(tokens) == token_stream(expected_tokens)
+    if expected_error:
+        assert (type(error), error.details, error.pos_start.idx, error.pos_end.idx) == \
+            (type(expected_error), expected_error.details, expected_error.pos_start.idx, expected_error.pos_end.idx)
+    else:
+        assert error is None
+
+
+def test_lexer_keeps_operands():
+    # Multiplication, division and modulo used to skip the character after them
+    tokens, error = Lexer("<std_in>", "2*3").make_tokens()
+    assert not error
+    assert [token.type for token in tokens] == [toks.TT_INT, toks.TT_MUL, toks.TT_INT, toks.TT_EOF]
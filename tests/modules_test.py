@@ -0,0 +1,99 @@
+#######################################
+# IMPORTS
+#######################################
+
+import pytest
+from Celeratas.Runtime import BACKENDS, Runtime
+
+#######################################
+# TESTS
+#######################################
+
+LIB = """scribe("loading lib")
+factor = 3
+opus triple(x):
+    redi scale(x)
+opus scale(x):
+    redi x * factor
+opus apply(f, x):
+    redi f(x)
+"""
+
+
+@pytest.fixture
+def scripts(tmp_path, monkeypatch):
+    # Writes the scripts into an empty folder
+    monkeypatch.chdir(tmp_path)
+
+    def write(**files):
+        for name, text in files.items():
+            (tmp_path / f"{name}.cel").write_text(text)
+    return write
+
+
+@pytest.fixture
+def runtime():
+    # Every test starts without modules
+    return Runtime()
+
+
+def run(runtime, backend, script):
+    _, error = runtime.run_script("<stdin>", script, backend)
+    return error and error.as_string()
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_import_runs_once(backend, scripts, runtime, capsys):
+    scripts(lib=LIB)
+
+    assert run(runtime, backend, "pro i = 0 ad 3:\n    m = importa(\"lib.cel\")\n    scribe(m.triple(i))\nn = importa(\"./lib.cel\")\nscribe(n.factor)") is None
+    assert capsys.readouterr().out == "loading lib\n0\n3\n6\n3\n"
+    assert list(runtime.modules.values())[0].name == "lib"
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("script, expected", [
+    ("m = importa(\"lib.cel\")\nscribe(m[\"factor\"])\nscribe(m)", "3\n<module lib>\n"),
+    # The functions of the module find its globals, not the ones of the caller with the same name
+    ("factor = 100\nm = importa(\"lib.cel\")\nscribe(m.triple(2))\nscribe(factor)", "6\n100\n"),
+    # A function of the program that the module calls back still finds the globals of the program
+    ("offset = 10\nopus add(x):\n    redi x + offset\nm = importa(\"lib.cel\")\nscribe(m.apply(add, 1))", "11\n"),
+    # The module doesn't set anything in the program
+    ("m = importa(\"lib.cel\")\nscribe(est_numerus(factor))", None),
+])
+def test_import_namespace(backend, script, expected, scripts, runtime, capsys):
+    scripts(lib=LIB)
+
+    error = run(runtime, backend, script)
+    output = capsys.readouterr().out.replace("loading lib\n", "")
+    if expected is None:
+        assert "'factor' is not defined" in error
+    else:
+        assert error is None
+        assert output == expected
+
+
+def test_import_cycle(scripts, runtime):
+    scripts(a="b = importa(\"b.cel\")\n", b="a = importa(\"a.cel\")\n")
+
+    error = run(runtime, "interpreter", "importa(\"a.cel\")")
+    assert "Circular import \"a.cel\" -> \"b.cel\" -> \"a.cel\"" in error
+    assert runtime.modules == {}
+    assert runtime.importing == []
+
+
+def test_import_failed_module_not_kept(scripts, runtime, capsys):
+    scripts(lib="x = 1 / 0\n")
+    assert "Division by zero" in run(runtime, "interpreter", "importa(\"lib.cel\")")
+
+    scripts(lib=LIB)
+    assert run(runtime, "interpreter", "m = importa(\"lib.cel\")\nscribe(m.factor)") is None
+    assert capsys.readouterr().out == "loading lib\n3\n"
+
+
+@pytest.mark.parametrize("script, details", [
+    ("importa(\"missing.cel\")", "Failed to load script \"missing.cel\""),
+    ("importa(1)", "Argument must be string"),
+])
+def test_import_errors(script, details, scripts, runtime):
+    assert details in run(runtime, "interpreter", script)
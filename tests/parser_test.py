@@ -6,7 +6,11 @@ import Celeratas.helper.tokens as toks
 import pytest
 from Celeratas.lexer.Lexer import Lexer
 from Celeratas.lexer.Position import Position
+from Celeratas.lexer.Scanner import Scanner
+from Celeratas.lexer.Source import Source
 from Celeratas.lexer.Token import Token
+from Celeratas.lexer.TokenStream import TokenStream
+from Celeratas.parser.analysis import child_nodes
 from Celeratas.parser.nodes import (BinOpNode, BreakNode, CallNode,
                                     ContinueNode, DictNode, ForNode,
                                     FuncDefNode, IfNode, ListNode, NumberNode,
@@ -18,7 +22,7 @@ from Celeratas.parser.Parser import Parser
 #######################################
 # TESTS
 #######################################
-basepos = Position(0, 0, 0, "<stdin>", "1")
+basepos = Position(0, Source("<stdin>", "1"))
 # Use basepos because error location does not matter
 
 # NOTE Didn't use zip bc it skips over loops if the result does not have the same number of elements as expected - Therefore, I used enumerate instead
@@ -91,6 +95,72 @@ def test_parser_bin_op(test_input, expected):
     assert res.right_node.value == expected.right_node.value
 
 
+def bracketed(node):
+    # Writes an expression out with every operation in brackets
+    if isinstance(node, BinOpNode):
+        return f"({bracketed(node.left_node)} {node.op_tok.value or node.op_tok.type} {bracketed(node.right_node)})"
+    if isinstance(node, UnaryOpNode):
+        return f"({node.op_tok.value or node.op_tok.type} {bracketed(node.node)})"
+    if isinstance(node, VarAccessNode):
+        return node.var_name_to_get
+    return str(node.value)
+
+
+@pytest.mark.parametrize("test_input,expected", [
+    ("1 + 2 * 3", "(1 PLUS (2 MUL 3))"),
+    ("1 - 2 - 3", "((1 MINUS 2) MINUS 3)"),
+    ("1 / 2 % 3 * 4", "(((1 DIV 2) MOD 3) MUL 4)"),
+    ("2 ^ 3 ^ 2", "(2 POW (3 POW 2))"),
+    ("-2 ^ 2", "(MINUS (2 POW 2))"),
+    ("2 ^ -1 * 3", "((2 POW (MINUS 1)) MUL 3)"),
+    ("a < b == c", "((a LT b) EE c)"),
+    ("a aut b et c", "((a aut b) et c)"),
+    ("non a == b et c", "((non (a EE b)) et c)"),
+    ("a et non non b", "(a et (non (non b)))"),
+    ("1 + 2 < 3 * 4 aut non x", "(((1 PLUS 2) LT (3 MUL 4)) aut (non x))"),
+    ("(1 + 2) * -(3 - a)", "((1 PLUS 2) MUL (MINUS (3 MINUS a)))"),
+])
+def test_parser_precedence(test_input, expected):
+    assert bracketed(parser_test_base(test_input)) == expected
+
+
+@pytest.mark.parametrize("test_input,error_idx", [
+    ("1 +", 3),
+    ("1 + * 2", 4),
+    ("non", 3),
+    ("x et", 4),
+    ("1 == et 2", 5),
+    ("2 ^", 3),
+])
+def test_parser_precedence_errors(test_input, error_idx):
+    ast = Parser(Lexer("<std_in>", test_input).make_tokens()[0]).parse()
+    assert ast.error.details == "Expected expression"
+    assert ast.error.pos_start.idx == error_idx
+
+
+@pytest.mark.parametrize("test_input", [
+    "(" * 150 + "1" + ")" * 150,
+    "f(" * 150 + "1" + ")" * 150,
+    "2 ^ " * 300 + "2",
+])
+def test_parser_deep_nesting(test_input):
+    # Each level of nesting only takes a few frames, so deep expressions parse under the default recursion limit
+    assert parser_test_base(test_input)
+
+
+def test_parser_long_expression():
+    # Operators of one level are parsed in a loop, not a frame per operator - Only the expression is parsed, the
+    # resolver walks the tree a frame per node
+    res = Parser(Lexer("<std_in>", " + ".join(["a * 2"] * 5000)).make_tokens()[0]).bin_op()
+    assert not res.error
+    node = res.node
+    length = 1
+    while isinstance(node, BinOpNode) and node.op_tok.type == toks.TT_PLUS:
+        node = node.left_node
+        length += 1
+    assert length == 5000
+
+
 @pytest.mark.parametrize("test_input,expected,should_fail", [
     ("[1, 2, 3]", ListNode([NumberNode(1, basepos, basepos), NumberNode(
         2, basepos, basepos), NumberNode(3, basepos, basepos)], basepos, basepos), False),
@@ -108,7 +178,7 @@ def test_parser_list(test_input, expected, should_fail):
 @pytest.mark.parametrize("test_input,expected,should_fail", [
     ("{\"key\":\"value\"}", DictNode({StringNode(["key"], basepos, basepos):StringNode(["value"], basepos, basepos)}, basepos, basepos), False),
     ("{\"key\":\"value\", \"key\":\"value\"}", [], True),
-
+    ("{\"a\":1, \"b\":2, 3:3, \"a\":4}", [], True),
 ])
 def test_parser_dict(test_input, expected, should_fail):
     res = parser_test_base(test_input, should_fail)
@@ -345,3 +415,154 @@ def test_parser_misc(test_input, expected, should_fail):
             assert isinstance(res, ContinueNode)
         if isinstance(expected, BreakNode):
             assert isinstance(res, BreakNode)
+
+
+def test_parser_compact_nodes():
+    # Tokens, positions and nodes use slots, none of them should have a __dict__
+    tokens, error = Lexer("<std_in>", "opus f(a, b=2):;    redi [a, b][0] + {1: \"x\"}[1];f(1)").make_tokens()
+    assert not error
+    ast = Parser(tokens).parse()
+    assert not ast.error
+
+    def check(node):
+        assert not hasattr(node, "__dict__"), type(node).__name__
+        assert not hasattr(node.pos_start, "__dict__")
+        for child in child_nodes(node):
+            check(child)
+
+    check(ast.node)
+    assert not any(hasattr(token, "__dict__") for token in tokens)
+
+
+def node_shape(node):
+    return (type(node).__name__, node.pos_start.idx, node.pos_end.idx, [node_shape(child) for child in child_nodes(node)])
+
+
+def parse_result(ast):
+    if ast.error:
+        return (type(ast.error), ast.error.details, ast.error.pos_start.idx)
+    return node_shape(ast.node)
+
+
+@pytest.mark.parametrize("test_input", [
+    "x = 1 + 2\nsi x > 2: y = [1, 2][0] alioquin: y = f\"{x}\"\nopus f(a, b=2):\n    redi a + b\nf(x)",
+    "pro i = 0 ad 3:\n    si i == 1:\n        continua\n    scribe(i)",
+    "(x) => x + 1\ntempta:\n    x = 1 / 0\npraeter ZeroDivisionError:\n    x = 0",
+    # Errors from the parser
+    "x = ",
+    "x = 1 2",
+    "si x:\n  y",
+    # Errors from the lexer, they come first even when the parser has already failed
+    "x = ~",
+    "x = \n~",
+    "x = 1 2\ny = \"abc",
+])
+def test_parser_token_stream(test_input):
+    # Parsing while the scanner makes the tokens gives the same tree or error as parsing all of them at once
+    tokens, error = Scanner("<std_in>", test_input).make_tokens()
+    expected = error and (type(error), error.details, error.pos_start.idx)
+    if not error:
+        expected = parse_result(Parser(tokens).parse())
+
+    assert parse_result(Parser(TokenStream(Scanner("<std_in>", test_input))).parse()) == expected
+
+
+def test_parser_token_stream_window():
+    # Only the tokens of the statement that is being parsed are kept, however long the script is
+    class RecordingStream(TokenStream):
+        def fill(self):
+            super().fill()
+            self.longest = max(getattr(self, "longest", 0), len(self.buffer))
+
+    stream = RecordingStream(Scanner("<std_in>", "x = y[0] + z * 2 - f(y, 3)\n" * 5000))
+    ast = Parser(stream).parse()
+    assert not ast.error
+    assert len(ast.node.element_nodes) == 5000
+    assert stream.longest < 100
+
+
+@pytest.mark.parametrize("test_input", [
+    "x = 1\n\nsi x: y = 2\nopus f(a):\n    redi a\nf(1) 2",
+    "\n\n",
+    "x = 1\ny = ",
+    "x = 1\n    y = 2",
+    "x = 1\ny = 2 ~",
+    "x = 1\nredi 2",
+    "x = 1\n)",
+])
+def test_parser_iter_statements(test_input):
+    # One statement at a time gives the statements of the whole program, or the error parsing it stops at
+    expected = parse_result(Parser(TokenStream(Scanner("<std_in>", test_input))).parse())
+
+    statements = []
+    for ast in Parser(TokenStream(Scanner("<std_in>", test_input))).iter_statements():
+        if ast.error:
+            assert parse_result(ast) == expected
+            return
+        assert len(ast.node.element_nodes) == 1
+        statements.append(node_shape(ast.node.element_nodes[0]))
+
+    assert statements == expected[3]
+
+
+@pytest.mark.parametrize("test_input", [
+    "x = 1\nx += 2\na, b[0] = x, [1]\nb[0][0] = a + b[0][0]",
+    "f = (x, y=3) => x * y\ng = () => 1\nh = (x) => x\n(x)\nf(2, y=g())",
+    "l = [x, y, \"0\"]\nm = map((x) => x, l)\n{\"x\": x}",
+    "opus f(a, b=2):\n    si a:\n        redi\n    redi a + b\nf(1)",
+    "si x: y = 2 alioquin: y = 3\npro i = 0 ad 3:\n    si i:\n        continua\n    alioquinsi j: confringe\n    scribe(i)",
+    "tempta:\n    x = 1 / 0\npraeter ZeroDivisionError tam e:\n    x = non e et Verus",
+])
+def test_parser_visits_tokens_once(test_input):
+    # The parser looks ahead instead of going back, so it moves onto every token once
+    visits = {}
+
+    class CountingParser(Parser):
+        def advance(self):
+            super().advance()
+            visits[self.tok_idx] = visits.get(self.tok_idx, 0) + 1
+            return self.current_tok
+
+    tokens, error = Lexer("<std_in>", test_input).make_tokens()
+    assert not error
+    ast = CountingParser(tokens).parse()
+    assert not ast.error
+    assert visits == {idx: 1 for idx in range(len(tokens))}
+
+
+@pytest.mark.parametrize("test_input,details,error_idx", [
+    # A statement that fails after the first one gives its own error
+    ("x = 1\ny = (2 +", "Expected expression", 14),
+    ("x = 1\nredi 2", "Return can only be used in functions", 6),
+    ("x = 1\n)", "Token cannot appear after previous tokens", 6),
+    # What follows a name or a bracket decides what they start
+    ("a, b", "Expected '='", 4),
+    ("(a, b)", "Expected '=>'", 6),
+    ("(a = 1)", "Expected '=>'", 7),
+])
+def test_parser_lookahead_errors(test_input, details, error_idx):
+    ast = Parser(Lexer("<std_in>", test_input).make_tokens()[0]).parse()
+    assert ast.error.details == details
+    assert ast.error.pos_start.idx == error_idx
+
+
+def outline(node):
+    # The names of the statements of each block
+    if isinstance(node, ListNode):
+        return [outline(element) for element in node.element_nodes]
+    blocks = [outline(child) for child in child_nodes(node) if isinstance(child, ListNode)]
+    return (type(node).__name__, *blocks) if blocks else type(node).__name__
+
+
+@pytest.mark.parametrize("test_input,expected", [
+    ("pro i = 0 ad 3:\n    si i == 1:\n        continua\n    scribe(i)", [("ForNode", [("IfNode", ["ContinueNode"]), "CallNode"])]),
+    ("si a:\n    si b:\n        x\nalioquin:\n    y", [("IfNode", [("IfNode", ["VarAccessNode"])], ["VarAccessNode"])]),
+    ("opus f():\n    tempta:\n        x\n    praeter:\n        y\n    redi 1\nf()", [("FuncDefNode", [("TryNode", ["VarAccessNode"], ["VarAccessNode"]), "ReturnNode"]), "CallNode"]),
+    ("opus f(a):\n    si a == 1:\n        x\n    alioquinsi a == 2:\n        y\n    alioquin:\n        z\n    redi a",
+     [("FuncDefNode", [("IfNode", ["VarAccessNode"], ["VarAccessNode"], ["VarAccessNode"]), "ReturnNode"])]),
+])
+def test_parser_nested_blocks(test_input, expected):
+    # A block ends at a line with fewer tabs, which are left for the block the line belongs to
+    ast = Parser(Lexer("<std_in>", test_input).make_tokens()[0]).parse()
+    assert not ast.error
+    assert outline(ast.node) == expected
@@ -0,0 +1,96 @@
+#######################################
+# IMPORTS
+#######################################
+
+import pytest
+from Celeratas.lexer.Lexer import Lexer
+from Celeratas.parser.analysis import child_nodes
+from Celeratas.parser.nodes import (ForNode, FuncDefNode, IfNode, TryNode,
+                                    WhileNode)
+from Celeratas.parser.Parser import Parser
+from Celeratas.parser.Pruner import Pruner
+from Celeratas.Runtime import BACKENDS, Runtime
+
+#######################################
+# TESTS
+#######################################
+
+
+def prune(script):
+    tokens, error = Lexer("<stdin>", script).make_tokens()
+    assert not error
+
+    ast = Parser(tokens).parse()
+    assert not ast.error
+    return Pruner().prune(ast.node)
+
+
+def find(node, node_type):
+    found = [node] if isinstance(node, node_type) else []
+    for child in child_nodes(node):
+        found += find(child, node_type)
+    return found
+
+
+def results_kept(node):
+    # For every loop, if and try, in order, whether it still gives its value
+    kept = []
+    for found in find(node, (ForNode, WhileNode, IfNode, TryNode)):
+        if isinstance(found, IfNode):
+            kept.append([not should_return_null for _, _, should_return_null in found.cases])
+        else:
+            kept.append(not found.should_return_null)
+    return kept
+
+
+@pytest.mark.parametrize("script, expected", [
+    # The statements of the program give their values
+    ("pro i = 0 ad 3: i", [True]),
+    ("si Verus: 1 alioquin: 2", [[True]]),
+    ("x = [pro i = 0 ad 3: i]", [True]),
+    # A loop in a block doesn't, and neither does a loop in its body
+    ("pro i = 0 ad 3:\n    pro j = 0 ad 3: j", [False, False]),
+    ("pro i = 0 ad 3:\n    pro j = 0 ad 3: pro k = 0 ad 3: k", [False, False, False]),
+    ("i = 0\ndum i < 3:\n    i += 1\n    si i > 1: i", [False, [False]]),
+    ("opus f():\n    pro i = 0 ad 3: i\n    tempta: 1 / 0", [False, False]),
+    # Unless something uses it
+    ("opus f():\n    x = [pro i = 0 ad 3: i]\n    redi pro j = 0 ad 3: j", [True, True]),
+    ("f = () => pro i = 0 ad 3: i", [True]),
+    ("pro i = 0 ad 3:\n    x = tempta: i", [False, True]),
+    ("opus f(a=pro i = 0 ad 3: i):\n    redi a", [True]),
+    ("pro i = 0 ad 3:\n    scribe(pro j = 0 ad 3: j)", [False, True]),
+])
+def test_pruner_results(script, expected):
+    assert results_kept(prune(script)) == expected
+
+
+@pytest.mark.parametrize("script, expected", [
+    ("opus f():\n    redi 1\n    scribe(2)\n    scribe(3)", 1),
+    ("pro i = 0 ad 3:\n    scribe(i)\n    continua\n    scribe(i)", 2),
+    ("pro i = 0 ad 3:\n    si i > 1:\n        confringe\n        scribe(i)\n    scribe(i)", 2),
+])
+def test_pruner_unreachable(script, expected):
+    # The statements after a jump are dropped from the block it is in
+    node = prune(script).element_nodes[0]
+    body = node.body_node if isinstance(node, (ForNode, FuncDefNode)) else node
+    assert len(body.element_nodes) == expected
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("script", [
+    "x = 0\npro i = 0 ad 5:\n    pro j = 0 ad 5: x += j\nx",
+    "opus f():\n    pro i = 0 ad 3: scribe(i)\n    si Verus: 5\n    redi 1\n    scribe(\"never\")\nf()",
+    "opus f(n):\n    i = 0\n    dum i < n:\n        i += 1\n        si i == 2: continua\n        si i == 4: confringe\n        scribe(i)\n    redi i\nf(6)",
+    "l = [pro i = 0 ad 3: i * 2]\nsi longitudo(l) > 2: l alioquin: 0",
+    "pro i = 0 ad 3:\n    tempta:\n        scribe(1 / i)\n    praeter:\n        scribe(\"zero\")\n    x = tempta: 1 / (i + 1)\n    tempta: 2 / (i + 1)\n    scribe(x)",
+    "g = (n) => pro i = 0 ad n: i\ng(3)",
+    "pro i = 0 ad 3:\n    y = [pro j = 0 ad i: j]\n    scribe(y)",
+])
+def test_pruner_same_results(backend, script, capsys):
+    # Pruning only changes how much memory a program takes, not what it prints or gives
+    results = []
+    for optimize in [0, 1]:
+        result, error = Runtime(cache=False, optimize=optimize).run_script("<stdin>", script, backend)
+        results.append((capsys.readouterr().out, repr(result), error and error.as_string()))
+
+    assert results[0] == results[1]
@@ -0,0 +1,91 @@
+#######################################
+# IMPORTS
+#######################################
+
+import pytest
+from Celeratas.interpreter.Context import Context
+from Celeratas.interpreter.Interpreter import Interpreter
+from Celeratas.interpreter.SlotSymbolTable import SlotSymbolTable
+from Celeratas.interpreter.SymbolTable import SymbolTable
+from Celeratas.lexer.Lexer import Lexer
+from Celeratas.parser.analysis import child_nodes
+from Celeratas.parser.nodes import FuncDefNode, VarAccessNode
+from Celeratas.parser.Parser import Parser
+from Celeratas.parser.Resolver import ENCLOSING, GLOBAL, LOCAL
+from Celeratas.shell import global_symbol_table
+
+#######################################
+# TESTS
+#######################################
+
+
+def parse(script):
+    tokens, error = Lexer("<stdin>", script).make_tokens()
+    assert not error
+
+    ast = Parser(tokens).parse()
+    assert not ast.error
+    return ast.node
+
+
+def find(node, node_type):
+    found = [node] if isinstance(node, node_type) else []
+    for child in child_nodes(node):
+        found += find(child, node_type)
+    return found
+
+
+@pytest.mark.parametrize("script,expected", [
+    ("x = 1\nx", [("x", GLOBAL, None)]),
+    ("opus f(a):\n    redi a", [("a", LOCAL, 0)]),
+    ("opus f(a):\n    b = a\n    redi b", [("a", LOCAL, 0), ("b", LOCAL, 1)]),
+    ("opus f():\n    redi x", [("x", GLOBAL, None)]),
+    ("opus f():\n    redi x\nopus g():\n    x = 1\n    redi f()", [("x", ENCLOSING, None), ("f", GLOBAL, None)]),
+    ("opus f(n):\n    g = (m) => m * n\n    redi g(2)", [("m", LOCAL, 0), ("n", ENCLOSING, None), ("g", LOCAL, 1)]),
+    ("opus f():\n    pro i = 0 ad 3: i", [("i", LOCAL, 0)]),
+    ("opus f(a=x):\n    redi a", [("x", GLOBAL, None), ("a", LOCAL, 0)]),
+])
+def test_resolver_scopes(script, expected):
+    accesses = find(parse(script), VarAccessNode)
+    assert [(node.var_name_to_get, node.scope, node.slot) for node in accesses] == expected
+
+
+@pytest.mark.parametrize("script,expected", [
+    ("opus f(a, b=2):\n    c = a\n    redi c", {"a": 0, "b": 1, "c": 2}),
+    ("opus f(a):\n    a = 1\n    a += 2\n    redi a", {"a": 0}),
+    ("opus f(n):\n    pro i = 0 ad n: t = i", {"n": 0, "i": 1, "t": 2}),
+    ("opus f():\n    g = (y) => y\n    redi g(1)", {"g": 0}),
+])
+def test_resolver_slot_names(script, expected):
+    assert find(parse(script), FuncDefNode)[0].slot_names == expected
+
+
+def test_resolver_function_frames():
+    # A call keeps its locals in a list of slots, anything else still comes from the caller
+    node = parse("y = 5\nopus f(a):\n    b = a + y\n    redi b\nf(1)")
+
+    context = Context('<program>')
+    context.symbol_table = SymbolTable()
+    context.symbol_table.symbols.update(global_symbol_table.symbols)
+    result = Interpreter(0).visit(node, context)
+    assert result.error is None
+    assert repr(result.value) == "[None, <function f>, 6]"
+
+    exec_ctx = context.symbol_table.get("f").generate_new_context()
+    assert isinstance(exec_ctx.symbol_table, SlotSymbolTable)
+    assert exec_ctx.symbol_table.slots == [None, None]
+    assert exec_ctx.symbol_table.get("y").value == 5
+    assert exec_ctx.symbol_table.global_table is context.symbol_table
+
+
+def test_resolver_separate_trees():
+    # The global in f is a local of g, which is parsed later, so it has to come from the caller and not from the program
+    context = Context('<program>')
+    context.symbol_table = SymbolTable()
+    context.symbol_table.symbols.update(global_symbol_table.symbols)
+
+    Interpreter(0).visit(parse("opus f():\n    redi later_local"), context)
+    result = Interpreter(0).visit(parse("opus g():\n    later_local = 2\n    redi f()\nlater_local = 1\ng()"), context)
+
+    assert result.error is None
+    assert repr(result.value) == "[<function g>, None, 2]"
@@ -0,0 +1,71 @@
+#######################################
+# IMPORTS
+#######################################
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from Celeratas.Runtime import BACKENDS, BUILTINS, Runtime
+from Celeratas.shell import default_runtime, global_symbol_table
+
+#######################################
+# TESTS
+#######################################
+
+
+def last_value(runtime, script, backend="interpreter"):
+    result, error = runtime.run_script("<stdin>", script, backend)
+    assert error is None, error.as_string()
+    return result.elements[-1].value
+
+
+def test_runtime_globals_isolated():
+    first, second = Runtime(), Runtime()
+
+    assert last_value(first, "x = 1\nx") == 1
+    assert last_value(second, "x = 2\nx") == 2
+    assert last_value(first, "x") == 1
+
+    # Each starts with the builtins and nothing else
+    assert "x" not in global_symbol_table.symbols
+    assert set(Runtime().global_symbol_table.symbols) == set(BUILTINS)
+
+
+def test_runtime_default():
+    # The functions of the shell run in the default runtime
+    assert global_symbol_table is default_runtime.global_symbol_table
+
+
+def test_runtime_curre(tmp_path, monkeypatch):
+    # A script run with curre() sets its globals in the runtime that ran it
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "lib.cel").write_text("y = 5\n")
+    runtime = Runtime(cache=False)
+
+    assert last_value(runtime, "curre(\"lib.cel\")\ny") == 5
+    assert "y" not in global_symbol_table.symbols
+
+
+def test_runtime_modules_isolated(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "lib.cel").write_text("counter = [0]\n")
+    first, second = Runtime(cache=False), Runtime(cache=False)
+
+    assert last_value(first, "m = importa(\"lib.cel\")\nextende(m.counter, [1])\nlongitudo(m.counter)") == 2
+    assert last_value(first, "m = importa(\"lib.cel\")\nlongitudo(m.counter)") == 2
+    # The other runtime runs the module again and gets a list of its own
+    assert last_value(second, "m = importa(\"lib.cel\")\nlongitudo(m.counter)") == 1
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_runtime_threads(backend):
+    # Programs using the same global names give the results they give alone when their runtimes run them at the same time
+    script = "opus add(x):\n    redi total + x * step\ntotal = 0\npro i = 0 ad 300:\n    total = add(1)\ntotal"
+
+    def run(step):
+        return last_value(Runtime(), f"step = {step}\n" + script, backend)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(run, range(16)))
+
+    assert results == [300 * step for step in range(16)]
@@ -0,0 +1,67 @@
+#######################################
+# IMPORTS
+#######################################
+
+import ast
+
+import pytest
+from Celeratas.interpreter.Context import Context
+from Celeratas.interpreter.SymbolTable import SymbolTable
+from Celeratas.lexer.Lexer import Lexer
+from Celeratas.parser.Parser import Parser
+from Celeratas.shell import global_symbol_table, run_script
+from Celeratas.transpiler.Transpiler import Transpiler
+
+#######################################
+# TESTS
+#######################################
+
+# Results are compared to the interpreter in backends_test.py, these tests cover the generated python
+
+
+def parse(test_input, fn="<stdin>"):
+    tokens, _ = Lexer(fn, test_input).make_tokens()
+    ast_node = Parser(tokens).parse()
+    assert ast_node.error is None
+    return ast_node.node
+
+
+def test_transpiler_module():
+    module = Transpiler().to_module(parse("opus f(n):\n    redi n * 2\nf(3)"))
+
+    function_names = [statement.name for statement in module.body if isinstance(statement, ast.FunctionDef)]
+    assert function_names[-1] == "_program"
+    assert any(name.endswith("_f") for name in function_names)
+    # The generated module is plain python, so it can be turned back into source
+    assert "def _program(context, recursion_depth):" in ast.unparse(module)
+
+
+def test_transpiler_line_numbers():
+    module = Transpiler("script.clr").to_module(parse("x = 1\n\nopus f():\n    redi 1 / 0\nf()", "script.clr"))
+    function = module.body[0]
+
+    assert function.lineno == 3
+    assert [statement.lineno for statement in function.body][1:] == [4, 4, 4]
+    assert compile(module, "script.clr", "exec").co_filename == "script.clr"
+
+
+@pytest.mark.parametrize("test_input", [
+    "opus f(n):\n    redi n / 0\nopus g():\n    redi f(3)\ng()",
+    "opus f():\n    redi y\nx = [f()]",
+    "pro i = 0 ad 3:\n    si i == 2: scribe(1 + \"a\")",
+])
+def test_transpiler_traceback(test_input):
+    _, expected = run_script("script.clr", test_input, "interpreter")
+    _, error = run_script("script.clr", test_input, "python")
+
+    assert error.as_string() == expected.as_string()
+
+
+def test_transpiler_rerun():
+    # The same program can be run in more than one context
+    program = Transpiler().transpile(parse("x = 2\nx * 3"))
+
+    for _ in range(2):
+        context = Context('<program>')
+        context.symbol_table = SymbolTable(global_symbol_table)
+        assert program(context, 0).elements[-1].value == 6
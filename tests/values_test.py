@@ -0,0 +1,94 @@
+#######################################
+# IMPORTS
+#######################################
+
+import pytest
+from Celeratas.interpreter.Context import Context
+from Celeratas.interpreter.SymbolTable import SymbolTable
+from Celeratas.interpreter.values import (Bool, Dict, Function, List, Number,
+                                          Numeral, String)
+from Celeratas.interpreter.values.functions.BuiltInFunction import \
+    BuiltInFunction
+from Celeratas.lexer.Lexer import Lexer
+from Celeratas.parser.Parser import Parser
+from Celeratas.shell import BACKENDS, global_symbol_table
+
+#######################################
+# TESTS
+#######################################
+
+
+def run(backend, script):
+    tokens, error = Lexer("<stdin>", script).make_tokens()
+    assert not error
+
+    ast = Parser(tokens).parse()
+    assert not ast.error
+
+    context = Context('<program>')
+    context.symbol_table = SymbolTable()
+    context.symbol_table.symbols.update(global_symbol_table.symbols)
+    return BACKENDS[backend](ast.node, context)
+
+
+@pytest.mark.parametrize("value", [
+    Number(1.5),
+    Numeral(4),
+    String("a"),
+    Bool(True),
+    List([]),
+    Dict({}),
+    Function("f", None, [], False),
+    BuiltInFunction("print"),
+])
+def test_compact_values(value):
+    # Values use slots, so they don't carry a __dict__
+    assert not hasattr(value, "__dict__")
+
+
+@pytest.mark.parametrize("value,is_cached", [
+    (0, True),
+    (-5, True),
+    (256, True),
+    (-6, False),
+    (257, False),
+    (2.0, False),
+])
+def test_number_cache(value, is_cached):
+    assert (Number.make(value) is Number.make(value)) == is_cached
+    assert repr(Number.make(value)) == repr(value)
+
+
+def test_number_cache_range():
+    start, end = Number.cache_start, Number.cache_end
+    try:
+        Number.set_cache_range(0, 2000)
+        assert Number.make(1000) is Number.make(1000)
+        assert Number.make(-1) is not Number.make(-1)
+    finally:
+        Number.set_cache_range(start, end)
+
+
+def test_bool_make():
+    assert Bool.make(True) is Bool.true
+    assert Bool.make(False) is Bool.false
+    assert Bool.make(1 < 2) is Bool.true
+    # Only Verus and Falsus are shared, anything else keeps its value
+    assert Bool.make(3).value == 3
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_cached_loop_numbers(backend):
+    result = run(backend, "pro i = 0 ad 3: i")
+    assert result.error is None
+    assert all(element is Number.make(idx) for idx, element in enumerate(result.value.elements[0].elements))
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_cached_value_errors(backend):
+    # The cached 1 is shared with every other 1, the error still points at where it was used
+    result = run(backend, "opus f(n):\n    redi n + \"a\"\nf(1)")
+    error = result.error
+    assert error.error_name == "TypeError"
+    assert (error.pos_start.idx, error.pos_end.idx) == (20, 27)
+    assert error.context.display_name == "f"